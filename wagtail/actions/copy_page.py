@@ -1,11 +1,20 @@
 import logging
 import uuid
+from collections import defaultdict
 
+from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
-from modelcluster.models import get_all_child_relations
+from django.db import connections, models, transaction
+from django.db.models.signals import post_save, pre_save
+from django.utils import timezone
+from modelcluster.models import (
+    ClusterableModel,
+    get_all_child_m2m_relations,
+    get_all_child_relations,
+)
 
 from wagtail.log_actions import log
-from wagtail.models.copying import _copy, _copy_m2m_relations
+from wagtail.models.copying import _bulk_insert, _copy, _copy_m2m_relations
 from wagtail.models.i18n import TranslatableMixin
 from wagtail.signals import page_published
 
@@ -107,15 +116,7 @@ class CopyPageAction:
                         "You do not have permission to publish a page at the destination."
                     )
 
-    def _copy_page(
-        self, page, to=None, update_attrs=None, exclude_fields=None, _mpnode_attrs=None
-    ):
-        specific_page = page.specific
-        exclude_fields = (
-            specific_page.default_exclude_fields_in_copy
-            + specific_page.exclude_fields_in_copy
-            + (exclude_fields or [])
-        )
+    def _get_base_update_attrs(self, update_attrs=None):
         if self.keep_live:
             base_update_attrs = {
                 "alias_of": None,
@@ -140,10 +141,10 @@ class CopyPageAction:
         if update_attrs:
             base_update_attrs.update(update_attrs)
 
-        page_copy, child_object_map = _copy(
-            specific_page, exclude_fields=exclude_fields, update_attrs=base_update_attrs
-        )
-        # Save copied child objects and run process_child_object on them if we need to
+        return base_update_attrs
+
+    def _process_child_objects(self, specific_page, page_copy, child_object_map):
+        # Run process_child_object on copied child objects if we need to
         for (child_relation, old_pk), child_object in child_object_map.items():
             if self.process_child_object:
                 self.process_child_object(
@@ -157,6 +158,103 @@ class CopyPageAction:
                     child_object.translation_key
                 )
 
+    def _copy_revision(
+        self,
+        revision,
+        specific_page,
+        page_copy,
+        page_copy_data,
+        child_object_map,
+        exclude_fields,
+    ):
+        """
+        Update the given revision of ``specific_page`` in place to become an unsaved
+        revision of ``page_copy``.
+        """
+        revision.pk = None
+        revision.approved_go_live_at = None
+        revision.object_id = page_copy.id
+
+        # Update ID fields in content
+        revision_content = revision.content
+        revision_content["pk"] = page_copy.pk
+
+        for child_relation in get_all_child_relations(specific_page):
+            accessor_name = child_relation.get_accessor_name()
+            try:
+                child_objects = revision_content[accessor_name]
+            except KeyError:
+                # KeyErrors are possible if the revision was created
+                # before this child relation was added to the database
+                continue
+
+            for child_object in child_objects:
+                child_object[child_relation.field.name] = page_copy.pk
+                # Remap primary key to copied versions
+                # If the primary key is not recognised (eg, the child object has been deleted from the database)
+                # set the primary key to None
+                copied_child_object = child_object_map.get(
+                    (child_relation, child_object["pk"])
+                )
+                child_object["pk"] = (
+                    copied_child_object.pk if copied_child_object else None
+                )
+                if self.reset_translation_key and "translation_key" in child_object:
+                    child_object["translation_key"] = self.generate_translation_key(
+                        child_object["translation_key"]
+                    )
+
+        for field_name in exclude_fields:
+            if field_name in revision_content:
+                revision_content[field_name] = page_copy_data.get(field_name)
+
+        revision.content = revision_content
+
+    def _get_log_data(self, page, page_copy, parent, to):
+        return {
+            "page": {
+                "id": page_copy.id,
+                "title": page_copy.get_admin_display_title(),
+                "locale": {
+                    "id": page_copy.locale_id,
+                    "language_code": page_copy.locale.language_code,
+                },
+            },
+            "source": {
+                "id": parent.id,
+                "title": parent.specific_deferred.get_admin_display_title(),
+            }
+            if parent
+            else None,
+            "destination": {
+                "id": to.id,
+                "title": to.specific_deferred.get_admin_display_title(),
+            }
+            if to
+            else None,
+            "keep_live": page_copy.live and self.keep_live,
+            "source_locale": {
+                "id": page.locale_id,
+                "language_code": page.locale.language_code,
+            },
+        }
+
+    def _copy_page(
+        self, page, to=None, update_attrs=None, exclude_fields=None, _mpnode_attrs=None
+    ):
+        specific_page = page.specific
+        exclude_fields = (
+            specific_page.default_exclude_fields_in_copy
+            + specific_page.exclude_fields_in_copy
+            + (exclude_fields or [])
+        )
+        base_update_attrs = self._get_base_update_attrs(update_attrs)
+
+        page_copy, child_object_map = _copy(
+            specific_page, exclude_fields=exclude_fields, update_attrs=base_update_attrs
+        )
+        self._process_child_objects(specific_page, page_copy, child_object_map)
+
         # Save the new page
         if _mpnode_attrs:
             # We've got a tree position already reserved. Perform a quick save
@@ -188,49 +286,14 @@ class CopyPageAction:
 
             for revision in page.revisions.all():
                 use_as_latest_revision = revision.pk == page.latest_revision_id
-                revision.pk = None
-                revision.approved_go_live_at = None
-                revision.object_id = page_copy.id
-
-                # Update ID fields in content
-                revision_content = revision.content
-                revision_content["pk"] = page_copy.pk
-
-                for child_relation in get_all_child_relations(specific_page):
-                    accessor_name = child_relation.get_accessor_name()
-                    try:
-                        child_objects = revision_content[accessor_name]
-                    except KeyError:
-                        # KeyErrors are possible if the revision was created
-                        # before this child relation was added to the database
-                        continue
-
-                    for child_object in child_objects:
-                        child_object[child_relation.field.name] = page_copy.pk
-                        # Remap primary key to copied versions
-                        # If the primary key is not recognised (eg, the child object has been deleted from the database)
-                        # set the primary key to None
-                        copied_child_object = child_object_map.get(
-                            (child_relation, child_object["pk"])
-                        )
-                        child_object["pk"] = (
-                            copied_child_object.pk if copied_child_object else None
-                        )
-                        if (
-                            self.reset_translation_key
-                            and "translation_key" in child_object
-                        ):
-                            child_object["translation_key"] = (
-                                self.generate_translation_key(
-                                    child_object["translation_key"]
-                                )
-                            )
-
-                for field_name in exclude_fields:
-                    if field_name in revision_content:
-                        revision_content[field_name] = page_copy_data.get(field_name)
-
-                revision.content = revision_content
+                self._copy_revision(
+                    revision,
+                    specific_page,
+                    page_copy,
+                    page_copy_data,
+                    child_object_map,
+                    exclude_fields,
+                )
 
                 # Save
                 revision.save()
@@ -281,38 +344,13 @@ class CopyPageAction:
 
         # Log
         if self.log_action:
-            parent = specific_page.get_parent()
             log(
                 instance=page_copy,
                 action=self.log_action,
                 user=self.user,
-                data={
-                    "page": {
-                        "id": page_copy.id,
-                        "title": page_copy.get_admin_display_title(),
-                        "locale": {
-                            "id": page_copy.locale_id,
-                            "language_code": page_copy.locale.language_code,
-                        },
-                    },
-                    "source": {
-                        "id": parent.id,
-                        "title": parent.specific_deferred.get_admin_display_title(),
-                    }
-                    if parent
-                    else None,
-                    "destination": {
-                        "id": to.id,
-                        "title": to.specific_deferred.get_admin_display_title(),
-                    }
-                    if to
-                    else None,
-                    "keep_live": page_copy.live and self.keep_live,
-                    "source_locale": {
-                        "id": page.locale_id,
-                        "language_code": page.locale.language_code,
-                    },
-                },
+                data=self._get_log_data(
+                    page, page_copy, specific_page.get_parent(), to
+                ),
             )
             if page_copy.live and self.keep_live:
                 # Log the publish if the use chose to keep the copied page live
@@ -330,22 +368,27 @@ class CopyPageAction:
         from wagtail.models import Page, PageViewRestriction
 
         if self.recursive:
-            numchild = 0
+            if self.can_bulk_copy(page_copy):
+                with transaction.atomic(using=page_copy._state.db):
+                    self._bulk_copy_descendants(page, page_copy)
 
-            for child_page in page.get_children().specific().iterator():
-                newdepth = _mpnode_attrs[1] + 1
-                child_mpnode_attrs = (
-                    Page._get_path(_mpnode_attrs[0], newdepth, numchild),
-                    newdepth,
-                )
-                numchild += 1
-                self._copy_page(
-                    child_page, to=page_copy, _mpnode_attrs=child_mpnode_attrs
-                )
+            else:
+                numchild = 0
+
+                for child_page in page.get_children().specific().iterator():
+                    newdepth = _mpnode_attrs[1] + 1
+                    child_mpnode_attrs = (
+                        Page._get_path(_mpnode_attrs[0], newdepth, numchild),
+                        newdepth,
+                    )
+                    numchild += 1
+                    self._copy_page(
+                        child_page, to=page_copy, _mpnode_attrs=child_mpnode_attrs
+                    )
 
-            if numchild > 0:
-                page_copy.numchild = numchild
-                page_copy.save(clean=False, update_fields=["numchild"])
+                if numchild > 0:
+                    page_copy.numchild = numchild
+                    page_copy.save(clean=False, update_fields=["numchild"])
 
         # Copy across any view restrictions defined directly on the page,
         # unless the destination page already has view restrictions defined
@@ -366,6 +409,302 @@ class CopyPageAction:
 
         return page_copy
 
+    def can_bulk_copy(self, page_copy):
+        """
+        Whether the descendants of a page can be copied below ``page_copy`` with
+        bulk queries. This requires the database to return the primary keys of
+        rows created by a bulk insert; otherwise each page is copied in turn.
+        """
+        return connections[
+            page_copy._state.db
+        ].features.can_return_rows_from_bulk_insert
+
+    def _bulk_copy_descendants(self, page, page_copy):
+        """
+        Copy all descendants of ``page`` to below ``page_copy``.
+
+        Rather than copying each page in turn, the copied subtree is first built in
+        memory with its tree paths allocated up front. The pages, their child
+        objects and revisions are then created with a handful of bulk queries.
+        Pages of models that override ``save()`` are saved individually. Log
+        entries are created through ``log()``, so they are inserted in bulk if
+        ``WAGTAIL_BUFFER_LOG_ENTRIES`` is enabled.
+        """
+        from wagtail.models import Locale, Page, Revision, Site
+
+        using = page_copy._state.db
+        descendants = list(page.get_descendants().order_by("path").specific())
+        if not descendants:
+            return
+
+        # Build the copies. Descendants are ordered by path, so the copy of each
+        # page's parent has been built (and its path allocated) before the page.
+        copies = []
+        copies_by_path = {page.path: page_copy}
+        sources_by_path = {page.path: page}
+        for specific_page in descendants:
+            parent_copy = copies_by_path[specific_page.path[: -Page.steplen]]
+            exclude_fields = (
+                specific_page.default_exclude_fields_in_copy
+                + specific_page.exclude_fields_in_copy
+            )
+            base_update_attrs = self._get_base_update_attrs()
+
+            child_copy, child_object_map = _copy(
+                specific_page,
+                exclude_fields=exclude_fields,
+                update_attrs=base_update_attrs,
+            )
+            self._process_child_objects(specific_page, child_copy, child_object_map)
+
+            child_copy.depth = parent_copy.depth + 1
+            child_copy.path = Page._get_path(
+                parent_copy.path, child_copy.depth, parent_copy.numchild
+            )
+            parent_copy.numchild += 1
+            child_copy.set_url_path(parent_copy)
+
+            copies_by_path[specific_page.path] = child_copy
+            sources_by_path[specific_page.path] = specific_page
+            copies.append(
+                (
+                    specific_page,
+                    child_copy,
+                    child_object_map,
+                    exclude_fields,
+                    base_update_attrs,
+                )
+            )
+
+        # Insert the pages one tree level at a time, so that the parent of each page
+        # exists before it is saved (Page.save() looks it up to set the URL path).
+        # Copies are complete at this point, so numchild is already correct for
+        # each of them.
+        bulk_page_copies = []
+        copies_by_depth = defaultdict(list)
+        for specific_page, child_copy, *_ in copies:
+            copies_by_depth[child_copy.depth].append(child_copy)
+        for depth in sorted(copies_by_depth):
+            level_bulk_page_copies = []
+            custom_save_copies = []
+            for child_copy in copies_by_depth[depth]:
+                if type(child_copy).save is Page.save:
+                    pre_save.send(
+                        sender=type(child_copy),
+                        instance=child_copy,
+                        raw=False,
+                        using=using,
+                        update_fields=None,
+                    )
+                    level_bulk_page_copies.append(child_copy)
+                else:
+                    custom_save_copies.append(child_copy)
+            _bulk_insert(level_bulk_page_copies, using)
+            bulk_page_copies += level_bulk_page_copies
+            for child_copy in custom_save_copies:
+                child_copy.save(clean=False)
+
+        # Save the child objects of the pages inserted above, which Page.save()
+        # would otherwise have done
+        child_objects_by_model = defaultdict(list)
+        for child_copy in bulk_page_copies:
+            for child_relation in get_all_child_relations(child_copy):
+                for child_object in getattr(
+                    child_copy, child_relation.get_accessor_name()
+                ).all():
+                    setattr(child_object, child_relation.field.attname, child_copy.pk)
+                    if (
+                        child_object._meta.parents
+                        or isinstance(child_object, ClusterableModel)
+                        or type(child_object).save is not models.Model.save
+                    ):
+                        child_object.save()
+                    else:
+                        child_objects_by_model[type(child_object)].append(child_object)
+        for model, child_objects in child_objects_by_model.items():
+            model._base_manager.using(using).bulk_create(child_objects)
+        for child_copy in bulk_page_copies:
+            for field in get_all_child_m2m_relations(child_copy):
+                getattr(child_copy, field.name).commit()
+
+        for specific_page, child_copy, _, exclude_fields, base_update_attrs in copies:
+            _copy_m2m_relations(
+                specific_page,
+                child_copy,
+                exclude_fields=exclude_fields,
+                update_attrs=base_update_attrs,
+            )
+
+        now = timezone.now()
+
+        # Page.save() logs the creation of each page, using its title before the
+        # new revision is created below
+        create_log_titles = {
+            child_copy.pk: child_copy.get_admin_display_title()
+            for child_copy in bulk_page_copies
+        }
+
+        # Copy revisions
+        if self.copy_revisions:
+            revisions_by_object_id = defaultdict(list)
+            for revision in (
+                Revision.page_revisions.using(using)
+                .filter(
+                    object_id__in=[
+                        str(specific_page.pk) for specific_page, *_ in copies
+                    ]
+                )
+                .order_by("pk")
+            ):
+                revisions_by_object_id[revision.object_id].append(revision)
+
+            revision_copies = []
+            for (
+                specific_page,
+                child_copy,
+                child_object_map,
+                exclude_fields,
+                _,
+            ) in copies:
+                content_type = ContentType.objects.get_for_model(
+                    specific_page, for_concrete_model=False
+                )
+                page_copy_data = child_copy.serializable_data()
+                for revision in revisions_by_object_id[str(specific_page.pk)]:
+                    if revision.content_type_id != content_type.pk:
+                        continue
+                    use_as_latest_revision = (
+                        revision.pk == specific_page.latest_revision_id
+                    )
+                    self._copy_revision(
+                        revision,
+                        specific_page,
+                        child_copy,
+                        page_copy_data,
+                        child_object_map,
+                        exclude_fields,
+                    )
+                    revision_copies.append(revision)
+                    if use_as_latest_revision:
+                        child_copy.latest_revision = revision
+            Revision.objects.using(using).bulk_create(revision_copies)
+
+        # Create a new revision for each copy, as save_revision() would
+        new_revisions = []
+        for specific_page, child_copy, *_ in copies:
+            latest_object = child_copy
+            if child_copy.has_unpublished_changes and child_copy.latest_revision:
+                latest_object = child_copy.with_content_json(
+                    child_copy.latest_revision.content
+                )
+            new_revisions.append(
+                (
+                    Revision(
+                        content_type=ContentType.objects.get_for_model(
+                            child_copy, for_concrete_model=False
+                        ),
+                        base_content_type=child_copy.get_base_content_type(),
+                        object_id=str(child_copy.pk),
+                        user=self.user,
+                        content=latest_object.serializable_data(),
+                        object_str=str(latest_object),
+                        created_at=now,
+                    ),
+                    latest_object,
+                )
+            )
+        Revision.objects.using(using).bulk_create(
+            [revision for revision, _ in new_revisions]
+        )
+
+        update_fields = ["latest_revision_created_at", "draft_title", "latest_revision"]
+        if self.keep_live:
+            update_fields += [
+                "live_revision",
+                "last_published_at",
+                "first_published_at",
+            ]
+        for (_, child_copy, *_), (revision, latest_object) in zip(
+            copies, new_revisions
+        ):
+            child_copy.latest_revision = revision
+            child_copy.latest_revision_created_at = revision.created_at
+            child_copy.draft_title = latest_object.title
+            if self.keep_live:
+                child_copy.live_revision = revision
+                child_copy.last_published_at = revision.created_at
+                child_copy.first_published_at = revision.created_at
+        Page.objects.using(using).bulk_update(
+            [child_copy for _, child_copy, *_ in copies], update_fields
+        )
+
+        for child_copy in bulk_page_copies:
+            post_save.send(
+                sender=type(child_copy),
+                instance=child_copy,
+                created=True,
+                update_fields=None,
+                raw=False,
+                using=using,
+            )
+
+        # Log. If WAGTAIL_BUFFER_LOG_ENTRIES is enabled, the entries are inserted
+        # together once the copy is committed
+        locales = Locale.objects.using(using).in_bulk()
+        for (specific_page, child_copy, *_), (revision, _) in zip(
+            copies, new_revisions
+        ):
+            if child_copy.pk in create_log_titles:
+                log(
+                    instance=child_copy,
+                    action="wagtail.create",
+                    user=child_copy.owner,
+                    title=create_log_titles[child_copy.pk],
+                    content_changed=True,
+                )
+
+            if child_copy.live:
+                page_published.send(
+                    sender=child_copy.specific_class,
+                    instance=child_copy,
+                    revision=revision,
+                )
+
+            if self.log_action:
+                specific_page.locale = locales[specific_page.locale_id]
+                child_copy.locale = locales[child_copy.locale_id]
+                parent_path = specific_page.path[: -Page.steplen]
+                log(
+                    instance=child_copy,
+                    action=self.log_action,
+                    user=self.user,
+                    data=self._get_log_data(
+                        specific_page,
+                        child_copy,
+                        sources_by_path[parent_path],
+                        copies_by_path[parent_path],
+                    ),
+                )
+                if child_copy.live and self.keep_live:
+                    log(
+                        instance=child_copy,
+                        action="wagtail.publish",
+                        user=self.user,
+                        revision=revision,
+                    )
+            logger.info(
+                'Page copied: "%s" id=%d from=%d',
+                child_copy.title,
+                child_copy.id,
+                specific_page.id,
+            )
+
+        # Copies that keep their translation key may be translations of site roots
+        if not self.reset_translation_key:
+            Site.clear_site_root_paths_cache()
+
+        page_copy.save(clean=False, update_fields=["numchild"])
+
     def execute(self, skip_permission_checks=False):
         self.check(skip_permission_checks=skip_permission_checks)
 
@@ -3,6 +3,7 @@ import uuid
 
 from django.core.exceptions import PermissionDenied
 
+from wagtail.actions.update_aliases import EXCLUDED_ALIAS_RELATIONS
 from wagtail.log_actions import log
 from wagtail.models.copying import _copy, _copy_m2m_relations
 from wagtail.models.i18n import TranslatableMixin
@@ -117,18 +118,8 @@ class CreatePageAliasAction:
     ):
         specific_page = page.specific
 
-        # FIXME: Switch to the same fields that are excluded from copy
-        # We can't do this right now because we can't exclude fields from with_content_json
-        # which we use for updating aliases
         exclude_fields = [
-            "id",
-            "path",
-            "depth",
-            "numchild",
-            "url_path",
-            "path",
-            "index_entries",
-            "postgres_index_entries",
+            *EXCLUDED_ALIAS_RELATIONS,
             "latest_revision",  # for page aliases do not have revisions
         ]
 
@@ -1,6 +1,14 @@
+from django.apps import apps
 from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from django.db.models import F
 
+from wagtail import hooks
 from wagtail.log_actions import log
+from wagtail.signals import page_unpublished
+
+# The number of pages deleted in each transaction when deleting in the background
+BACKGROUND_DELETION_BATCH_SIZE = 100
 
 
 class DeletePagePermissionError(PermissionDenied):
@@ -40,6 +48,125 @@ class DeletePageAction:
 
         return self._delete_page(self.page, *args, **kwargs)
 
+    def execute_in_background(self, skip_permission_checks=False):
+        """
+        Mark the page as pending deletion, and enqueue a background task to delete
+        it along with its descendants in batches. Returns the ``PendingPageDeletion``
+        record, which is updated with the progress of the deletion.
+
+        The page is unpublished and its descendants are hidden straight away, so
+        that they are no longer served while the deletion is in progress.
+
+        If the page is already pending deletion (for example, because a previous
+        task was interrupted), the deletion is resumed.
+        """
+        from wagtail.models import PendingPageDeletion
+        from wagtail.tasks import delete_page_task
+
+        self.check(skip_permission_checks=skip_permission_checks)
+
+        pending_deletion, created = PendingPageDeletion.objects.get_or_create(
+            page=self.page,
+            defaults={
+                "user": self.user,
+                "total_pages": self.page.get_descendant_count() + 1,
+            },
+        )
+        if created:
+            self.hide_pages()
+
+        transaction.on_commit(
+            lambda: delete_page_task.enqueue(pending_deletion.pk),
+        )
+        return pending_deletion
+
+    def hide_pages(self):
+        """
+        Unpublish the page, and mark its live descendants as not live with a single
+        query. Unlike unpublishing each descendant, this takes the same time
+        regardless of the size of the subtree; the descendants are removed from the
+        search index and other places along with the pages themselves once they
+        are deleted.
+
+        The ``page_unpublished`` signal is still sent for each descendant, so that
+        they are purged from the frontend cache and sitemaps straight away. Frontend
+        cache purges are sent in a single batch.
+        """
+        if apps.is_installed("wagtail.contrib.frontend_cache"):
+            from wagtail.contrib.frontend_cache.utils import batch_page_purges
+
+            with batch_page_purges():
+                return self._hide_pages()
+
+        return self._hide_pages()
+
+    def _hide_pages(self):
+        from wagtail.actions.unpublish_page import UnpublishPageAction
+        from wagtail.models import Page
+
+        if self.page.live:
+            UnpublishPageAction(self.page.specific, user=self.user).execute(
+                skip_permission_checks=True
+            )
+
+        live_descendants = Page.objects.descendant_of(self.page).filter(live=True)
+        descendant_ids = list(live_descendants.values_list("pk", flat=True))
+        live_descendants.update(live=False)
+
+        for i in range(0, len(descendant_ids), BACKGROUND_DELETION_BATCH_SIZE):
+            for page in Page.objects.filter(
+                pk__in=descendant_ids[i : i + BACKGROUND_DELETION_BATCH_SIZE]
+            ).specific():
+                page_unpublished.send(sender=page.specific_class, instance=page)
+
+    def delete_in_batches(self, batch_size=BACKGROUND_DELETION_BATCH_SIZE):
+        """
+        Delete the page's descendants deepest-first, in separate transactions of up
+        to ``batch_size`` pages, then delete the page itself. The tree is kept
+        consistent after each batch, so this can safely be resumed after being
+        interrupted.
+
+        Once the page itself has been deleted, the ``after_delete_page_in_background``
+        hooks are called.
+        """
+        from wagtail.models import Page, PendingPageDeletion
+
+        page = self.page.specific
+        while True:
+            with transaction.atomic():
+                # Locking the record prevents concurrent tasks from deleting the
+                # same pages, and stops once a previous task has finished
+                pending_deletion = (
+                    PendingPageDeletion.objects.select_for_update()
+                    .filter(page_id=self.page.pk)
+                    .first()
+                )
+                if pending_deletion is None:
+                    return
+
+                pages = list(
+                    Page.objects.descendant_of(self.page)
+                    .order_by("-depth", "path")
+                    .specific()[:batch_size]
+                )
+                if not pages:
+                    # Only the page itself remains, and deleting it also removes
+                    # the PendingPageDeletion record
+                    self.log_deletion(page)
+                    super(Page, page).delete()
+                    break
+
+                self.log_deletions(pages)
+                Page.objects.filter(
+                    pk__in=[descendant.pk for descendant in pages]
+                ).delete()
+                PendingPageDeletion.objects.filter(pk=pending_deletion.pk).update(
+                    deleted_pages=F("deleted_pages") + len(pages)
+                )
+
+        for fn in hooks.get_hooks("after_delete_page_in_background"):
+            fn(page, self.user)
+
     def log_deletion(self, page):
         log(
             instance=page,
@@ -47,3 +174,12 @@ class DeletePageAction:
             user=self.user,
             deleted=True,
         )
+
+    def log_deletions(self, pages):
+        """
+        Log the deletion of the given specific pages. If ``WAGTAIL_BUFFER_LOG_ENTRIES``
+        is enabled, the log entries of each batch are inserted in a single query
+        once the batch is committed.
+        """
+        for page in pages:
+            self.log_deletion(page)
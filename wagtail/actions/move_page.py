@@ -2,6 +2,10 @@ import logging
 
 from django.core.exceptions import PermissionDenied
 from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Concat, Length, Substr
+from django.utils.translation import gettext_lazy as _
+from treebeard.exceptions import InvalidMoveToDescendant
 from treebeard.mp_tree import MP_MoveHandler
 
 from wagtail.log_actions import log
@@ -32,6 +36,51 @@ class MovePageAction:
                     "You do not have permission to move the page to the target specified."
                 )
 
+    def _move_subtree(self, page, parent_after, old_url_path, new_url_path):
+        """
+        Move ``page`` and its descendants to become the last child of a different
+        parent, updating ``path``, ``depth`` and ``url_path`` across the whole subtree
+        in a single query. This avoids rewriting every row twice (once by treebeard
+        for the paths, and again for the URL paths) when moving large sections.
+        """
+        from wagtail.models import Page
+
+        if parent_after.pk == page.pk or parent_after.is_descendant_of(page):
+            raise InvalidMoveToDescendant(_("Can't move node to a descendant."))
+
+        # Lock the new parent so that concurrent moves or additions below it
+        # cannot allocate the same path
+        new_parent = Page.objects.select_for_update().get(pk=parent_after.pk)
+        last_child = new_parent.get_last_child()
+        if last_child:
+            new_path = last_child._inc_path()
+        else:
+            new_path = Page._get_path(new_parent.path, new_parent.depth + 1, 1)
+        old_path = page.path
+
+        new_path_value = Concat(Value(new_path), Substr("path", len(old_path) + 1))
+        update_kwargs = {}
+        # As in treebeard, depth must be assigned before path, as MySQL applies
+        # assignments from left to right using the updated values
+        if len(old_path) != len(new_path):
+            update_kwargs["depth"] = Length(new_path_value) / Page.steplen
+        update_kwargs["path"] = new_path_value
+        if old_url_path != new_url_path:
+            update_kwargs["url_path"] = Concat(
+                Value(new_url_path), Substr("url_path", len(old_url_path) + 1)
+            )
+
+        Page.objects.filter(path__startswith=old_path).update(**update_kwargs)
+
+        Page.objects.filter(path=Page._get_parent_path_from_path(old_path)).update(
+            numchild=F("numchild") - 1
+        )
+        Page.objects.filter(pk=new_parent.pk).update(numchild=F("numchild") + 1)
+
+        # Update the in-memory instances, as treebeard's move() does
+        parent_after.numchild += 1
+        page.refresh_from_db()
+
     def _move_page(self, page, target, parent_after):
         from wagtail.models import Page
 
@@ -55,8 +104,15 @@ class MovePageAction:
 
         # Only commit when all descendants are properly updated
         with transaction.atomic():
-            # Allow treebeard to update `path` values
-            MP_MoveHandler(page, target, self.pos).process()
+            if self.pos == "last-child" and parent_after.pk != parent_before.pk:
+                # Moving to the end of a different parent doesn't require any other
+                # pages to be renumbered, so the subtree can be updated in one go
+                self._move_subtree(page, parent_after, old_url_path, new_url_path)
+                url_paths_updated = True
+            else:
+                # Allow treebeard to update `path` values
+                MP_MoveHandler(page, target, self.pos).process()
+                url_paths_updated = False
 
             # Treebeard's move method doesn't actually update the in-memory instance,
             # so we need to work with a freshly loaded one now
@@ -65,7 +121,7 @@ class MovePageAction:
             new_page.save()
 
             # Update descendant paths if url_path has changed
-            if url_path_changed:
+            if url_path_changed and not url_paths_updated:
                 new_page._update_descendant_url_paths(old_url_path, new_url_path)
 
         # Emit post_page_move signal
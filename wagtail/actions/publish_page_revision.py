@@ -1,9 +1,12 @@
 import logging
 
+from django.conf import settings
+
 from wagtail.actions.publish_revision import (
     PublishPermissionError,
     PublishRevisionAction,
 )
+from wagtail.actions.update_aliases import UpdateAliasesAction
 from wagtail.signals import page_published
 
 logger = logging.getLogger("wagtail")
@@ -58,6 +61,19 @@ class PublishPageRevisionAction(PublishRevisionAction):
 
         super()._after_publish()
 
-        self.object.update_aliases(
-            revision=self.revision, _content=self.revision.content
+        # Pages with many aliases, including aliases of aliases, have them updated
+        # by a background task instead
+        background_limit = getattr(
+            settings, "WAGTAIL_BACKGROUND_ALIAS_UPDATE_LIMIT", None
         )
+        update_aliases_action = UpdateAliasesAction(self.object, revision=self.revision)
+        if (
+            background_limit is not None
+            and update_aliases_action.count_aliases(limit=background_limit)
+            >= background_limit
+        ):
+            update_aliases_action.execute_in_background()
+        else:
+            self.object.update_aliases(
+                revision=self.revision, _content=self.revision.content
+            )
@@ -0,0 +1,158 @@
+import logging
+
+from django.apps import apps
+from django.db import connections, transaction
+from django.utils import timezone
+
+logger = logging.getLogger("wagtail")
+
+# The number of objects claimed and processed in each transaction
+PUBLISH_SCHEDULED_BATCH_SIZE = 100
+
+
+class PublishScheduledAction:
+    """
+    Unpublishes objects whose expiry date has passed, and publishes revisions whose
+    scheduled go-live date has passed.
+
+    Objects and revisions are claimed in batches, each processed in its own
+    transaction. Where the database supports ``SELECT ... FOR UPDATE SKIP LOCKED``,
+    rows claimed by one process are skipped by others, so several processes can
+    safely run at the same time and share the work.
+    """
+
+    def __init__(self, batch_size=PUBLISH_SCHEDULED_BATCH_SIZE):
+        self.batch_size = batch_size
+
+    def get_models(self):
+        from wagtail.models import DraftStateMixin, Page
+
+        return [Page] + [
+            model
+            for model in apps.get_models()
+            if issubclass(model, DraftStateMixin) and not issubclass(model, Page)
+        ]
+
+    def get_expired_objects(self):
+        """
+        Return a list of querysets of live objects whose expiry date has passed,
+        one for each model.
+        """
+        now = timezone.now()
+        return [
+            model.objects.filter(live=True, expire_at__lt=now).order_by("expire_at")
+            for model in self.get_models()
+        ]
+
+    def get_due_revisions(self):
+        """
+        Return a queryset of the revisions whose scheduled go-live date has passed.
+        """
+        from wagtail.models import Revision
+
+        return Revision.objects.filter(approved_go_live_at__lt=timezone.now()).order_by(
+            "approved_go_live_at", "pk"
+        )
+
+    def _process_in_batches(self, queryset, process):
+        """
+        Lock and process the objects in ``queryset`` in batches, each in a separate
+        transaction. Objects locked by another process are skipped.
+
+        Each object is processed within its own savepoint, so that an error while
+        processing one object is logged and the object skipped, without rolling back
+        the rest of the batch.
+        """
+        skip_locked = connections[
+            queryset.db
+        ].features.has_select_for_update_skip_locked
+        # Keep track of the objects already processed, in case processing an
+        # object doesn't remove it from the queryset
+        processed = set()
+
+        while True:
+            # Errors are handled for each object, so a savepoint isn't needed for the
+            # batch when this is called within an existing transaction
+            with transaction.atomic(using=queryset.db, savepoint=False):
+                batch = list(
+                    queryset.select_for_update(skip_locked=skip_locked).exclude(
+                        pk__in=processed
+                    )[: self.batch_size]
+                )
+                for obj in batch:
+                    try:
+                        with transaction.atomic(using=queryset.db):
+                            process(obj)
+                    except Exception:
+                        logger.exception(
+                            "Failed to process scheduled %s: pk=%s",
+                            obj._meta.verbose_name,
+                            obj.pk,
+                        )
+                    # Failed objects are marked as processed too, so that they are
+                    # not retried until the next run
+                    processed.add(obj.pk)
+
+            if len(batch) < self.batch_size:
+                return
+
+    def unpublish_expired_objects(self):
+        """
+        Unpublish all live objects whose expiry date has passed. Returns the number
+        of objects unpublished.
+        """
+        unpublished = []
+
+        def unpublish(obj):
+            obj.unpublish(set_expired=True, log_action="wagtail.unpublish.scheduled")
+            unpublished.append(obj)
+
+        for queryset in self.get_expired_objects():
+            self._process_in_batches(queryset, unpublish)
+
+        return len(unpublished)
+
+    def publish_due_revisions(self):
+        """
+        Publish all revisions whose scheduled go-live date has passed. Returns a
+        list of the publish lag for each revision, i.e. how long after its
+        scheduled go-live date it was actually published.
+        """
+        publish_lags = []
+
+        def publish(revision):
+            publish_lag = timezone.now() - revision.approved_go_live_at
+            # Since the approved go-live date is in the past, this makes the
+            # object live
+            revision.publish(log_action="wagtail.publish.scheduled")
+            publish_lags.append(publish_lag)
+            logger.info(
+                "Scheduled revision published: revision_id=%d lag=%.1fs",
+                revision.pk,
+                publish_lag.total_seconds(),
+            )
+
+        self._process_in_batches(self.get_due_revisions(), publish)
+
+        return publish_lags
+
+    def execute(self):
+        """
+        Unpublish expired objects and publish due revisions. Frontend cache purges
+        triggered by this are collected and sent in a single batch at the end.
+
+        Returns a tuple of the number of objects unpublished, and the list of
+        publish lags of the revisions published.
+        """
+        if apps.is_installed("wagtail.contrib.frontend_cache"):
+            from wagtail.contrib.frontend_cache.utils import batch_page_purges
+
+            with batch_page_purges():
+                return self._execute()
+
+        return self._execute()
+
+    def _execute(self):
+        unpublished_count = self.unpublish_expired_objects()
+        publish_lags = self.publish_due_revisions()
+        return unpublished_count, publish_lags
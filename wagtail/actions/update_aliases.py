@@ -0,0 +1,443 @@
+import copy
+import uuid
+from collections import defaultdict
+
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.signals import post_save, pre_save
+from modelcluster.fields import ParentalManyToManyField
+from modelcluster.models import (
+    ClusterableModel,
+    get_all_child_m2m_relations,
+    get_all_child_relations,
+)
+
+from wagtail.models.copying import _copy_m2m_relations
+from wagtail.models.i18n import TranslatableMixin
+from wagtail.signals import page_published
+
+# The number of aliases updated together, and in each transaction when updating
+# in the background
+ALIAS_UPDATE_BATCH_SIZE = 100
+
+# Fields that are meaningful to each alias, rather than its content, so are never
+# copied from the original page
+PRESERVED_ALIAS_FIELDS = {
+    "content_type",
+    "path",
+    "depth",
+    "numchild",
+    "url_path",
+    "slug",
+    "owner",
+    "locked",
+    "locked_by",
+    "locked_at",
+    "latest_revision",
+    "translation_key",
+    "locale",
+    "alias_of",
+}
+
+# Fields and relations that are not copied from a page to its aliases, when the
+# aliases are created or updated.
+# FIXME: Switch to the same fields that are excluded from copy
+# We can't do this right now because we can't exclude fields from with_content_json,
+# which is still used to update aliases of models that override save()
+EXCLUDED_ALIAS_RELATIONS = [
+    "id",
+    "path",
+    "depth",
+    "numchild",
+    "url_path",
+    "index_entries",
+    "postgres_index_entries",
+]
+
+
+class UpdateAliasesAction:
+    """
+    Publishes all aliases that follow a page with the latest content from that page,
+    including aliases of those aliases.
+
+    Aliases always have the same type as the page they follow, so rather than
+    saving each alias in turn, the new content is computed once and applied to a
+    batch of aliases with a single update query. Their child objects are then
+    replaced with a bulk delete and insert for each child relation. Aliases are
+    processed one level of the alias chain at a time, so that aliases of aliases
+    receive the child objects of the alias they follow.
+
+    Pages of models that override ``save()`` are saved individually.
+    """
+
+    def __init__(
+        self,
+        page,
+        revision=None,
+        content=None,
+        exclude_ids=None,
+        batch_size=ALIAS_UPDATE_BATCH_SIZE,
+    ):
+        self.page = page
+        self.revision = revision
+        self.content = content
+        self.exclude_ids = exclude_ids or []
+        self.batch_size = batch_size
+
+    def count_aliases(self, limit=None):
+        """
+        Return the number of aliases that follow the page, directly or through
+        other aliases. If ``limit`` is given, counting stops once it is reached,
+        so the number returned may be lower than the actual number of aliases, but
+        not lower than ``limit``.
+        """
+        from wagtail.models import Page
+
+        count = 0
+        seen_ids = {self.page.pk, *self.exclude_ids}
+        level_ids = [self.page.pk]
+        while level_ids and (limit is None or count < limit):
+            level_ids = list(
+                Page.objects.filter(alias_of_id__in=level_ids)
+                .exclude(pk__in=seen_ids)
+                .values_list("pk", flat=True)
+            )
+            count += len(level_ids)
+            seen_ids.update(level_ids)
+        return count
+
+    def get_batches(self):
+        """
+        Yield ``(sources, aliases)`` pairs of up to ``batch_size`` specific aliases,
+        along with a dictionary of the pages they follow keyed by ID. Each level of
+        the alias chain is only queried once the previous level has been consumed,
+        so that it sees the updated aliases.
+        """
+        specific_page = self.page.specific
+        seen_ids = {specific_page.pk, *self.exclude_ids}
+        sources = {specific_page.pk: specific_page}
+        while sources:
+            level = list(
+                specific_page.specific_class.objects.filter(alias_of_id__in=sources)
+                .exclude(pk__in=seen_ids)
+                .order_by("pk")
+            )
+            seen_ids.update(alias.pk for alias in level)
+            for start in range(0, len(level), self.batch_size):
+                yield sources, level[start : start + self.batch_size]
+            sources = {alias.pk: alias for alias in level}
+
+    def get_content(self):
+        # Only compute this if necessary since it's quite a heavy operation
+        if self.content is None:
+            if self.revision is not None:
+                self.content = self.revision.content
+            else:
+                self.content = self.page.specific.serializable_data()
+        return self.content
+
+    def execute(self):
+        for sources, aliases in self.get_batches():
+            self._update_aliases(sources, aliases)
+
+    def execute_in_background(self):
+        """
+        Record that the page's aliases are to be updated, and enqueue a background
+        task to update them in batches. Returns the ``PendingAliasUpdate`` record,
+        which is updated with the progress of the update.
+
+        If the aliases of the page are already being updated, the pending update is
+        replaced, so that any task still working on it stops after its current batch.
+        """
+        from wagtail.models import PendingAliasUpdate
+        from wagtail.tasks import update_aliases_task
+
+        pending_update, created = PendingAliasUpdate.objects.update_or_create(
+            page=self.page,
+            defaults={
+                "revision": self.revision,
+                "total_aliases": self.count_aliases(),
+                "updated_aliases": 0,
+            },
+        )
+        transaction.on_commit(
+            lambda: update_aliases_task.enqueue(pending_update.pk),
+        )
+        return pending_update
+
+    def update_in_batches(self):
+        """
+        Update the aliases in separate transactions of up to ``batch_size`` aliases,
+        recording the progress on the page's ``PendingAliasUpdate`` record. Stops if
+        the record is removed, or replaced by a newer update.
+        """
+        from wagtail.models import PendingAliasUpdate
+
+        revision_id = self.revision.pk if self.revision else None
+        pending_updates = PendingAliasUpdate.objects.filter(
+            page_id=self.page.pk, revision_id=revision_id
+        )
+
+        for sources, aliases in self.get_batches():
+            with transaction.atomic():
+                # Locking the record prevents concurrent tasks from updating the
+                # same aliases
+                pending_update = pending_updates.select_for_update().first()
+                if pending_update is None:
+                    return
+
+                self._update_aliases(sources, aliases)
+                pending_updates.update(
+                    updated_aliases=F("updated_aliases") + len(aliases)
+                )
+
+        pending_updates.delete()
+
+    def _update_aliases(self, sources, aliases):
+        """
+        Update the given specific aliases with the page's content. ``sources`` is a
+        dictionary of the pages the aliases follow, keyed by ID.
+        """
+        from wagtail.models import Page, Site
+
+        specific_class = self.page.specific_class
+        if specific_class.save is not Page.save:
+            for alias in aliases:
+                self._update_alias(sources[alias.alias_of_id], alias)
+            return
+
+        using = aliases[0]._state.db
+        content = self.get_content()
+        content_object = specific_class.from_serializable_data(content)
+
+        # Copy field content. These values are the same for all aliases.
+        values = {}
+        for field in specific_class._meta.concrete_fields:
+            if (
+                field.primary_key
+                or field.generated
+                or field.name in PRESERVED_ALIAS_FIELDS
+            ):
+                continue
+            values[field.name] = getattr(content_object, field.attname)
+
+        # Publish the aliases if they're currently in draft
+        values["live"] = True
+        values["has_unpublished_changes"] = False
+
+        # Aliases don't have revisions, so update fields that would normally be
+        # updated by save_revision
+        values["draft_title"] = values["title"]
+        values["latest_revision_created_at"] = self.page.latest_revision_created_at
+
+        # Keep the first published date of aliases that have one, if the content
+        # doesn't
+        if values["first_published_at"] is None:
+            del values["first_published_at"]
+
+        for alias in aliases:
+            for name, value in values.items():
+                setattr(alias, specific_class._meta.get_field(name).attname, value)
+            pre_save.send(
+                sender=specific_class,
+                instance=alias,
+                raw=False,
+                using=using,
+                update_fields=None,
+            )
+
+        alias_ids = [alias.pk for alias in aliases]
+        specific_class._base_manager.using(using).filter(pk__in=alias_ids).update(
+            **values
+        )
+
+        self._replace_child_objects(sources, aliases)
+
+        # Copy M2M relations
+        for field in get_all_child_m2m_relations(specific_class):
+            if field.name in EXCLUDED_ALIAS_RELATIONS:
+                continue
+            related_objects = list(getattr(content_object, field.name).all())
+            for alias in aliases:
+                getattr(alias, field.name).set(related_objects)
+                getattr(alias, field.name).commit()
+        if any(
+            field.many_to_many
+            and not field.auto_created
+            and not isinstance(field, ParentalManyToManyField)
+            for field in specific_class._meta.get_fields()
+        ):
+            for alias in aliases:
+                _copy_m2m_relations(
+                    sources[alias.alias_of_id],
+                    alias,
+                    exclude_fields=EXCLUDED_ALIAS_RELATIONS,
+                )
+
+        for alias in aliases:
+            post_save.send(
+                sender=specific_class,
+                instance=alias,
+                created=False,
+                update_fields=None,
+                raw=False,
+                using=using,
+            )
+            page_published.send(
+                sender=specific_class,
+                instance=alias,
+                revision=self.revision,
+                alias=True,
+            )
+
+        if Site.objects.filter(root_page_id__in=alias_ids).exists():
+            Site.clear_site_root_paths_cache()
+
+    def _replace_child_objects(self, sources, aliases):
+        """
+        Replace the child objects of the given aliases with copies of the child
+        objects of the pages they follow.
+        """
+        from wagtail.signal_handlers import disable_reference_index_auto_update
+
+        using = aliases[0]._state.db
+        alias_ids = [alias.pk for alias in aliases]
+
+        for child_relation in get_all_child_relations(self.page.specific_class):
+            accessor_name = child_relation.get_accessor_name()
+            if accessor_name in EXCLUDED_ALIAS_RELATIONS:
+                continue
+
+            # The name of the ParentalKey field on the child model
+            parental_key_name = child_relation.field.attname
+            child_manager = child_relation.related_model._default_manager.using(using)
+
+            if self.page.pk in sources:
+                # Use the page's own related manager, which includes any child
+                # objects that haven't been committed yet
+                source_children = {
+                    self.page.pk: list(
+                        getattr(sources[self.page.pk], accessor_name)
+                        .all()
+                        .order_by("pk")
+                    )
+                }
+            else:
+                source_children = defaultdict(list)
+                for child_object in child_manager.filter(
+                    **{f"{parental_key_name}__in": list(sources)}
+                ).order_by("pk"):
+                    source_children[getattr(child_object, parental_key_name)].append(
+                        child_object
+                    )
+
+            child_manager.filter(**{f"{parental_key_name}__in": alias_ids}).delete()
+
+            bulk_child_objects = []
+            saved_child_objects = []
+            for alias in aliases:
+                source = sources[alias.alias_of_id]
+                alias_is_translation = alias.translation_key == source.translation_key
+                for child_object in source_children.get(source.pk, []):
+                    if isinstance(child_object, ClusterableModel):
+                        child_object, _ = child_object.copy_cluster()
+                    else:
+                        child_object = copy.copy(child_object)
+                    child_object.pk = None
+                    child_object.id = None
+                    child_object._state.adding = True
+                    setattr(child_object, parental_key_name, alias.pk)
+
+                    if isinstance(child_object, TranslatableMixin):
+                        # Child object's locale must always match the page
+                        child_object.locale_id = alias.locale_id
+
+                        # If the alias isn't a translation of the page it follows,
+                        # change the child object's translation_keys so they are
+                        # not either
+                        if not alias_is_translation:
+                            child_object.translation_key = uuid.uuid4()
+
+                    if (
+                        child_object._meta.parents
+                        or isinstance(child_object, ClusterableModel)
+                        or type(child_object).save is not models.Model.save
+                    ):
+                        saved_child_objects.append(child_object)
+                    else:
+                        bulk_child_objects.append(child_object)
+
+            # The references of child objects are recorded against the alias, which
+            # is reindexed once it has been saved
+            with disable_reference_index_auto_update():
+                for child_object in saved_child_objects:
+                    child_object.save()
+            child_manager.bulk_create(bulk_child_objects)
+
+    def _update_alias(self, source, alias):
+        """
+        Update a single alias by saving it. Used for pages of models that override
+        ``save()``.
+        """
+        # Copy field content
+        alias_updated = alias.with_content_json(self.get_content())
+
+        # Publish the alias if it's currently in draft
+        alias_updated.live = True
+        alias_updated.has_unpublished_changes = False
+
+        # Copy child relations
+        child_object_map = source.copy_all_child_relations(
+            target=alias_updated, exclude=EXCLUDED_ALIAS_RELATIONS
+        )
+
+        # Process child objects
+        # This has two jobs:
+        #  - If the alias is in a different locale, this updates the
+        #    locale of any translatable child objects to match
+        #  - If the alias is not a translation of the original, this
+        #    changes the translation_key field of all child objects
+        #    so they do not clash
+        if child_object_map:
+            alias_is_translation = alias.translation_key == source.translation_key
+
+            def process_child_object(child_object):
+                if isinstance(child_object, TranslatableMixin):
+                    # Child object's locale must always match the page
+                    child_object.locale = alias_updated.locale
+
+                    # If the alias isn't a translation of the original page,
+                    # change the child object's translation_keys so they are
+                    # not either
+                    if not alias_is_translation:
+                        child_object.translation_key = uuid.uuid4()
+
+            for (rel, previous_id), child_objects in child_object_map.items():
+                if previous_id is None:
+                    for child_object in child_objects:
+                        process_child_object(child_object)
+                else:
+                    process_child_object(child_objects)
+
+        # Copy M2M relations
+        _copy_m2m_relations(
+            source, alias_updated, exclude_fields=EXCLUDED_ALIAS_RELATIONS
+        )
+
+        # Don't change the aliases slug
+        # Aliases can have their own slugs so they can be siblings of the original
+        alias_updated.slug = alias.slug
+        alias_updated.set_url_path(alias_updated.get_parent())
+
+        # Aliases don't have revisions, so update fields that would normally be updated by save_revision
+        alias_updated.draft_title = alias_updated.title
+        alias_updated.latest_revision_created_at = self.page.latest_revision_created_at
+
+        alias_updated.save(clean=False)
+
+        page_published.send(
+            sender=alias_updated.specific_class,
+            instance=alias_updated,
+            revision=self.revision,
+            alias=True,
+        )
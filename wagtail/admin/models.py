@@ -1,9 +1,16 @@
+import os
+import uuid
+
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.storage import InvalidStorageError, default_storage, storages
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.db.models import Count
 from django.utils import timezone
+from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy as _
 from modelcluster.fields import ParentalKey
 from taggit.models import Tag
@@ -217,3 +224,85 @@ class FormState(models.Model):
             ),
         ]
         ordering = ["-last_updated_at"]
+
+
+def get_spreadsheet_export_upload_to(instance, filename):
+    # Exports may contain sensitive data, so they are stored under a random path
+    # and only served through the admin to the user who requested them
+    return f"spreadsheet_exports/{uuid.uuid4().hex}/{filename}"
+
+
+def get_spreadsheet_export_storage():
+    """
+    Obtain the storage object for spreadsheet export files.
+    Returns the storage defined by ``WAGTAILADMIN_EXPORT_STORAGE``, or the default
+    storage.
+
+    This needs to be a module-level function, because we do not yet
+    have an instance when Django loads the models.
+    """
+    storage = getattr(settings, "WAGTAILADMIN_EXPORT_STORAGE", None)
+    if storage is None:
+        return default_storage
+
+    if isinstance(storage, str):
+        try:
+            # First see if the string is a storage alias
+            storage = storages[storage]
+        except InvalidStorageError:
+            # Otherwise treat the string as a dotted path
+            try:
+                module = import_string(storage)
+                storage = module()
+            except ImportError as e:
+                raise ImproperlyConfigured(
+                    "WAGTAILADMIN_EXPORT_STORAGE must be either a valid storage alias or dotted module path."
+                ) from e
+
+    return storage
+
+
+class SpreadsheetExport(models.Model):
+    """A spreadsheet export of an admin listing, generated by a background task."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="wagtail_spreadsheet_exports",
+    )
+    """The user that requested the export."""
+    view_name = models.CharField(max_length=255)
+    """The URL name of the listing view being exported."""
+    view_args = models.JSONField(default=list, encoder=DjangoJSONEncoder)
+    """The positional arguments of the listing view's URL."""
+    view_kwargs = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    """The keyword arguments of the listing view's URL."""
+    query_string = models.TextField(blank=True)
+    """The query string of the listing, which holds the filters and ordering."""
+    file = models.FileField(
+        upload_to=get_spreadsheet_export_upload_to,
+        storage=get_spreadsheet_export_storage,
+        blank=True,
+    )
+    """The exported spreadsheet, once it has been generated."""
+    created_at = models.DateTimeField(auto_now_add=True)
+    """The time the export was requested."""
+    completed_at = models.DateTimeField(null=True, blank=True)
+    """The time the export was generated."""
+
+    STALE_TIMEOUT = timezone.timedelta(days=7)
+
+    @classmethod
+    def cleanup(cls):
+        """Delete all exports, and their files, requested more than a week ago."""
+        stale_exports = cls.objects.filter(
+            created_at__lt=timezone.now() - cls.STALE_TIMEOUT
+        )
+        for export in stale_exports:
+            if export.file:
+                export.file.delete(save=False)
+        stale_exports.delete()
+
+    @property
+    def filename(self):
+        return os.path.basename(self.file.name)
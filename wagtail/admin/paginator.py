@@ -1,8 +1,41 @@
+import json
+
+from django.conf import settings
 from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import QuerySet
 from django.utils.functional import cached_property
 from django.utils.translation import gettext as _
 
 
+def get_estimated_count(queryset):
+    """
+    Return the number of rows the database's query planner expects the given
+    queryset to return, or None if an estimate is not available. This is much
+    faster than an exact COUNT(*) for large tables, but may be inaccurate.
+
+    Estimates are currently only available on PostgreSQL.
+    """
+    if not isinstance(queryset, QuerySet):
+        return None
+
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    try:
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
 class WagtailPaginator(Paginator):
     num_page_buttons = 6
 
@@ -22,8 +55,91 @@ class WagtailPaginator(Paginator):
             return self.model._meta.verbose_name_plural
         return _("items")
 
+    _use_exact_count = False
+
+    @cached_property
+    def estimate_count_threshold(self):
+        return getattr(settings, "WAGTAILADMIN_ESTIMATED_COUNT_THRESHOLD", None)
+
+    @cached_property
+    def estimated_count(self):
+        """
+        The number of items as estimated by the database, if estimated counts are
+        enabled and the estimate is above the threshold, otherwise None.
+        """
+        if self.estimate_count_threshold is None:
+            return None
+        estimate = get_estimated_count(self.object_list)
+        if estimate is None or estimate < self.estimate_count_threshold:
+            return None
+        return estimate
+
+    @cached_property
+    def exact_count(self):
+        """
+        The exact number of items. For querysets, this performs a COUNT(*) query
+        the first time it is accessed.
+        """
+        return Paginator.count.func(self)
+
+    @property
+    def count_is_estimated(self):
+        return not self._use_exact_count and self.estimated_count is not None
+
+    @cached_property
+    def count(self):
+        if self.count_is_estimated:
+            return self.estimated_count
+        return self.exact_count
+
+    def use_exact_count(self):
+        """
+        Stop using the estimated count, e.g. when it turns out to be inconsistent
+        with the items that are actually returned.
+        """
+        self._use_exact_count = True
+        for attr in ("count", "num_pages", "page_range", "items_count_label"):
+            self.__dict__.pop(attr, None)
+
+    def page(self, number):
+        if not self.count_is_estimated:
+            return super().page(number)
+
+        try:
+            number = self.validate_number(number)
+        except EmptyPage:
+            # There may be more items than estimated
+            self.use_exact_count()
+            return super().page(number)
+
+        # Fetch one more item than needed to check the estimated number of pages
+        # against the actual results, and fall back to an exact count if they differ
+        bottom = (number - 1) * self.per_page
+        object_list = list(self.object_list[bottom : bottom + self.per_page + 1])
+        has_next = len(object_list) > self.per_page
+        if has_next != (number < self.num_pages) or (not object_list and number > 1):
+            self.use_exact_count()
+            return super().page(number)
+
+        return self._get_page(object_list[: self.per_page], number, self)
+
+    def get_page(self, number):
+        # Unlike Paginator.get_page, only fall back to the last page once page()
+        # has had a chance to replace an inaccurate estimate with the exact count
+        try:
+            return self.page(number)
+        except PageNotAnInteger:
+            return self.page(1)
+        except EmptyPage:
+            return self.page(self.num_pages)
+
     @cached_property
     def items_count_label(self):
+        if self.count_is_estimated:
+            return _("About %(count)s %(verbose_name_plural)s") % {
+                "count": self.count,
+                "verbose_name_plural": self.verbose_name_plural,
+            }
         if self.count == 1:
             return f"1 {self.verbose_name}"
         else:
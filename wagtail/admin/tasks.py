@@ -0,0 +1,87 @@
+import logging
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.messages.storage import default_storage as message_storage
+from django.template.loader import render_to_string
+from django.urls import get_script_prefix, resolve, reverse
+from django.utils import timezone
+from django.utils.translation import override
+from django_tasks import task
+
+from wagtail.admin.mail import send_mail
+from wagtail.admin.models import SpreadsheetExport
+from wagtail.admin.utils import get_admin_base_url
+from wagtail.coreutils import get_dummy_request
+from wagtail.users.models import UserProfile
+
+logger = logging.getLogger("wagtail.admin")
+
+
+@task()
+def export_spreadsheet_task(export_id):
+    SpreadsheetExport.cleanup()
+
+    try:
+        export = SpreadsheetExport.objects.select_related("user").get(pk=export_id)
+    except SpreadsheetExport.DoesNotExist:
+        return
+
+    # Run the listing view again as the user who requested the export, so that
+    # the same filters and permissions apply. The view writes the spreadsheet to
+    # the export's file rather than returning it in the response.
+    request = get_spreadsheet_export_request(export)
+    match = request.resolver_match
+    match.func(request, *match.args, **match.kwargs)
+
+    if not export.file:
+        logger.warning("Spreadsheet export %d did not produce a file", export.pk)
+        return
+
+    export.completed_at = timezone.now()
+    export.save(update_fields=["file", "completed_at"])
+    send_spreadsheet_export_notification(export)
+
+
+def get_spreadsheet_export_request(export):
+    """
+    Return a request for the listing view of the export, made by the user who
+    requested it.
+    """
+    url = reverse(export.view_name, args=export.view_args, kwargs=export.view_kwargs)
+    # The view is resolved from the path without the script prefix, which may be
+    # set if the task is run at the end of a request
+    path_info = "/" + url.removeprefix(get_script_prefix())
+    if export.query_string:
+        path_info += "?" + export.query_string
+
+    request = get_dummy_request(path=path_info)
+    request.user = export.user
+    request.spreadsheet_export = export
+    request.resolver_match = resolve(request.path_info)
+
+    # Views may use the session or messages. These are not persisted, as there is
+    # no response to send them with.
+    request.session = import_module(settings.SESSION_ENGINE).SessionStore()
+    request._messages = message_storage(request)
+    return request
+
+
+def send_spreadsheet_export_notification(export):
+    user = export.user
+    if not user.is_active or not user.email:
+        return
+
+    context = {
+        "user": user,
+        "export": export,
+        "download_url": (get_admin_base_url() or "")
+        + reverse("wagtailadmin_spreadsheet_export", args=(export.pk,)),
+    }
+    with override(UserProfile.get_for_user(user).get_preferred_language()):
+        template_base = "wagtailadmin/notifications/spreadsheet_export_ready"
+        subject = render_to_string(template_base + "_subject.txt", context).strip()
+        message = render_to_string(template_base + ".txt", context).strip()
+        html_message = render_to_string(template_base + ".html", context).strip()
+
+    send_mail(subject, message, [user.email], html_message=html_message)
@@ -6,7 +6,8 @@ from django.http import HttpRequest, HttpResponse
 from django.test import TestCase, override_settings
 from django.urls import reverse
 
-from wagtail.models import Page
+from wagtail.actions.delete_page import DeletePageAction
+from wagtail.models import Page, PageLogEntry, PendingPageDeletion
 from wagtail.signals import page_unpublished
 from wagtail.test.testapp.models import (
     SimplePage,
@@ -394,3 +395,210 @@ class TestPageDelete(WagtailTestUtils, TestCase):
 
         # Check that the page is still here
         self.assertTrue(Page.objects.filter(pk=self.child_page.id).exists())
+
+
+class TestPageDeleteInBackground(WagtailTestUtils, TestCase):
+    def setUp(self):
+        self.root_page = Page.objects.get(id=2)
+
+        self.child_index = StandardIndex(title="Hello index", slug="hello-index")
+        self.root_page.add_child(instance=self.child_index)
+        self.grandchildren = []
+        for i in range(3):
+            grandchild = StandardIndex(title=f"Grandchild {i}", slug=f"grandchild-{i}")
+            self.child_index.add_child(instance=grandchild)
+            self.grandchildren.append(grandchild)
+            grandchild.add_child(
+                instance=StandardChild(
+                    title=f"Great-grandchild {i}", slug=f"great-grandchild-{i}"
+                )
+            )
+
+        self.user = self.login()
+
+    def get_subtree_ids(self):
+        return list(
+            self.child_index.get_descendants(inclusive=True).values_list(
+                "id", flat=True
+            )
+        )
+
+    @override_settings(WAGTAILADMIN_BACKGROUND_PAGE_DELETION_LIMIT=7)
+    def test_delete_in_background(self):
+        page_ids = self.get_subtree_ids()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("wagtailadmin_pages:delete", args=(self.child_index.id,)),
+                follow=True,
+            )
+
+        self.assertRedirects(
+            response, reverse("wagtailadmin_explore", args=(self.root_page.id,))
+        )
+        self.assertContains(response, "Page &#x27;Hello index&#x27; is being deleted.")
+        self.assertContains(
+            response, reverse("wagtailadmin_pages:delete", args=(self.child_index.id,))
+        )
+
+        self.assertFalse(Page.objects.filter(id__in=page_ids).exists())
+        self.assertFalse(PendingPageDeletion.objects.exists())
+        self.assertFalse(any(Page.find_problems()))
+        self.root_page.refresh_from_db()
+        self.assertEqual(self.root_page.numchild, 0)
+
+        log_entries = PageLogEntry.objects.filter(action="wagtail.delete")
+        self.assertEqual(
+            sorted(log_entries.values_list("page_id", flat=True)), sorted(page_ids)
+        )
+        for log_entry in log_entries:
+            self.assertTrue(log_entry.deleted)
+            self.assertEqual(log_entry.user, self.user)
+
+    @override_settings(WAGTAILADMIN_BACKGROUND_PAGE_DELETION_LIMIT=7)
+    def test_pages_hidden_before_deletion(self):
+        with self.captureOnCommitCallbacks():
+            self.client.post(
+                reverse("wagtailadmin_pages:delete", args=(self.child_index.id,))
+            )
+
+        # The pages are taken off the site before the task runs
+        self.assertTrue(PendingPageDeletion.objects.exists())
+        self.assertFalse(
+            self.child_index.get_descendants(inclusive=True).live().exists()
+        )
+        self.assertTrue(
+            PageLogEntry.objects.filter(
+                page=self.child_index, action="wagtail.unpublish"
+            ).exists()
+        )
+        response = self.client.get("/hello-index/grandchild-0/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_page_unpublished_sent_for_hidden_pages(self):
+        page_ids = self.get_subtree_ids()
+        unpublished_pages = []
+
+        def page_unpublished_handler(sender, instance, **kwargs):
+            unpublished_pages.append(instance)
+
+        page_unpublished.connect(page_unpublished_handler)
+        try:
+            DeletePageAction(self.child_index, user=self.user).execute_in_background()
+        finally:
+            page_unpublished.disconnect(page_unpublished_handler)
+
+        # The descendants are marked as not live with a single query, but are still
+        # unpublished as far as frontend caches and sitemaps are concerned
+        self.assertEqual(
+            sorted(page.id for page in unpublished_pages), sorted(page_ids)
+        )
+        for page in unpublished_pages:
+            self.assertFalse(page.live)
+            self.assertIs(type(page), page.specific_class)
+
+    @override_settings(WAGTAILADMIN_BACKGROUND_PAGE_DELETION_LIMIT=7)
+    def test_after_delete_page_hooks(self):
+        after_delete_page = mock.Mock(return_value=None)
+        after_delete_page_in_background = mock.Mock(return_value=None)
+
+        with (
+            self.register_hook("after_delete_page", after_delete_page),
+            self.register_hook(
+                "after_delete_page_in_background", after_delete_page_in_background
+            ),
+        ):
+            with self.captureOnCommitCallbacks() as callbacks:
+                self.client.post(
+                    reverse("wagtailadmin_pages:delete", args=(self.child_index.id,))
+                )
+
+            # Nothing has been deleted yet
+            after_delete_page.assert_not_called()
+            after_delete_page_in_background.assert_not_called()
+
+            for callback in callbacks:
+                callback()
+
+        after_delete_page.assert_not_called()
+        after_delete_page_in_background.assert_called_once()
+        page, user = after_delete_page_in_background.call_args.args
+        self.assertEqual(page.title, "Hello index")
+        self.assertEqual(user, self.user)
+
+    @override_settings(WAGTAILADMIN_BACKGROUND_PAGE_DELETION_LIMIT=8)
+    def test_below_limit_deletes_immediately(self):
+        with self.captureOnCommitCallbacks():
+            response = self.client.post(
+                reverse("wagtailadmin_pages:delete", args=(self.child_index.id,)),
+            )
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Page.objects.filter(id=self.child_index.id).exists())
+        self.assertFalse(PendingPageDeletion.objects.exists())
+
+    def test_progress(self):
+        PendingPageDeletion.objects.create(
+            page=self.child_index, user=self.user, total_pages=7, deleted_pages=3
+        )
+        response = self.client.get(
+            reverse("wagtailadmin_pages:delete", args=(self.child_index.id,))
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "wagtailadmin/pages/delete_progress.html")
+        self.assertContains(response, "3 of 7 pages have been deleted so far.")
+
+    def test_resume(self):
+        PendingPageDeletion.objects.create(
+            page=self.child_index, user=self.user, total_pages=7
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("wagtailadmin_pages:delete", args=(self.child_index.id,))
+            )
+        self.assertRedirects(
+            response,
+            reverse("wagtailadmin_pages:delete", args=(self.child_index.id,)),
+            target_status_code=404,
+        )
+        self.assertFalse(Page.objects.filter(id=self.child_index.id).exists())
+        self.assertFalse(any(Page.find_problems()))
+
+    def test_delete_in_batches(self):
+        page_ids = self.get_subtree_ids()
+        action = DeletePageAction(self.child_index, user=self.user)
+        pending_deletion = action.execute_in_background()
+        self.assertEqual(pending_deletion.total_pages, 7)
+
+        # Interrupt the deletion after the first batch
+        log_deletions = DeletePageAction.log_deletions
+        batches = []
+
+        def interrupt_after_first_batch(action, pages):
+            if batches:
+                raise RuntimeError("Interrupted")
+            batches.append(pages)
+            log_deletions(action, pages)
+
+        with mock.patch.object(
+            DeletePageAction, "log_deletions", interrupt_after_first_batch
+        ):
+            with self.assertRaises(RuntimeError):
+                action.delete_in_batches(batch_size=2)
+
+        # The deepest pages are deleted first, leaving a consistent tree
+        pending_deletion.refresh_from_db()
+        self.assertEqual(pending_deletion.deleted_pages, 2)
+        self.assertEqual(
+            Page.objects.filter(id__in=page_ids, depth=5).count(),
+            1,
+        )
+        self.assertFalse(any(Page.find_problems()))
+
+        # Resuming completes the deletion
+        action.delete_in_batches(batch_size=2)
+        self.assertFalse(Page.objects.filter(id__in=page_ids).exists())
+        self.assertFalse(PendingPageDeletion.objects.exists())
+        self.assertFalse(any(Page.find_problems()))
+        self.assertEqual(
+            PageLogEntry.objects.filter(action="wagtail.delete").count(), 7
+        )
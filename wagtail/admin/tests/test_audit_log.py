@@ -419,6 +419,31 @@ class TestAuditLogAdmin(AdminTemplateTestUtils, WagtailTestUtils, TestCase):
         self.assertContains(response, "About", 3)  # create, save draft, delete
         self.assertContains(response, "Deleted", 2)
 
+    def test_site_history_include_archive(self):
+        self._update_page(self.hello_page)
+        PageLogEntry.objects.filter(action="wagtail.edit").update(
+            timestamp=timezone.now() - timedelta(days=400)
+        )
+        call_command("archive_log_entries", stdout=StringIO())
+
+        site_history_url = reverse("wagtailadmin_reports:site_history")
+        self.login(user=self.administrator)
+
+        response = self.client.get(site_history_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "Draft saved")
+
+        response = self.client.get(site_history_url, {"include_archive": "true"})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Draft saved", 2)
+        self.assertContains(response, "Include archived entries")
+
+        # Filters are applied to the archived entries too
+        response = self.client.get(
+            site_history_url, {"include_archive": "true", "action": "wagtail.publish"}
+        )
+        self.assertNotContains(response, "Draft saved")
+
     def test_history_with_deleted_user(self):
         self._update_page(self.hello_page)
 
@@ -1,6 +1,10 @@
-from django.test import TestCase
+from unittest import mock
 
-from wagtail.admin.paginator import WagtailPaginator
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from wagtail.admin.paginator import WagtailPaginator, get_estimated_count
+from wagtail.models import Page
 
 
 class TestWagtailPaginator(TestCase):
@@ -84,3 +88,83 @@ class TestWagtailPaginator(TestCase):
                 expected_elided_page_range,
                 f"Elided page range failed for total_pages={total_pages}, current_page={current_page}, num_page_buttons={num_page_buttons}",
             )
+
+
+@override_settings(WAGTAILADMIN_ESTIMATED_COUNT_THRESHOLD=10)
+class TestEstimatedCount(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        self.queryset = Page.objects.order_by("pk")
+        self.total = self.queryset.count()
+
+    def get_paginator(self, estimate, per_page=5):
+        paginator = WagtailPaginator(self.queryset, per_page)
+        patcher = mock.patch(
+            "wagtail.admin.paginator.get_estimated_count", return_value=estimate
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return paginator
+
+    def test_get_estimated_count(self):
+        estimate = get_estimated_count(self.queryset)
+        if connection.vendor == "postgresql":
+            self.assertIsInstance(estimate, int)
+        else:
+            self.assertIsNone(estimate)
+        self.assertIsNone(get_estimated_count(list(self.queryset)))
+
+    def test_estimated_count(self):
+        estimate = (self.total // 5) * 5
+        paginator = self.get_paginator(estimate)
+        with self.assertNumQueries(0):
+            self.assertEqual(paginator.count, estimate)
+            self.assertTrue(paginator.count_is_estimated)
+            self.assertEqual(paginator.items_count_label, f"About {estimate} pages")
+
+        # the exact count is only fetched on demand
+        with self.assertNumQueries(1):
+            self.assertEqual(paginator.exact_count, self.total)
+        self.assertEqual(paginator.count, estimate)
+
+    @override_settings(WAGTAILADMIN_ESTIMATED_COUNT_THRESHOLD=None)
+    def test_disabled(self):
+        paginator = self.get_paginator(1000)
+        self.assertEqual(paginator.count, self.total)
+        self.assertFalse(paginator.count_is_estimated)
+
+    def test_below_threshold(self):
+        paginator = self.get_paginator(9)
+        self.assertEqual(paginator.count, self.total)
+        self.assertFalse(paginator.count_is_estimated)
+
+    def test_page_consistent_with_estimate(self):
+        # an estimate that gives the same number of pages as the real count
+        estimate = ((self.total - 1) // 5) * 5 + 1
+        paginator = self.get_paginator(estimate)
+        with self.assertNumQueries(1):
+            page = paginator.get_page(2)
+        self.assertTrue(paginator.count_is_estimated)
+        self.assertEqual(paginator.count, estimate)
+        self.assertEqual(list(page), list(self.queryset[5:10]))
+        self.assertTrue(page.has_next())
+        self.assertTrue(page.has_previous())
+
+    def test_estimate_too_low(self):
+        paginator = self.get_paginator(10)
+        page = paginator.get_page(3)
+        self.assertFalse(paginator.count_is_estimated)
+        self.assertEqual(paginator.count, self.total)
+        self.assertEqual(page.number, 3)
+        self.assertEqual(list(page), list(self.queryset[10:15]))
+        self.assertEqual(paginator.items_count_label, f"{self.total} pages")
+
+    def test_estimate_too_high(self):
+        paginator = self.get_paginator(self.total * 10)
+        page = paginator.get_page(1000)
+        self.assertFalse(paginator.count_is_estimated)
+        self.assertEqual(paginator.count, self.total)
+        # falls back to the last page
+        self.assertEqual(page.number, paginator.num_pages)
+        self.assertFalse(page.has_next())
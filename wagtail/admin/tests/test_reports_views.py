@@ -1,4 +1,6 @@
 import datetime
+import shutil
+import tempfile
 from io import BytesIO
 from unittest import mock
 
@@ -14,6 +16,7 @@ from django.utils import timezone, translation
 from freezegun import freeze_time
 from openpyxl import load_workbook
 
+from wagtail.admin.models import SpreadsheetExport
 from wagtail.admin.views.mixins import ExcelDateFormatter
 from wagtail.admin.views.reports import page_types_usage
 from wagtail.admin.views.reports.audit_logging import LogEntriesView
@@ -277,6 +280,38 @@ class TestLockedPagesView(BaseReportViewTestCase):
                 "Root,2013-01-01 12:00:00,live,Page,2013-02-01 12:00:00,test@email.com\r",
             )
 
+    def test_csv_export_in_background(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+
+        page = Page.objects.get(id=2)
+        page.locked = True
+        page.locked_by = self.user
+        page.locked_at = timezone.now()
+        page.save()
+
+        with override_settings(
+            WAGTAILADMIN_BACKGROUND_EXPORT_LIMIT=1, MEDIA_ROOT=media_root
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.get(params={"export": "csv", "locked_by": self.user.pk})
+
+            self.assertRedirects(response, self.url + f"?locked_by={self.user.pk}")
+            export = SpreadsheetExport.objects.get()
+            self.assertEqual(export.view_name, "wagtailadmin_reports:locked_pages")
+            self.assertEqual(
+                export.query_string, f"export=csv&locked_by={self.user.pk}"
+            )
+            self.assertIsNotNone(export.completed_at)
+
+            response = self.client.get(
+                reverse("wagtailadmin_spreadsheet_export", args=(export.pk,))
+            )
+            data_lines = response.getvalue().decode().split("\r\n")
+
+        self.assertEqual(data_lines[0], "Title,Updated,Status,Type,Locked at,Locked by")
+        self.assertTrue(data_lines[1].startswith("Welcome to your new Wagtail site!,"))
+
     def test_xlsx_export(self):
         self.page = Page.objects.first()
         self.page.locked = True
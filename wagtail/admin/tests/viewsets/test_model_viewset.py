@@ -1,13 +1,20 @@
 import datetime
+import shutil
+import tempfile
 from io import BytesIO
 
 from django.conf import settings
+from django.contrib import messages
 from django.contrib.admin.utils import quote
 from django.contrib.auth import get_permission_codename
 from django.contrib.auth.models import Permission
 from django.contrib.contenttypes.models import ContentType
-from django.test import TestCase
-from django.urls import NoReverseMatch, reverse
+from django.core import mail
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.storage import InMemoryStorage, default_storage
+from django.test import TestCase, override_settings
+from django.urls import NoReverseMatch, reverse, set_script_prefix
+from django.utils import timezone
 from django.utils.formats import date_format, localize
 from django.utils.html import escape
 from django.utils.timezone import make_aware
@@ -15,6 +22,8 @@ from openpyxl import load_workbook
 
 from wagtail import hooks
 from wagtail.admin.admin_url_finder import AdminURLFinder
+from wagtail.admin.models import SpreadsheetExport, get_spreadsheet_export_storage
+from wagtail.admin.tasks import get_spreadsheet_export_request
 from wagtail.log_actions import log
 from wagtail.models import ModelLogEntry
 from wagtail.test.testapp.models import (
@@ -704,6 +713,190 @@ class TestListExport(WagtailTestUtils, TestCase):
         self.assertEqual(len(cell_array), 3)
 
 
+@override_settings(WAGTAILADMIN_BACKGROUND_EXPORT_LIMIT=3)
+class TestBackgroundListExport(WagtailTestUtils, TestCase):
+    def setUp(self):
+        self.user = self.login()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    @classmethod
+    def setUpTestData(cls):
+        FeatureCompleteToy.objects.create(
+            name="Racecar",
+            release_date=datetime.date(1995, 11, 19),
+        )
+        FeatureCompleteToy.objects.create(
+            name="LEVEL",
+            release_date=datetime.date(2010, 6, 18),
+        )
+        FeatureCompleteToy.objects.create(
+            name="Catso",
+            release_date=datetime.date(2010, 6, 18),
+        )
+
+    def export(self, params):
+        index_url = reverse("feature_complete_toy:index")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.get(index_url, params)
+        return response
+
+    def test_small_export_is_inline(self):
+        response = self.export({"release_date": "2010-06-18", "export": "csv"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.get("Content-Disposition"),
+            'attachment; filename="feature-complete-toys.csv"',
+        )
+        self.assertFalse(SpreadsheetExport.objects.exists())
+
+    def test_csv_export(self):
+        response = self.export({"export": "csv", "q": ""})
+
+        self.assertRedirects(response, reverse("feature_complete_toy:index") + "?q=")
+
+        export = SpreadsheetExport.objects.get()
+        self.assertEqual(export.user, self.user)
+        self.assertIsNotNone(export.completed_at)
+        self.assertEqual(export.filename, "feature-complete-toys.csv")
+
+        download_url = reverse("wagtailadmin_spreadsheet_export", args=(export.pk,))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, [self.user.email])
+        self.assertIn(download_url, mail.outbox[0].body)
+
+        response = self.client.get(download_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.get("Content-Disposition"),
+            'attachment; filename="feature-complete-toys.csv"',
+        )
+        data_lines = response.getvalue().decode().strip().split("\r\n")
+        self.assertEqual(
+            data_lines,
+            [
+                "Name,Launch date,Is cool",
+                "Catso,2010-06-18,False",
+                "LEVEL,2010-06-18,True",
+                "Racecar,1995-11-19,",
+            ],
+        )
+
+    def test_xlsx_export(self):
+        response = self.export({"export": "xlsx"})
+
+        self.assertRedirects(response, reverse("feature_complete_toy:index"))
+
+        export = SpreadsheetExport.objects.get()
+        response = self.client.get(
+            reverse("wagtailadmin_spreadsheet_export", args=(export.pk,))
+        )
+        self.assertEqual(response.status_code, 200)
+        worksheet = load_workbook(filename=BytesIO(response.getvalue())).active
+        cell_array = [[cell.value for cell in row] for row in worksheet.rows]
+        self.assertEqual(cell_array[0], ["Name", "Launch date", "Is cool"])
+        self.assertEqual(cell_array[3], ["Racecar", datetime.date(1995, 11, 19), None])
+        self.assertEqual(len(cell_array), 4)
+
+    def test_download_by_other_user(self):
+        self.export({"export": "csv"})
+        export = SpreadsheetExport.objects.get()
+
+        other_user = self.create_superuser("other", password="password")
+        self.login(user=other_user)
+        response = self.client.get(
+            reverse("wagtailadmin_spreadsheet_export", args=(export.pk,))
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_export_records_view(self):
+        self.export({"export": "csv", "q": "", "ordering": "-name"})
+
+        export = SpreadsheetExport.objects.get()
+        self.assertEqual(export.view_name, "feature_complete_toy:index")
+        self.assertEqual(export.view_args, [])
+        self.assertEqual(export.view_kwargs, {})
+        self.assertEqual(export.query_string, "export=csv&q=&ordering=-name")
+
+    def test_export_with_script_name(self):
+        self.addCleanup(set_script_prefix, "/")
+        index_url = reverse("feature_complete_toy:index")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.get(
+                index_url, {"export": "csv"}, SCRIPT_NAME="/prefix"
+            )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response["Location"], "/prefix" + index_url)
+        export = SpreadsheetExport.objects.get()
+        self.assertIsNotNone(export.completed_at)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_export_request_supports_session_and_messages(self):
+        export = SpreadsheetExport.objects.create(
+            user=self.user, view_name="feature_complete_toy:index", query_string="q=a"
+        )
+
+        request = get_spreadsheet_export_request(export)
+
+        self.assertEqual(request.path_info, reverse("feature_complete_toy:index"))
+        self.assertEqual(request.GET["q"], "a")
+        self.assertEqual(request.user, self.user)
+        self.assertEqual(request.resolver_match.view_name, "feature_complete_toy:index")
+        request.session["key"] = "value"
+        messages.info(request, "Hello")
+        self.assertEqual(
+            [str(message) for message in messages.get_messages(request)], ["Hello"]
+        )
+
+    def test_stale_exports_are_deleted(self):
+        self.export({"export": "csv"})
+        export = SpreadsheetExport.objects.get()
+        SpreadsheetExport.objects.update(
+            created_at=timezone.now() - datetime.timedelta(days=8)
+        )
+
+        self.export({"export": "csv"})
+
+        self.assertFalse(SpreadsheetExport.objects.filter(pk=export.pk).exists())
+        self.assertFalse(export.file.storage.exists(export.file.name))
+        self.assertEqual(SpreadsheetExport.objects.count(), 1)
+
+
+class TestSpreadsheetExportStorage(TestCase):
+    def test_storage_setting_absent(self):
+        self.assertEqual(get_spreadsheet_export_storage(), default_storage)
+
+    @override_settings(
+        STORAGES={
+            **settings.STORAGES,
+            "exports": {
+                "BACKEND": "django.core.files.storage.InMemoryStorage",
+            },
+        },
+        WAGTAILADMIN_EXPORT_STORAGE="exports",
+    )
+    def test_storage_setting_given_alias(self):
+        self.assertIsInstance(get_spreadsheet_export_storage(), InMemoryStorage)
+
+    @override_settings(
+        WAGTAILADMIN_EXPORT_STORAGE="django.core.files.storage.InMemoryStorage"
+    )
+    def test_storage_setting_given_dotted_path(self):
+        self.assertIsInstance(get_spreadsheet_export_storage(), InMemoryStorage)
+
+    @override_settings(WAGTAILADMIN_EXPORT_STORAGE="invalid")
+    def test_storage_setting_invalid(self):
+        with self.assertRaises(ImproperlyConfigured):
+            get_spreadsheet_export_storage()
+
+
 class TestPagination(WagtailTestUtils, TestCase):
     def setUp(self):
         self.user = self.login()
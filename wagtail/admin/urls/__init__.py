@@ -16,7 +16,14 @@ from wagtail.admin.urls import pages as wagtailadmin_pages_urls
 from wagtail.admin.urls import password_reset as wagtailadmin_password_reset_urls
 from wagtail.admin.urls import reports as wagtailadmin_reports_urls
 from wagtail.admin.urls import workflows as wagtailadmin_workflows_urls
-from wagtail.admin.views import account, chooser, dismissibles, home, tags
+from wagtail.admin.views import (
+    account,
+    chooser,
+    dismissibles,
+    home,
+    spreadsheet_exports,
+    tags,
+)
 from wagtail.admin.views.bulk_action import index as bulk_actions
 from wagtail.admin.views.generic.preview import StreamFieldBlockPreview
 from wagtail.admin.views.i18n import localized_js_catalog
@@ -122,6 +129,11 @@ urlpatterns = [
             namespace="wagtailadmin_editing_sessions",
         ),
     ),
+    path(
+        "exports/<int:export_id>/",
+        spreadsheet_exports.download,
+        name="wagtailadmin_spreadsheet_export",
+    ),
     path(
         "block-preview/",
         StreamFieldBlockPreview.as_view(),
@@ -1,12 +1,18 @@
 import csv
 import datetime
+import io
+import tempfile
 from collections import OrderedDict
 from functools import partial
-from io import BytesIO
 
+from django.conf import settings
+from django.contrib import messages
 from django.contrib.admin.utils import label_for_field
 from django.core.exceptions import FieldDoesNotExist
-from django.http import FileResponse, StreamingHttpResponse
+from django.core.files import File
+from django.db import models, transaction
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.shortcuts import redirect
 from django.utils import timezone
 from django.utils.dateformat import Formatter
 from django.utils.encoding import force_str
@@ -160,6 +166,12 @@ class SpreadsheetExportMixin:
 
     export_filename = "spreadsheet-export"
 
+    # The number of items fetched from the database at a time when exporting
+    export_chunk_size = 2000
+
+    # Spreadsheets are written to a temporary file on disk once they exceed this size
+    export_spool_max_size = 1024 * 1024
+
     def setup(self, request, *args, **kwargs):
         super().setup(request, *args, **kwargs)
         self.is_export = request.GET.get("export") in self.FORMATS
@@ -173,6 +185,20 @@ class SpreadsheetExportMixin:
         """Gets the base filename for the exported spreadsheet, without extensions"""
         return self.export_filename
 
+    def get_background_export_limit(self):
+        """
+        Returns the number of items from which the spreadsheet is generated by a
+        background task rather than within the request, or ``None`` to always
+        generate it within the request
+        """
+        return getattr(settings, "WAGTAILADMIN_BACKGROUND_EXPORT_LIMIT", None)
+
+    def iter_export_items(self, queryset):
+        """Iterates over the items to export, fetching them from the database in chunks"""
+        if isinstance(queryset, models.QuerySet) and queryset._result_cache is None:
+            return queryset.iterator(chunk_size=self.export_chunk_size)
+        return queryset
+
     def to_row_dict(self, item):
         """Returns an OrderedDict (in the order given by list_export) of the exportable information for a model instance"""
         row_dict = OrderedDict(
@@ -241,7 +267,7 @@ class SpreadsheetExportMixin:
             {field: self.get_heading(queryset, field) for field in self.list_export}
         )
 
-        for item in queryset:
+        for item in self.iter_export_items(queryset):
             yield self.write_csv_row(writer, self.to_row_dict(item))
 
     def write_xlsx(self, queryset, output):
@@ -256,7 +282,7 @@ class SpreadsheetExportMixin:
         )
 
         date_format = ExcelDateFormatter().get()
-        for item in queryset:
+        for item in self.iter_export_items(queryset):
             worksheet.append(
                 self.generate_xlsx_row(
                     worksheet, self.to_row_dict(item), date_format=date_format
@@ -267,7 +293,7 @@ class SpreadsheetExportMixin:
 
     def write_xlsx_response(self, queryset):
         """Write an xlsx file from a queryset and return a FileResponse"""
-        output = BytesIO()
+        output = tempfile.SpooledTemporaryFile(max_size=self.export_spool_max_size)
         self.write_xlsx(queryset, output)
         output.seek(0)
 
@@ -287,8 +313,82 @@ class SpreadsheetExportMixin:
         )
         return response
 
+    def write_spreadsheet_export(self, queryset, spreadsheet_format, export):
+        """Write a spreadsheet from a queryset to the file of a ``SpreadsheetExport``"""
+        with tempfile.TemporaryFile() as output:
+            if spreadsheet_format == self.FORMAT_CSV:
+                text_output = io.TextIOWrapper(output, encoding="utf-8", newline="")
+                writer = csv.DictWriter(text_output, fieldnames=self.list_export)
+                writer.writerow(
+                    {
+                        field: self.get_heading(queryset, field)
+                        for field in self.list_export
+                    }
+                )
+                for item in self.iter_export_items(queryset):
+                    self.write_csv_row(writer, self.to_row_dict(item))
+                text_output.detach()
+            else:
+                self.write_xlsx(queryset, output)
+
+            output.seek(0)
+            export.file.save(
+                f"{self.get_filename()}.{spreadsheet_format}", File(output), save=False
+            )
+
+        return HttpResponse()
+
+    def should_export_in_background(self, queryset):
+        limit = self.get_background_export_limit()
+        if limit is None:
+            return False
+
+        if isinstance(queryset, list):
+            return len(queryset) >= limit
+        return queryset.count() >= limit
+
+    def start_background_export(self):
+        """
+        Enqueue a task to generate the spreadsheet, which emails the user a link to
+        download it once it is ready, and redirect back to the listing
+        """
+        from wagtail.admin.models import SpreadsheetExport
+        from wagtail.admin.tasks import export_spreadsheet_task
+
+        resolver_match = self.request.resolver_match
+        export = SpreadsheetExport.objects.create(
+            user=self.request.user,
+            view_name=resolver_match.view_name,
+            view_args=list(resolver_match.args),
+            view_kwargs=resolver_match.kwargs,
+            query_string=self.request.GET.urlencode(),
+        )
+        transaction.on_commit(partial(export_spreadsheet_task.enqueue, export.pk))
+
+        messages.success(
+            self.request,
+            _(
+                "Your spreadsheet is being prepared. "
+                "You will receive an email with a link to download it when it is ready."
+            ),
+        )
+
+        params = self.request.GET.copy()
+        del params["export"]
+        if params:
+            return redirect(self.request.path + "?" + params.urlencode())
+        return redirect(self.request.path)
+
     def as_spreadsheet(self, queryset, spreadsheet_format):
         """Return a response with a spreadsheet representing the exported data from queryset, in the format specified"""
+        # Set on requests made by the background export task
+        export = getattr(self.request, "spreadsheet_export", None)
+        if export is not None:
+            return self.write_spreadsheet_export(queryset, spreadsheet_format, export)
+
+        if self.should_export_in_background(queryset):
+            return self.start_background_export()
+
         if spreadsheet_format == self.FORMAT_CSV:
             return self.write_csv_response(queryset)
         elif spreadsheet_format == self.FORMAT_XLSX:
@@ -37,6 +37,11 @@ class PageBulkAction(BulkAction):
 
         return listing_objects
 
+    def get_queryset(self, model, object_ids):
+        pages = super().get_queryset(model, object_ids)
+        Page.objects.annotate_permissions_for_user(pages, self.request.user)
+        return pages
+
     def object_context(self, obj):
         context = super().object_context(obj)
         # Make 'item' into the specific instance, so that custom get_admin_display_title methods are respected
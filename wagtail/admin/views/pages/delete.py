@@ -12,11 +12,12 @@ from wagtail.actions.delete_page import DeletePageAction
 from wagtail.admin import messages
 from wagtail.admin.utils import get_valid_next_url_from_request
 from wagtail.admin.views.pages.utils import type_to_delete_confirmation
-from wagtail.models import Page, ReferenceIndex
+from wagtail.models import Page, PendingPageDeletion, ReferenceIndex
 
 
 class DeleteView(TemplateView):
     template_name = "wagtailadmin/pages/confirm_delete.html"
+    progress_template_name = "wagtailadmin/pages/delete_progress.html"
 
     @method_decorator(transaction.atomic)
     def dispatch(self, request, page_id, *args, **kwargs):
@@ -31,6 +32,9 @@ class DeleteView(TemplateView):
                 return result
 
         self.next_url = get_valid_next_url_from_request(request)
+        self.pending_deletion = PendingPageDeletion.objects.filter(
+            page=self.page
+        ).first()
 
         self.pages_to_delete = {self.page}
 
@@ -49,38 +53,79 @@ class DeleteView(TemplateView):
         ).group_by_source_object()
         return super().dispatch(request, page_id, *args, **kwargs)
 
+    def get_template_names(self):
+        if self.pending_deletion:
+            return [self.progress_template_name]
+        return super().get_template_names()
+
+    def should_delete_in_background(self, page):
+        limit = getattr(settings, "WAGTAILADMIN_BACKGROUND_PAGE_DELETION_LIMIT", None)
+        return limit is not None and (page.get_descendant_count() + 1) >= limit
+
+    def delete_page(self, page):
+        """
+        Delete the given page, returning True if it is being deleted by a
+        background task rather than immediately.
+        """
+        action = DeletePageAction(page, user=self.request.user)
+        # Permission checks are done above, so skip them in execute.
+        if self.should_delete_in_background(page):
+            action.execute_in_background(skip_permission_checks=True)
+            return True
+        action.execute(skip_permission_checks=True)
+        return False
+
     def post(self, request, *args, **kwargs):
         if self.usage.is_protected:
             raise PermissionDenied
 
+        if self.pending_deletion:
+            # Resume a deletion that has been interrupted
+            DeletePageAction(self.page, user=request.user).execute_in_background(
+                skip_permission_checks=True
+            )
+            return redirect("wagtailadmin_pages:delete", self.page.id)
+
         if not type_to_delete_confirmation(request):
             return self.render_to_response(self.get_context_data())
 
         parent_id = self.page.get_parent().id
         # Delete the source page.
-        action = DeletePageAction(self.page, user=request.user)
-        # Permission checks are done above, so skip them in execute.
-        action.execute(skip_permission_checks=True)
+        in_background = self.delete_page(self.page)
 
         # Delete translation and alias pages if they have the same parent page.
         if getattr(settings, "WAGTAIL_I18N_ENABLED", False):
             parent_page_translations = self.page.get_parent().get_translations()
             for page_or_alias in self.pages_to_delete:
                 if page_or_alias.get_parent() in parent_page_translations:
-                    action = DeletePageAction(page_or_alias, user=request.user)
-                    # Permission checks are done above, so skip them in execute.
-                    action.execute(skip_permission_checks=True)
-
-        messages.success(
-            request,
-            _("Page '%(page_title)s' deleted.")
-            % {"page_title": self.page.get_admin_display_title()},
-        )
-
-        for fn in hooks.get_hooks("after_delete_page"):
-            result = fn(request, self.page)
-            if hasattr(result, "status_code"):
-                return result
+                    self.delete_page(page_or_alias)
+
+        if in_background:
+            # The page hasn't been deleted yet, so the after_delete_page hooks are
+            # not called; the after_delete_page_in_background hooks are called by
+            # the background task instead, once the deletion has completed
+            messages.success(
+                request,
+                _("Page '%(page_title)s' is being deleted.")
+                % {"page_title": self.page.get_admin_display_title()},
+                buttons=[
+                    messages.button(
+                        reverse("wagtailadmin_pages:delete", args=(self.page.id,)),
+                        _("View progress"),
+                    )
+                ],
+            )
+        else:
+            messages.success(
+                request,
+                _("Page '%(page_title)s' deleted.")
+                % {"page_title": self.page.get_admin_display_title()},
+            )
+
+            for fn in hooks.get_hooks("after_delete_page"):
+                result = fn(request, self.page)
+                if hasattr(result, "status_code"):
+                    return result
 
         if self.next_url:
             return redirect(self.next_url)
@@ -90,6 +135,7 @@ class DeleteView(TemplateView):
         descendant_count = self.page.get_descendant_count()
         return {
             "page": self.page,
+            "pending_deletion": self.pending_deletion,
             "descendant_count": descendant_count,
             "next": self.next_url,
             "model_opts": self.page._meta,
@@ -263,6 +263,10 @@ class PageListingMixin:
         if any(isinstance(column, ParentPageColumn) for column in self.columns):
             Page.objects.annotate_parent_page(context["object_list"])
 
+        Page.objects.annotate_permissions_for_user(
+            context["object_list"], self.request.user
+        )
+
         return context
 
 
@@ -2,10 +2,12 @@ import datetime
 from collections import defaultdict
 
 import django_filters
+from django import forms
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import IntegerField, Value
 from django.utils.encoding import force_str
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from wagtail.admin.admin_url_finder import AdminURLFinder
@@ -58,9 +60,22 @@ class SiteHistoryReportFilterSet(PageHistoryFilterSet):
         queryset=lambda request: get_content_types_for_filter(request.user),
     )
 
+    include_archive = django_filters.ChoiceFilter(
+        label=_("Include archived entries"),
+        choices=[("true", _("Yes"))],
+        empty_label=_("No"),
+        method="filter_include_archive",
+        widget=forms.RadioSelect,
+    )
+
     def filter_object_type(self, queryset, name, value):
         return queryset.filter_on_content_type(value)
 
+    def filter_include_archive(self, queryset, name, value):
+        # Archived entries are added to the report by LogEntriesView, as they are
+        # stored in separate models
+        return queryset
+
     def get_action_choices(self):
         return get_actions_for_filter(self.request.user)
 
@@ -113,6 +128,24 @@ class LogEntriesView(ReportView):
     def get_filename(self):
         return "audit-log-{}".format(datetime.datetime.today().strftime("%Y-%m-%d"))
 
+    @cached_property
+    def include_archive(self):
+        return bool(
+            self.filters
+            and self.filters.is_valid()
+            and self.filters.form.cleaned_data.get("include_archive")
+        )
+
+    def get_log_models(self):
+        log_models = list(log_action_registry.get_log_entry_models())
+        if self.include_archive:
+            log_models += [
+                archive_model
+                for log_model in log_models
+                if (archive_model := log_model.get_archive_model()) is not None
+            ]
+        return log_models
+
     def get_filtered_queryset(self):
         """
         Since this report combines records from multiple log models, the standard pattern of
@@ -135,10 +168,11 @@ class LogEntriesView(ReportView):
         """
         queryset = None
 
-        # Retrieve the set of registered log models, and cast it to a list so that we assign
-        # an index number to each one; this index number will be used to distinguish models
-        # in the combined results
-        self.log_models = list(log_action_registry.get_log_entry_models())
+        # Retrieve the set of registered log models (and their archive models, if the
+        # report includes archived entries) as a list so that we assign an index number
+        # to each one; this index number will be used to distinguish models in the
+        # combined results
+        self.log_models = self.get_log_models()
 
         for log_model_index, log_model in enumerate(self.log_models):
             sub_queryset = (
@@ -0,0 +1,16 @@
+from django.http import FileResponse
+from django.shortcuts import get_object_or_404
+
+from wagtail.admin.models import SpreadsheetExport
+
+
+def download(request, export_id):
+    export = get_object_or_404(
+        SpreadsheetExport,
+        pk=export_id,
+        user=request.user,
+        completed_at__isnull=False,
+    )
+    return FileResponse(
+        export.file.open("rb"), as_attachment=True, filename=export.filename
+    )
@@ -6,6 +6,7 @@ from functools import lru_cache
 from importlib import import_module
 
 from django import forms
+from django.conf import settings
 from django.core import checks
 from django.core.exceptions import ImproperlyConfigured
 from django.template.loader import render_to_string
@@ -14,6 +15,7 @@ from django.utils.functional import cached_property
 from django.utils.html import format_html
 from django.utils.safestring import mark_safe
 from django.utils.text import capfirst
+from django.utils.translation import get_language
 
 from wagtail.admin.staticfiles import versioned_static
 from wagtail.admin.telepath import JSContext
@@ -701,6 +703,15 @@ class DeclarativeSubBlocksMetaclass(BaseBlock):
 # ========================
 
 
+# Packed block definitions, keyed by (definition_prefix, language code). Only populated
+# when WAGTAILADMIN_CACHE_BLOCK_DEFINITIONS is enabled.
+_packed_block_definitions = {}
+
+
+def clear_packed_block_definitions_cache():
+    _packed_block_definitions.clear()
+
+
 @register_telepath_adapter
 class BlockWidget(forms.Widget):
     """Wraps a block object as a widget so that it can be incorporated into a Django form"""
@@ -712,12 +723,26 @@ class BlockWidget(forms.Widget):
         self._block_json = None
 
     def _build_block_json(self):
+        use_cache = getattr(settings, "WAGTAILADMIN_CACHE_BLOCK_DEFINITIONS", False)
+        if use_cache:
+            cache_key = (self.block_def.definition_prefix, get_language())
+            try:
+                self._js_context, self._block_json = _packed_block_definitions[
+                    cache_key
+                ]
+                return
+            except KeyError:
+                pass
+
         try:
             self._js_context = JSContext()
             self._block_json = json.dumps(self._js_context.pack(self.block_def))
         except Exception as e:  # noqa: BLE001
             raise ValueError("Error while serializing block definition: %s" % e) from e
 
+        if use_cache:
+            _packed_block_definitions[cache_key] = (self._js_context, self._block_json)
+
     @property
     def js_context(self):
         if self._js_context is None:
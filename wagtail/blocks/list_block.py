@@ -86,9 +86,15 @@ class ListBlockValidationError(ValidationError):
 class ListValue(MutableSequence):
     """
     The native data type used by ListBlock. Behaves as a list of values, but also provides
-    a bound_blocks property giving access to block IDs
+    a bound_blocks property giving access to block IDs.
+
+    When constructed from plain values (and optionally a parallel list of IDs), the
+    ListChild wrappers are not created until bound_blocks is first accessed, so that
+    read-only access such as template rendering only holds the values themselves.
     """
 
+    __slots__ = ("list_block", "_bound_blocks", "_values", "_ids")
+
     class ListChild(BoundBlock):
         # a wrapper for list values that keeps track of the associated block type and ID
         def __init__(self, *args, **kwargs):
@@ -103,21 +109,52 @@ class ListValue(MutableSequence):
                 "id": self.id,
             }
 
-    def __init__(self, list_block, values=None, bound_blocks=None):
+    def __init__(self, list_block, values=None, bound_blocks=None, ids=None):
         self.list_block = list_block
 
         if bound_blocks is not None:
-            self.bound_blocks = bound_blocks
-        elif values is not None:
-            self.bound_blocks = [
-                ListValue.ListChild(self.list_block.child_block, value)
-                for value in values
-            ]
+            self._bound_blocks = bound_blocks
+            self._values = None
+            self._ids = None
         else:
-            self.bound_blocks = []
+            self._bound_blocks = None
+            self._values = list(values) if values is not None else []
+            self._ids = ids
+
+    @property
+    def bound_blocks(self):
+        if self._bound_blocks is None:
+            child_block = self.list_block.child_block
+            if self._ids is None:
+                self._bound_blocks = [
+                    ListValue.ListChild(child_block, value) for value in self._values
+                ]
+            else:
+                self._bound_blocks = [
+                    ListValue.ListChild(child_block, value, id=id)
+                    for value, id in zip(self._values, self._ids)
+                ]
+            self._values = None
+            self._ids = None
+        return self._bound_blocks
+
+    @bound_blocks.setter
+    def bound_blocks(self, bound_blocks):
+        self._bound_blocks = bound_blocks
+        self._values = None
+        self._ids = None
 
     def __getitem__(self, i):
-        return self.bound_blocks[i].value
+        if self._bound_blocks is None:
+            return self._values[i]
+        if isinstance(i, slice):
+            return [bb.value for bb in self._bound_blocks[i]]
+        return self._bound_blocks[i].value
+
+    def __iter__(self):
+        if self._bound_blocks is None:
+            return iter(self._values)
+        return (bb.value for bb in self._bound_blocks)
 
     def __setitem__(self, i, item):
         self.bound_blocks[i] = ListValue.ListChild(self.list_block.child_block, item)
@@ -126,7 +163,9 @@ class ListValue(MutableSequence):
         del self.bound_blocks[i]
 
     def __len__(self):
-        return len(self.bound_blocks)
+        if self._bound_blocks is None:
+            return len(self._values)
+        return len(self._bound_blocks)
 
     def insert(self, i, item):
         self.bound_blocks.insert(
@@ -134,7 +173,7 @@ class ListValue(MutableSequence):
         )
 
     def __repr__(self):
-        return f"<ListValue: {[bb.value for bb in self.bound_blocks]!r}>"
+        return f"<ListValue: {list(self)!r}>"
 
 
 class ListBlock(Block):
@@ -289,18 +328,11 @@ class ListBlock(Block):
             for item in value
         ]
         converted_values = self.child_block.bulk_to_python(raw_values)
-        bound_blocks = []
-        for i, item in enumerate(value):
-            if self._item_is_in_block_format(item):
-                list_item_id = item["id"]
-            else:
-                list_item_id = None
-            bound_blocks.append(
-                ListValue.ListChild(
-                    self.child_block, converted_values[i], id=list_item_id
-                )
-            )
-        return ListValue(self, bound_blocks=bound_blocks)
+        ids = [
+            item["id"] if self._item_is_in_block_format(item) else None
+            for item in value
+        ]
+        return ListValue(self, values=converted_values, ids=ids)
 
     def bulk_to_python(self, values):
         # 'values' is a list of lists of child block values; concatenate them into one list so that
@@ -323,19 +355,17 @@ class ListBlock(Block):
         offset = 0
         values = list(values)
         for i, sublist_len in enumerate(lengths):
-            bound_blocks = []
-            for j in range(sublist_len):
-                if self._item_is_in_block_format(values[i][j]):
-                    list_item_id = values[i][j]["id"]
-                else:
-                    list_item_id = None
-                bound_blocks.append(
-                    ListValue.ListChild(
-                        self.child_block, converted_values[offset + j], id=list_item_id
-                    )
+            ids = [
+                item["id"] if self._item_is_in_block_format(item) else None
+                for item in values[i]
+            ]
+            result.append(
+                ListValue(
+                    self,
+                    values=converted_values[offset : offset + sublist_len],
+                    ids=ids,
                 )
-
-            result.append(ListValue(self, bound_blocks=bound_blocks))
+            )
             offset += sublist_len
 
         return result
@@ -1,4 +1,5 @@
 import collections
+from collections.abc import Mapping, MutableMapping
 from typing import Union
 
 from django import forms
@@ -29,6 +30,7 @@ __all__ = [
     "BaseStructBlock",
     "StructBlock",
     "StructValue",
+    "CompactStructValue",
     "StructBlockValidationError",
 ]
 
@@ -227,6 +229,106 @@ class StructValue(collections.OrderedDict):
         return (self.__class__, (self.block,), None, None, iter(self.items()))
 
 
+_MISSING = object()
+
+
+class CompactStructValue(MutableMapping):
+    """
+    A memory-efficient alternative to StructValue. Rather than holding a dict per value,
+    child values are stored in a list aligned with the block's child block names, which
+    are shared between all values of the same block. Keys that do not correspond to a
+    child block are kept in a separate dict that is only created when needed.
+
+    Iteration follows the order of the block's child blocks, followed by any other keys
+    in insertion order. To use, set ``value_class = CompactStructValue`` (or a subclass)
+    on the StructBlock's ``Meta``.
+    """
+
+    __slots__ = ("block", "_values", "_extra", "_bound_blocks")
+
+    def __init__(self, block, *args):
+        self.block = block
+        self._values = [_MISSING] * len(block._child_block_indexes)
+        self._extra = None
+        self._bound_blocks = None
+        if args:
+            (items,) = args
+            if isinstance(items, Mapping):
+                items = items.items()
+            for name, value in items:
+                self[name] = value
+
+    def __getitem__(self, key):
+        index = self.block._child_block_indexes.get(key)
+        if index is None:
+            if self._extra is None:
+                raise KeyError(key)
+            return self._extra[key]
+        value = self._values[index]
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        index = self.block._child_block_indexes.get(key)
+        if index is None:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+        else:
+            self._values[index] = value
+
+    def __delitem__(self, key):
+        index = self.block._child_block_indexes.get(key)
+        if index is None:
+            if self._extra is None:
+                raise KeyError(key)
+            del self._extra[key]
+        elif self._values[index] is _MISSING:
+            raise KeyError(key)
+        else:
+            self._values[index] = _MISSING
+
+    def __iter__(self):
+        for name, value in zip(self.block._child_block_indexes, self._values):
+            if value is not _MISSING:
+                yield name
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        count = len(self._values) - self._values.count(_MISSING)
+        if self._extra:
+            count += len(self._extra)
+        return count
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict(self.items())!r})"
+
+    def __html__(self):
+        return self.block.render(self)
+
+    def render_as_block(self, context=None):
+        return self.block.render(self, context=context)
+
+    @property
+    def bound_blocks(self):
+        if self._bound_blocks is None:
+            self._bound_blocks = collections.OrderedDict(
+                [
+                    (name, block.bind(self.get(name)))
+                    for name, block in self.block.child_blocks.items()
+                ]
+            )
+        return self._bound_blocks
+
+    def copy(self):
+        return self.__class__(self.block, self.items())
+
+    def __reduce__(self):
+        return (self.__class__, (self.block,), None, None, iter(self.items()))
+
+
 class PlaceholderBoundBlock(BoundBlock):
     """
     Provides a render_form method that outputs a block placeholder, for use in custom form_templates
@@ -262,6 +364,12 @@ class BaseStructBlock(Block):
             for name in (sorted_block_names + missing_block_names)
         )
 
+    @cached_property
+    def _child_block_indexes(self):
+        # mapping of child block name to position, shared by all CompactStructValue
+        # instances belonging to this block
+        return {name: index for index, name in enumerate(self.child_blocks)}
+
     @classmethod
     def construct_from_lookup(cls, lookup, child_blocks, **kwargs):
         if child_blocks:
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wagtailforms", "0005_alter_formsubmission_form_data"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="formsubmission",
+            index=models.Index(
+                fields=["page", "submit_time"], name="wagtailforms_page_submit_idx"
+            ),
+        ),
+    ]
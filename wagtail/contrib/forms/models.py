@@ -4,6 +4,8 @@ import os
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import validate_email
 from django.db import models
+from django.db.models import Count
+from django.db.models.fields.json import KeyTextTransform
 from django.template.response import TemplateResponse
 from django.utils.formats import date_format
 from django.utils.translation import gettext_lazy as _
@@ -70,6 +72,14 @@ class AbstractFormSubmission(models.Model):
 class FormSubmission(AbstractFormSubmission):
     """Data for a Form submission."""
 
+    class Meta(AbstractFormSubmission.Meta):
+        indexes = [
+            models.Index(
+                fields=["page", "submit_time"],
+                name="wagtailforms_page_submit_idx",
+            ),
+        ]
+
 
 class AbstractFormField(Orderable):
     """
@@ -237,6 +247,19 @@ class FormMixin:
     def get_submissions(self):
         return self.get_submission_class()._default_manager.filter(page=self)
 
+    def get_submission_value_counts(self, field_name):
+        """
+        Returns a dict of the number of submissions for each value of the form field
+        ``field_name``, counted by the database.
+        """
+        return dict(
+            self.get_submissions()
+            .order_by()
+            .values(value=KeyTextTransform(field_name, "form_data"))
+            .annotate(count=Count("pk"))
+            .values_list("value", "count")
+        )
+
     def get_submissions_list_view_class(self):
         from .views import SubmissionsListView
 
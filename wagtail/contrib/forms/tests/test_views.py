@@ -13,6 +13,7 @@ from django.utils.http import urlencode
 from openpyxl import load_workbook
 
 from wagtail.admin.forms import WagtailAdminPageForm
+from wagtail.admin.models import SpreadsheetExport
 from wagtail.admin.panels import get_form_for_model
 from wagtail.contrib.forms.models import FormSubmission
 from wagtail.contrib.forms.panels import FormSubmissionsPanel
@@ -699,6 +700,90 @@ class TestFormsSubmissionsList(WagtailTestUtils, TestCase):
         first_row_values = response.context["data_rows"][0]["fields"]
         self.assertIn("this is a really old message", first_row_values)
 
+    def test_list_submissions_ordering_by_form_field(self):
+        list_url = reverse("wagtailforms:list_submissions", args=(self.form_page.id,))
+
+        response = self.client.get(list_url, {"order_by": "your_email"})
+        emails = [row["fields"][1] for row in response.context["data_rows"]]
+        self.assertEqual(emails, ["new@example.com", "old@example.com"])
+        soup = self.get_soup(response.content)
+        self.assertIsNotNone(soup.select_one("a[href='?order_by=-your_email']"))
+
+        response = self.client.get(list_url, {"order_by": "-your_email"})
+        emails = [row["fields"][1] for row in response.context["data_rows"]]
+        self.assertEqual(emails, ["old@example.com", "new@example.com"])
+
+    def test_list_submissions_ordering_by_number_and_date_fields(self):
+        FormSubmission.objects.filter(page=self.form_page).delete()
+        FormField.objects.create(
+            page=self.form_page, sort_order=4, label="Your age", field_type="number"
+        )
+        FormField.objects.create(
+            page=self.form_page, sort_order=5, label="Your birthday", field_type="date"
+        )
+        for age, birthday in [("9", "2017-02-01"), ("10", "2016-11-30")]:
+            FormSubmission.objects.create(
+                page=self.form_page,
+                form_data={
+                    "your_email": f"{age}@example.com",
+                    "your_message": "hello",
+                    "your_age": age,
+                    "your_birthday": birthday,
+                },
+            )
+        list_url = reverse("wagtailforms:list_submissions", args=(self.form_page.id,))
+
+        # Numbers are compared by value rather than as text
+        response = self.client.get(list_url, {"order_by": "your_age"})
+        emails = [row["fields"][1] for row in response.context["data_rows"]]
+        self.assertEqual(emails, ["9@example.com", "10@example.com"])
+
+        response = self.client.get(list_url, {"order_by": "-your_birthday"})
+        emails = [row["fields"][1] for row in response.context["data_rows"]]
+        self.assertEqual(emails, ["9@example.com", "10@example.com"])
+
+    def make_colour_field(self):
+        FormField.objects.create(
+            page=self.form_page,
+            sort_order=4,
+            label="Your colour",
+            field_type="radio",
+            choices="red,green",
+        )
+        for colour in ["red", "green", "red"]:
+            FormSubmission.objects.create(
+                page=self.form_page,
+                form_data={
+                    "your_email": f"{colour}@example.com",
+                    "your_message": "colourful",
+                    "your_colour": colour,
+                },
+            )
+
+    def test_list_submissions_filtering_by_form_field(self):
+        self.make_colour_field()
+        list_url = reverse("wagtailforms:list_submissions", args=(self.form_page.id,))
+
+        response = self.client.get(list_url, {"your_colour": "red"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [row["fields"][1] for row in response.context["data_rows"]],
+            ["red@example.com", "red@example.com"],
+        )
+        soup = self.get_soup(response.content)
+        self.assertIsNotNone(
+            soup.select_one("select[name='your_colour'] option[value='green']")
+        )
+
+    def test_submission_value_counts(self):
+        self.make_colour_field()
+
+        self.assertEqual(
+            self.form_page.get_submission_value_counts("your_colour"),
+            {"red": 2, "green": 1, None: 2},
+        )
+
 
 class TestFormsSubmissionsExport(WagtailTestUtils, TestCase):
     def setUp(self):
@@ -768,6 +853,29 @@ class TestFormsSubmissionsExport(WagtailTestUtils, TestCase):
                 "2014-01-01 12:00:00,new@example.com,this is a fairly new message,\r",
             )
 
+    @override_settings(WAGTAILADMIN_BACKGROUND_EXPORT_LIMIT=1)
+    def test_list_submissions_csv_export_in_background(self):
+        list_url = reverse("wagtailforms:list_submissions", args=(self.form_page.id,))
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.get(list_url, {"export": "csv"})
+
+        self.assertRedirects(response, list_url)
+        export = SpreadsheetExport.objects.get()
+        self.addCleanup(export.file.delete)
+        self.assertEqual(
+            export.filename, f"{self.form_page.slug}-export-{datetime.date.today()}.csv"
+        )
+
+        response = self.client.get(
+            reverse("wagtailadmin_spreadsheet_export", args=(export.pk,))
+        )
+        data_lines = response.getvalue().decode().split("\n")
+        self.assertEqual(
+            data_lines[0], "Submission date,Your email,Your message,Your choices\r"
+        )
+        self.assertIn("old@example.com", data_lines[1])
+        self.assertIn("new@example.com", data_lines[2])
+
     def test_list_submissions_xlsx_export(self):
         response = self.client.get(
             reverse("wagtailforms:list_submissions", args=(self.form_page.id,)),
@@ -1764,12 +1872,15 @@ class TestFormsWithCustomSubmissionsList(WagtailTestUtils, TestCase):
 
         # test that paginate by 50 is working, should be 3 max pages (~120 values)
         self.assertContains(response, "Page 2 of 3")
-        self.assertContains(response, "Wet my pants excited!", count=50)
+        soup = self.get_soup(response.content)
+        # The choice also appears in the filter for the field
+        self.assertEqual(
+            str(soup.select_one("table.listing")).count("Wet my pants excited!"), 50
+        )
         self.assertEqual(response.context["page_obj"].number, 2)
 
         # The delete form should have a 'next' input that points back to the list page
         # with the same pagination querystring
-        soup = self.get_soup(response.content)
         delete_url = reverse(
             "wagtailforms:delete_submissions", args=(self.form_page.id,)
         )
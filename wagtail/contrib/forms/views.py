@@ -4,14 +4,19 @@ from collections import OrderedDict
 from django.contrib.admin.utils import quote
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
+from django.db.models import DateField, DateTimeField, FloatField
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Cast
+from django.db.models.lookups import Exact
 from django.forms import CheckboxSelectMultiple
 from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
-from django.utils.functional import classproperty
+from django.utils.functional import cached_property, classproperty
 from django.utils.translation import gettext, gettext_lazy, ngettext
 from django.views.generic import TemplateView
-from django_filters import DateFromToRangeFilter
+from django_filters import ChoiceFilter, DateFromToRangeFilter
+from django_filters.constants import EMPTY_VALUES
 
 from wagtail.admin import messages
 from wagtail.admin.filters import (
@@ -194,6 +199,15 @@ class DeleteSubmissionsView(TemplateView):
         return context
 
 
+class FormDataChoiceFilter(ChoiceFilter):
+    """Filters submissions by the value of a form field within their form data"""
+
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+        return qs.filter(Exact(KeyTextTransform(self.field_name, "form_data"), value))
+
+
 class SubmissionsListFilterSet(WagtailFilterSet):
     date = DateFromToRangeFilter(
         label=gettext_lazy("Submission date"),
@@ -201,6 +215,33 @@ class SubmissionsListFilterSet(WagtailFilterSet):
         widget=DateRangePickerWidget,
     )
 
+    # Types of form fields with a fixed set of values, which submissions can be
+    # filtered by
+    choice_field_types = ("dropdown", "radio")
+
+    def __init__(self, *args, form_page=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if form_page is not None:
+            self._add_form_data_filters(form_page)
+
+    def _add_form_data_filters(self, form_page):
+        form_fields = form_page.get_form_fields()
+        form_builder = form_page.form_builder(form_fields)
+        for field in form_fields:
+            if getattr(field, "field_type", None) not in self.choice_field_types:
+                continue
+            if field.clean_name in self.filters:
+                continue
+
+            filter_ = FormDataChoiceFilter(
+                label=field.label,
+                field_name=field.clean_name,
+                choices=form_builder.get_formatted_field_choices(field),
+            )
+            filter_.model = self.queryset.model
+            filter_.parent = self
+            self.filters[field.clean_name] = filter_
+
 
 class SubmissionsListView(SpreadsheetExportMixin, BaseListingView):
     """Lists submissions for the provided form page"""
@@ -215,6 +256,13 @@ class SubmissionsListView(SpreadsheetExportMixin, BaseListingView):
         "id",
         "submit_time",
     )  # used to validate ordering in URL
+    # Fields that the values of form fields are cast to when ordering by them,
+    # by field type. Values of other types are compared as text.
+    form_field_ordering_output_fields = {
+        "number": FloatField(),
+        "date": DateField(),
+        "datetime": DateTimeField(),
+    }
     page_title = gettext_lazy("Form data")
     header_icon = "form"
     paginate_by = 20
@@ -243,15 +291,51 @@ class SubmissionsListView(SpreadsheetExportMixin, BaseListingView):
     def get_filterset_kwargs(self):
         kwargs = super().get_filterset_kwargs()
         kwargs["queryset"] = self.get_base_queryset()
+        kwargs["form_page"] = self.form_page
         return kwargs
 
     def get_base_queryset(self):
         """Return queryset of form submissions"""
         return self.form_page.get_submissions()
 
+    @cached_property
+    def form_fields(self):
+        return self.form_page.get_form_fields()
+
+    @cached_property
+    def form_field_names(self):
+        return [field.clean_name for field in self.form_fields]
+
+    def get_form_field_ordering_expression(self, name):
+        """
+        Return the expression used to order submissions by the value of the form
+        field with the given name. Values are stored as JSON strings, so number and
+        date values are cast to be compared by value rather than as text.
+        """
+        value = KeyTextTransform(name, "form_data")
+        field_type = next(
+            (
+                getattr(field, "field_type", None)
+                for field in self.form_fields
+                if field.clean_name == name
+            ),
+            None,
+        )
+        output_field = self.form_field_ordering_output_fields.get(field_type)
+        if output_field is not None:
+            return Cast(value, output_field)
+        return value
+
+    def get_orderable_fields(self):
+        """
+        Return the names of the fields submissions can be ordered by, including the
+        fields of the form, which are ordered by their value in the form data
+        """
+        return [*(self.orderable_fields or ()), *self.form_field_names]
+
     def get_validated_ordering(self):
         """Return a dict of field names with ordering labels if ordering is valid"""
-        orderable_fields = self.orderable_fields or ()
+        orderable_fields = self.get_orderable_fields()
         ordering = {}
         if self.is_export:
             #  Revert to CSV order_by submit_time ascending for backwards compatibility
@@ -275,8 +359,14 @@ class SubmissionsListView(SpreadsheetExportMixin, BaseListingView):
 
     def get_ordering(self):
         """Return the field or fields to use for ordering the queryset"""
-        ordering = self.get_validated_ordering()
-        return [values[0] + name for name, values in ordering.items()]
+        ordering = []
+        for name, (prefix, label) in self.get_validated_ordering().items():
+            if name in (self.orderable_fields or ()):
+                ordering.append(prefix + name)
+            else:
+                value = self.get_form_field_ordering_expression(name)
+                ordering.append(value.desc() if prefix == "-" else value.asc())
+        return ordering
 
     def get_filename(self):
         """Returns the base filename for the generated spreadsheet data file"""
@@ -340,7 +430,7 @@ class SubmissionsListView(SpreadsheetExportMixin, BaseListingView):
                 data_rows.append({"model_id": submission.id, "fields": data_row})
             # Build data_headings as list of dicts containing model_id and fields
             ordering_by_field = self.get_validated_ordering()
-            orderable_fields = self.orderable_fields
+            orderable_fields = self.get_orderable_fields()
             data_headings = []
             for name, label in data_fields:
                 order_label = None
@@ -1,15 +1,26 @@
 from django.apps import apps
 
-from wagtail.contrib.frontend_cache.utils import purge_page_from_cache
+from wagtail.contrib.frontend_cache.utils import (
+    get_active_purge_batch,
+    purge_page_from_cache,
+)
 from wagtail.signals import page_published, page_unpublished
 
 
+def _purge_page(page):
+    batch = get_active_purge_batch()
+    if batch is not None:
+        batch.add_page(page)
+    else:
+        purge_page_from_cache(page)
+
+
 def page_published_signal_handler(instance, **kwargs):
-    purge_page_from_cache(instance)
+    _purge_page(instance)
 
 
 def page_unpublished_signal_handler(instance, **kwargs):
-    purge_page_from_cache(instance)
+    _purge_page(instance)
 
 
 def register_signal_handlers():
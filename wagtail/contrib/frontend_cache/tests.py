@@ -22,6 +22,7 @@ from wagtail.test.testapp.models import EventIndex, EventPage
 
 from .utils import (
     PurgeBatch,
+    batch_page_purges,
     purge_page_from_cache,
     purge_pages_from_cache,
     purge_url_from_cache,
@@ -700,6 +701,29 @@ class TestCachePurgingSignals(TestCase):
             PURGED_URLS, {"http://localhost/events/", "http://localhost/events/past/"}
         )
 
+    def test_purge_on_publish_in_batch(self):
+        events_index = EventIndex.objects.get(url_path="/home/events/")
+        christmas = EventPage.objects.get(url_path="/home/events/christmas/")
+
+        with mock.patch(
+            "wagtail.contrib.frontend_cache.signal_handlers.purge_page_from_cache"
+        ) as purge_page_from_cache:
+            with self.captureOnCommitCallbacks(execute=True):
+                with batch_page_purges():
+                    events_index.save_revision().publish()
+                    christmas.save_revision().publish()
+                    self.assertEqual(PURGED_URLS, set())
+
+        purge_page_from_cache.assert_not_called()
+        self.assertEqual(
+            PURGED_URLS,
+            {
+                "http://localhost/events/",
+                "http://localhost/events/past/",
+                "http://localhost/events/christmas/",
+            },
+        )
+
     def test_purge_with_unroutable_page(self):
         with self.captureOnCommitCallbacks(execute=True):
             root = Page.objects.get(url_path="/")
@@ -1,11 +1,15 @@
 import logging
+from contextlib import contextmanager
 
+from asgiref.local import Local
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.utils.module_loading import import_string
 
 logger = logging.getLogger("wagtail.frontendcache")
 
+_active = Local()
+
 
 class InvalidFrontendCacheBackendError(ImproperlyConfigured):
     pass
@@ -231,3 +235,34 @@ class PurgeBatch:
           will only be sent to these backends
         """
         purge_urls_from_cache(self.urls, backend_settings, backends)
+
+
+def get_active_purge_batch():
+    """
+    Return the ``PurgeBatch`` collecting page purges within ``batch_page_purges``,
+    or None if purges are not currently being batched.
+    """
+    return getattr(_active, "purge_batch", None)
+
+
+@contextmanager
+def batch_page_purges(backend_settings=None, backends=None):
+    """
+    Within this context, pages that would be purged from the frontend cache when
+    they are published or unpublished are instead collected, and purged in a
+    single batch on exit. This avoids sending a purge request for each page
+    during bulk operations.
+    """
+    if get_active_purge_batch() is not None:
+        # Already batching; the outermost context will purge the pages
+        yield
+        return
+
+    batch = PurgeBatch()
+    _active.purge_batch = batch
+    try:
+        yield
+    finally:
+        del _active.purge_batch
+
+    batch.purge(backend_settings, backends)
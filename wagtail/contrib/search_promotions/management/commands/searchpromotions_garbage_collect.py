@@ -4,13 +4,21 @@ from wagtail.contrib.search_promotions import models
 
 
 class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=models.GARBAGE_COLLECT_BATCH_SIZE,
+            help="Number of records to delete at a time",
+        )
+
     def handle(self, **options):
         # Clean daily hits
         self.stdout.write("Cleaning daily hits records…")
-        models.QueryDailyHits.garbage_collect()
+        models.QueryDailyHits.garbage_collect(batch_size=options["batch_size"])
         self.stdout.write("Done")
 
         # Clean queries
         self.stdout.write("Cleaning query records…")
-        models.Query.garbage_collect()
+        models.Query.garbage_collect(batch_size=options["batch_size"])
         self.stdout.write("Done")
@@ -1,12 +1,104 @@
+import atexit
 import datetime
+import logging
+import threading
+import time
+from collections import Counter
+from functools import reduce
+from operator import or_
 
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from wagtail.search.utils import MAX_QUERY_STRING_LENGTH, normalise_query_string
 
+logger = logging.getLogger("wagtail.search_promotions")
+
+# The number of records deleted at a time by the garbage_collect methods
+GARBAGE_COLLECT_BATCH_SIZE = 1000
+
+
+def delete_in_batches(queryset, batch_size):
+    """
+    Deletes the objects in ``queryset`` in batches of ``batch_size``, and returns the
+    total number of objects deleted.
+    """
+    deleted = 0
+    while True:
+        pks = list(queryset.values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            return deleted
+        deleted += queryset.model.objects.filter(pk__in=pks).delete()[0]
+
+
+def get_hits_flush_interval():
+    return getattr(settings, "WAGTAILSEARCH_HITS_FLUSH_INTERVAL", None)
+
+
+class QueryHitBuffer:
+    """
+    Counts search query hits in memory, and adds them to the database in bulk at
+    most every ``WAGTAILSEARCH_HITS_FLUSH_INTERVAL`` seconds, so that popular
+    queries don't require an update of the same record on every search.
+
+    Hits are counted separately in each process, and any remaining hits are added
+    when the process exits.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hits = Counter()
+        self.last_flushed_at = time.monotonic()
+        self.registered_atexit = False
+
+    def add(self, query_id, date):
+        with self.lock:
+            self.hits[(query_id, date)] += 1
+            due = time.monotonic() - self.last_flushed_at >= get_hits_flush_interval()
+            if due:
+                # Reset the interval now, so that the flush is only scheduled once.
+                # If the transaction is rolled back, the hits are kept until the
+                # next flush.
+                self.last_flushed_at = time.monotonic()
+
+            if not self.registered_atexit:
+                atexit.register(self.flush)
+                self.registered_atexit = True
+
+        if due:
+            # Don't add to the time taken by the current transaction, or hold its
+            # locks for longer, by flushing once it has been committed
+            transaction.on_commit(self.flush)
+
+    def flush(self):
+        with self.lock:
+            hits, self.hits = self.hits, Counter()
+            self.last_flushed_at = time.monotonic()
+
+        if not hits:
+            return
+
+        try:
+            # Queries may have been deleted since their hits were counted
+            query_ids = set(
+                Query.objects.filter(
+                    pk__in={query_id for query_id, date in hits}
+                ).values_list("pk", flat=True)
+            )
+            hits = {key: count for key, count in hits.items() if key[0] in query_ids}
+
+            QueryDailyHits.add_hits(hits)
+        except Exception:
+            logger.exception("Failed to add %d search query hits", sum(hits.values()))
+            # Keep the hits to be added on the next flush
+            with self.lock:
+                self.hits.update(hits)
+
+
+query_hit_buffer = QueryHitBuffer()
+
 
 class Query(models.Model):
     query_string = models.CharField(max_length=MAX_QUERY_STRING_LENGTH, unique=True)
@@ -20,11 +112,11 @@ class Query(models.Model):
     def add_hit(self, date=None):
         if date is None:
             date = timezone.now().date()
-        daily_hits, created = QueryDailyHits.objects.get_or_create(
-            query=self, date=date
-        )
-        daily_hits.hits = models.F("hits") + 1
-        daily_hits.save()
+
+        if get_hits_flush_interval() is None:
+            QueryDailyHits.add_hits({(self.pk, date): 1})
+        else:
+            query_hit_buffer.add(self.pk, date)
 
     def __str__(self):
         return self.query_string
@@ -35,18 +127,15 @@ class Query(models.Model):
         return hits if hits else 0
 
     @classmethod
-    def garbage_collect(cls):
+    def garbage_collect(cls, batch_size=GARBAGE_COLLECT_BATCH_SIZE):
         """
         Deletes all Query records that have no daily hits or editors picks
         """
-        extra_filter_kwargs = (
-            {
-                "editors_picks__isnull": True,
-            }
-            if hasattr(cls, "editors_picks")
-            else {}
+        queryset = cls.objects.filter(
+            ~models.Exists(QueryDailyHits.objects.filter(query=models.OuterRef("pk"))),
+            ~models.Exists(SearchPromotion.objects.filter(query=models.OuterRef("pk"))),
         )
-        cls.objects.filter(daily_hits__isnull=True, **extra_filter_kwargs).delete()
+        return delete_in_batches(queryset, batch_size)
 
     @classmethod
     def get(cls, query_string):
@@ -80,7 +169,41 @@ class QueryDailyHits(models.Model):
     hits = models.IntegerField(default=0)
 
     @classmethod
-    def garbage_collect(cls, days=None):
+    def add_hits(cls, hits):
+        """
+        Adds to the number of hits of several queries at once. ``hits`` is a dict of
+        the number of hits to add, keyed by ``(query_id, date)`` tuples.
+
+        Missing records are created with a single insert, and the hits are then
+        added with a single update for every 500 records.
+        """
+        keys = list(hits)
+        with transaction.atomic():
+            cls.objects.bulk_create(
+                [cls(query_id=query_id, date=date) for query_id, date in keys],
+                ignore_conflicts=True,
+            )
+
+            for start in range(0, len(keys), 500):
+                conditions = [
+                    (models.Q(query_id=query_id, date=date), hits[(query_id, date)])
+                    for query_id, date in keys[start : start + 500]
+                ]
+                cls.objects.filter(
+                    reduce(or_, (condition for condition, count in conditions))
+                ).update(
+                    hits=models.F("hits")
+                    + models.Case(
+                        *(
+                            models.When(condition, then=models.Value(count))
+                            for condition, count in conditions
+                        ),
+                        default=models.Value(0),
+                    )
+                )
+
+    @classmethod
+    def garbage_collect(cls, days=None, batch_size=GARBAGE_COLLECT_BATCH_SIZE):
         """
         Deletes all QueryDailyHits records that are older than a set number of days
         """
@@ -89,7 +212,7 @@ class QueryDailyHits(models.Model):
         )
         min_date = timezone.now().date() - datetime.timedelta(days)
 
-        cls.objects.filter(date__lt=min_date).delete()
+        return delete_in_batches(cls.objects.filter(date__lt=min_date), batch_size)
 
     class Meta:
         unique_together = (("query", "date"),)
@@ -1,11 +1,14 @@
 import json
+import time
 from datetime import date, datetime, timedelta
 from io import BytesIO, StringIO
+from unittest import mock
 
 from django.contrib.auth.models import Permission
 from django.core import management
+from django.db import DatabaseError
 from django.db.models import F
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 from openpyxl import load_workbook
@@ -15,7 +18,9 @@ from wagtail.admin.tests.test_reports_views import BaseReportViewTestCase
 from wagtail.contrib.search_promotions.models import (
     Query,
     QueryDailyHits,
+    QueryHitBuffer,
     SearchPromotion,
+    query_hit_buffer,
 )
 from wagtail.contrib.search_promotions.templatetags.wagtailsearchpromotions_tags import (
     get_search_promotions,
@@ -1496,6 +1501,19 @@ class TestGarbageCollectManagementCommand(TestCase):
             0,
         )
 
+    def test_garbage_collect_in_batches(self):
+        old_hit_date = date.today() - timedelta(days=14)
+        for i in range(5):
+            Query.get(f"Hello {i}").add_hit(date=old_hit_date)
+        Query.get("World").add_hit()
+
+        self.assertEqual(QueryDailyHits.garbage_collect(batch_size=2), 5)
+        self.assertEqual(Query.garbage_collect(batch_size=2), 5)
+
+        self.assertEqual(
+            list(Query.objects.values_list("query_string", flat=True)), ["world"]
+        )
+
 
 class TestQueryChooserView(WagtailTestUtils, TestCase):
     def setUp(self):
@@ -1545,6 +1563,100 @@ class TestHitCounter(TestCase):
         # Test
         self.assertEqual(Query.get("Hello").hits, 10)
 
+    def test_add_hits(self):
+        hello = Query.get("Hello")
+        world = Query.get("World")
+        today = timezone.now().date()
+        yesterday = today - timedelta(days=1)
+        hello.add_hit()
+
+        with self.assertNumQueries(4):
+            QueryDailyHits.add_hits(
+                {
+                    (hello.pk, today): 2,
+                    (hello.pk, yesterday): 3,
+                    (world.pk, today): 1,
+                }
+            )
+
+        self.assertEqual(hello.hits, 6)
+        self.assertEqual(hello.daily_hits.get(date=yesterday).hits, 3)
+        self.assertEqual(world.hits, 1)
+
+
+@override_settings(WAGTAILSEARCH_HITS_FLUSH_INTERVAL=60)
+class TestBufferedHitCounter(TestCase):
+    def setUp(self):
+        query_hit_buffer.hits.clear()
+        query_hit_buffer.last_flushed_at = time.monotonic()
+
+    def test_hits_are_buffered(self):
+        hello = Query.get("Hello")
+
+        with self.assertNumQueries(0):
+            for i in range(10):
+                hello.add_hit()
+        self.assertEqual(hello.hits, 0)
+
+        query_hit_buffer.flush()
+
+        self.assertEqual(hello.hits, 10)
+        self.assertEqual(query_hit_buffer.hits, {})
+
+    def test_hits_flushed_after_interval(self):
+        hello = Query.get("Hello")
+        hello.add_hit()
+        query_hit_buffer.last_flushed_at -= 60
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            hello.add_hit()
+            hello.add_hit()
+
+        # The hits are added once the transaction has been committed, and the
+        # flush is only scheduled once
+        self.assertEqual(hello.hits, 0)
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        self.assertEqual(hello.hits, 3)
+
+    def test_failed_flush_is_logged(self):
+        hello = Query.get("Hello")
+        hello.add_hit()
+
+        with mock.patch.object(
+            QueryDailyHits, "add_hits", side_effect=DatabaseError("Deadlock")
+        ):
+            with self.assertLogs("wagtail.search_promotions", level="ERROR") as logs:
+                query_hit_buffer.flush()
+
+        self.assertIn("Failed to add 1 search query hits", logs.output[0])
+
+        # The hits are kept to be added on the next flush
+        query_hit_buffer.flush()
+        self.assertEqual(hello.hits, 1)
+
+    def test_atexit_registered_when_used(self):
+        buffer = QueryHitBuffer()
+        hello = Query.get("Hello")
+
+        with mock.patch("atexit.register") as register:
+            buffer.add(hello.pk, timezone.now().date())
+            buffer.add(hello.pk, timezone.now().date())
+
+        register.assert_called_once_with(buffer.flush)
+
+    def test_hits_for_deleted_queries_are_skipped(self):
+        hello = Query.get("Hello")
+        world = Query.get("World")
+        hello.add_hit()
+        world.add_hit()
+        world.delete()
+
+        query_hit_buffer.flush()
+
+        self.assertEqual(hello.hits, 1)
+        self.assertFalse(QueryDailyHits.objects.filter(query_id=world.pk).exists())
+
 
 class TestQueryStringNormalisation(TestCase):
     def setUp(self):
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from wagtail.models import Site
+
+from ...shards import SITEMAP_SHARD_SIZE, SitemapShardBuilder
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the sitemaps of all sites and store them for the sharded sitemap views"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--site",
+            type=int,
+            help="Only build the sitemap of the site with this ID",
+        )
+        parser.add_argument(
+            "--shard-size",
+            type=int,
+            default=SITEMAP_SHARD_SIZE,
+            help="Maximum number of pages in each sitemap",
+        )
+
+    def handle(self, **options):
+        sites = Site.objects.select_related("root_page").order_by("pk")
+        if options["site"] is not None:
+            sites = sites.filter(pk=options["site"])
+
+        for site in sites:
+            shards = SitemapShardBuilder(site, shard_size=options["shard_size"]).build()
+            if options["verbosity"] >= 1:
+                self.stdout.write(
+                    "Built %d sitemap(s) with %d URLs for %s"
+                    % (len(shards), sum(shard.url_count for shard in shards), site)
+                )
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("wagtailcore", "0100_pendingaliasupdate"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SitemapShard",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("number", models.PositiveIntegerField(verbose_name="number")),
+                (
+                    "first_path",
+                    models.CharField(max_length=255, verbose_name="first path"),
+                ),
+                (
+                    "file_name",
+                    models.CharField(max_length=255, verbose_name="file name"),
+                ),
+                (
+                    "url_count",
+                    models.PositiveIntegerField(default=0, verbose_name="URL count"),
+                ),
+                (
+                    "lastmod",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="last modified"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="updated at"),
+                ),
+                (
+                    "site",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="wagtailcore.site",
+                        verbose_name="site",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "sitemap shard",
+                "verbose_name_plural": "sitemap shards",
+                "ordering": ["site", "number"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("site", "number"), name="unique_sitemap_shard_number"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,51 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class SitemapShard(models.Model):
+    """
+    A part of a site's sitemap, built in advance and stored as a file. Each shard
+    covers the pages of the site with a tree path from ``first_path`` up to the
+    ``first_path`` of the next shard.
+    """
+
+    site = models.ForeignKey(
+        "wagtailcore.Site",
+        verbose_name=_("site"),
+        related_name="+",
+        on_delete=models.CASCADE,
+    )
+    number = models.PositiveIntegerField(verbose_name=_("number"))
+    first_path = models.CharField(verbose_name=_("first path"), max_length=255)
+    file_name = models.CharField(verbose_name=_("file name"), max_length=255)
+    url_count = models.PositiveIntegerField(verbose_name=_("URL count"), default=0)
+    lastmod = models.DateTimeField(
+        verbose_name=_("last modified"), null=True, blank=True
+    )
+    updated_at = models.DateTimeField(verbose_name=_("updated at"), auto_now=True)
+
+    class Meta:
+        verbose_name = _("sitemap shard")
+        verbose_name_plural = _("sitemap shards")
+        ordering = ["site", "number"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["site", "number"],
+                name="unique_sitemap_shard_number",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.site} sitemap {self.number}"
+
+    def get_next_first_path(self):
+        """
+        Return the ``first_path`` of the next shard of the site, which marks the end
+        of the pages in this shard, or ``None`` if this is the last shard.
+        """
+        return (
+            SitemapShard.objects.filter(site_id=self.site_id, number__gt=self.number)
+            .order_by("number")
+            .values_list("first_path", flat=True)
+            .first()
+        )
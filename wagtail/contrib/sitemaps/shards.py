@@ -0,0 +1,202 @@
+import datetime
+import itertools
+import tempfile
+
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.template.defaultfilters import date as date_filter
+from django.utils import timezone
+from django.utils.html import escape
+
+from .models import SitemapShard
+from .sitemap_generator import Sitemap
+
+# The maximum number of pages in each shard when a site's sitemap is built. This
+# leaves room for shards to grow as pages are published before the whole sitemap
+# needs to be rebuilt.
+SITEMAP_SHARD_SIZE = 10000
+
+# The number of pages fetched from the database at a time
+SITEMAP_CHUNK_SIZE = 500
+
+# Shards are written to a temporary file on disk once they exceed this size
+SPOOL_MAX_SIZE = 1024 * 1024
+
+
+def write_urlset(file, urls):
+    """
+    Write a sitemap ``<urlset>`` to the binary ``file``, in the same format as the
+    ``sitemap.xml`` template of ``django.contrib.sitemaps``. ``urls`` is an iterable
+    of the dictionaries returned by ``Page.get_sitemap_urls``, which is consumed one
+    URL at a time.
+
+    Returns a tuple of the number of URLs written, and the latest ``lastmod`` of the
+    URLs, or ``None`` if any of them doesn't have one.
+    """
+    file.write(
+        b'<?xml version="1.0" encoding="UTF-8"?>\n'
+        b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" '
+        b'xmlns:xhtml="http://www.w3.org/1999/xhtml">'
+    )
+
+    count = 0
+    last_mods = set()
+    for url in urls:
+        parts = ["<url><loc>", escape(url["location"]), "</loc>"]
+        lastmod = url.get("lastmod")
+        if lastmod:
+            parts += ["<lastmod>", date_filter(lastmod, "Y-m-d"), "</lastmod>"]
+        if url.get("changefreq"):
+            parts += ["<changefreq>", escape(url["changefreq"]), "</changefreq>"]
+        if url.get("priority"):
+            parts += ["<priority>", escape(url["priority"]), "</priority>"]
+        for alternate in url.get("alternates", []):
+            parts += [
+                '<xhtml:link rel="alternate" hreflang="',
+                escape(alternate["lang_code"]),
+                '" href="',
+                escape(alternate["location"]),
+                '"/>',
+            ]
+        parts.append("</url>")
+        file.write("".join(parts).encode())
+
+        count += 1
+        last_mods.add(lastmod)
+
+    file.write(b"</urlset>\n")
+
+    if last_mods and None not in last_mods:
+        return count, max(last_mods)
+    return count, None
+
+
+class SitemapShardBuilder:
+    """
+    Builds the sitemap of a site as a set of ``SitemapShard`` files in storage, so
+    that they can be served without querying the pages of the site.
+
+    Pages are fetched in order of their tree path, in chunks that start after the
+    path of the last page of the previous chunk, rather than with offsets. Each shard
+    covers up to ``shard_size`` pages, and is written to storage as it is generated.
+    """
+
+    def __init__(
+        self,
+        site,
+        sitemap_class=Sitemap,
+        shard_size=SITEMAP_SHARD_SIZE,
+        chunk_size=SITEMAP_CHUNK_SIZE,
+        storage=None,
+    ):
+        self.site = site
+        self.sitemap = sitemap_class(site=site)
+        self.shard_size = shard_size
+        self.chunk_size = chunk_size
+        self.storage = storage or default_storage
+
+    def get_file_name(self, number):
+        return f"sitemaps/{self.site.pk}/sitemap-{number}.xml"
+
+    def iter_pages(self, start="", end=None):
+        """
+        Iterate over the pages in the sitemap with a tree path from ``start`` up to
+        (but not including) ``end``.
+        """
+        queryset = self.sitemap.items().filter(path__gte=start)
+        if end is not None:
+            queryset = queryset.filter(path__lt=end)
+
+        chunk_queryset = queryset
+        while True:
+            pages = list(chunk_queryset[: self.chunk_size])
+            yield from pages
+            if len(pages) < self.chunk_size:
+                return
+            chunk_queryset = queryset.filter(path__gt=pages[-1].path)
+
+    def iter_urls(self, pages):
+        for page in pages:
+            yield from page.get_sitemap_urls(self.sitemap.request)
+
+    def write_shard(self, shard, pages):
+        """
+        Write the sitemap for ``pages`` to the file of ``shard``, and update its URL
+        count and last modification date (without saving it).
+        """
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as file:
+            url_count, lastmod = write_urlset(file, self.iter_urls(pages))
+            file.seek(0)
+
+            file_name = self.get_file_name(shard.number)
+            self.storage.delete(file_name)
+            shard.file_name = self.storage.save(file_name, File(file))
+
+        shard.url_count = url_count
+        # Custom get_sitemap_urls implementations may return dates
+        shard.lastmod = lastmod if isinstance(lastmod, datetime.datetime) else None
+
+    def build(self):
+        """
+        Build all the shards of the site's sitemap, replacing any existing ones.
+        Returns the list of shards.
+        """
+        shards = []
+        pages = self.iter_pages()
+        page = next(pages, None)
+
+        # The first shard starts at the beginning of the tree, so that it covers
+        # any pages added before the first page currently in the sitemap
+        shard = SitemapShard(site=self.site, number=1, first_path="")
+        while True:
+            shard_pages = (
+                itertools.chain([page], itertools.islice(pages, self.shard_size - 1))
+                if page is not None
+                else []
+            )
+            self.write_shard(shard, shard_pages)
+            shards.append(shard)
+
+            page = next(pages, None)
+            if page is None:
+                break
+
+            shard = SitemapShard(
+                site=self.site, number=shard.number + 1, first_path=page.path
+            )
+
+        with transaction.atomic():
+            old_file_names = set(
+                SitemapShard.objects.filter(site=self.site).values_list(
+                    "file_name", flat=True
+                )
+            )
+            SitemapShard.objects.filter(site=self.site).delete()
+            SitemapShard.objects.bulk_create(shards)
+
+        for file_name in old_file_names - {shard.file_name for shard in shards}:
+            self.storage.delete(file_name)
+
+        return shards
+
+    def rebuild_shard(self, shard):
+        """
+        Rebuild a single shard of the site's sitemap. If it has grown beyond the
+        number of URLs allowed in a sitemap, the whole sitemap is rebuilt instead.
+        """
+        started_at = timezone.now()
+        pages = self.iter_pages(shard.first_path, shard.get_next_first_path())
+        self.write_shard(shard, pages)
+
+        if shard.url_count > self.sitemap.limit:
+            self.build()
+        else:
+            # The shard may have been replaced by a rebuild of the whole sitemap in
+            # the meantime, in which case there is nothing to update
+            SitemapShard.objects.filter(pk=shard.pk).update(
+                file_name=shard.file_name,
+                url_count=shard.url_count,
+                lastmod=shard.lastmod,
+                updated_at=started_at,
+            )
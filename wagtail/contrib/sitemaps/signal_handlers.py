@@ -0,0 +1,117 @@
+from itertools import groupby
+
+from asgiref.local import Local
+from django.db import transaction
+from django.utils import timezone
+
+from wagtail.signals import (
+    page_published,
+    page_slug_changed,
+    page_unpublished,
+    post_page_move,
+    pre_page_move,
+)
+
+from .models import SitemapShard
+
+_pending = Local()
+
+
+def get_shards_for_page(page, include_descendants=False):
+    """
+    Return the sitemap shards of all the sites the page belongs to that cover the
+    page, and its descendants if ``include_descendants`` is true.
+    """
+    site_ids = [
+        site_root_path.site_id
+        for site_root_path in page._get_relevant_site_root_paths(cache_object=page)
+    ]
+    if not site_ids:
+        return []
+
+    shards = SitemapShard.objects.filter(site_id__in=site_ids).order_by(
+        "site_id", "number"
+    )
+
+    covering_shards = []
+    for site_id, site_shards in groupby(shards, key=lambda shard: shard.site_id):
+        site_shards = list(site_shards)
+        for shard, next_shard in zip(site_shards, site_shards[1:] + [None]):
+            starts_before = shard.first_path <= page.path or (
+                include_descendants and shard.first_path.startswith(page.path)
+            )
+            ends_after = next_shard is None or next_shard.first_path > page.path
+            if starts_before and ends_after:
+                covering_shards.append(shard)
+
+    return covering_shards
+
+
+def _rebuild_pending_shards():
+    from .tasks import rebuild_sitemap_shard_task
+
+    shard_ids = getattr(_pending, "shard_ids", set())
+    _pending.shard_ids = set()
+
+    requested_at = timezone.now().timestamp()
+    for shard_id in shard_ids:
+        rebuild_sitemap_shard_task.enqueue(shard_id, requested_at)
+
+
+def _add_pending_shards(shards):
+    if not hasattr(_pending, "shard_ids"):
+        _pending.shard_ids = set()
+    _pending.shard_ids.update(shard.pk for shard in shards)
+
+
+def rebuild_shards_for_page(page, include_descendants=False):
+    """
+    Rebuild the sitemap shards covering the page once the current transaction is
+    committed. Shards affected by several changes in the same transaction are only
+    rebuilt once.
+    """
+    shards = get_shards_for_page(page, include_descendants=include_descendants)
+    if not shards:
+        return
+
+    _add_pending_shards(shards)
+    transaction.on_commit(_rebuild_pending_shards)
+
+
+def page_published_signal_handler(instance, **kwargs):
+    rebuild_shards_for_page(instance)
+
+
+def page_unpublished_signal_handler(instance, **kwargs):
+    rebuild_shards_for_page(instance)
+
+
+def page_slug_changed_signal_handler(instance, **kwargs):
+    # The URLs of all the descendants of the page have changed too
+    rebuild_shards_for_page(instance, include_descendants=True)
+
+
+def pre_page_move_signal_handler(instance, url_path_before, url_path_after, **kwargs):
+    if url_path_before == url_path_after:
+        return
+
+    # The moved pages need to be removed from the shards covering their current
+    # location. These are rebuilt along with the shards covering the new location
+    # once the move has been committed.
+    _add_pending_shards(get_shards_for_page(instance, include_descendants=True))
+
+
+def post_page_move_signal_handler(instance, url_path_before, url_path_after, **kwargs):
+    if url_path_before == url_path_after:
+        return
+
+    _add_pending_shards(get_shards_for_page(instance, include_descendants=True))
+    transaction.on_commit(_rebuild_pending_shards)
+
+
+def register_signal_handlers():
+    page_published.connect(page_published_signal_handler)
+    page_unpublished.connect(page_unpublished_signal_handler)
+    page_slug_changed.connect(page_slug_changed_signal_handler)
+    pre_page_move.connect(pre_page_move_signal_handler)
+    post_page_move.connect(post_page_move_signal_handler)
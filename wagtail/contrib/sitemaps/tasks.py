@@ -0,0 +1,31 @@
+from django_tasks import task
+
+from wagtail.models import Site
+
+from .models import SitemapShard
+from .shards import SitemapShardBuilder
+
+
+@task()
+def build_sitemaps_task(site_id=None):
+    sites = Site.objects.all()
+    if site_id is not None:
+        sites = sites.filter(pk=site_id)
+
+    for site in sites:
+        SitemapShardBuilder(site).build()
+
+
+@task()
+def rebuild_sitemap_shard_task(shard_id, requested_at):
+    try:
+        shard = SitemapShard.objects.select_related("site").get(pk=shard_id)
+    except SitemapShard.DoesNotExist:
+        # The whole sitemap has been rebuilt since the task was enqueued
+        return
+
+    if shard.updated_at.timestamp() >= requested_at:
+        # The shard has already been rebuilt since the change was committed
+        return
+
+    SitemapShardBuilder(shard.site).rebuild_shard(shard)
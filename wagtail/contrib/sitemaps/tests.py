@@ -1,14 +1,24 @@
 import datetime
+import io
+import shutil
+import tempfile
+from unittest import mock
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.sites.shortcuts import get_current_site
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.db import connection
 from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from wagtail.models import Page, PageViewRestriction, Site
 from wagtail.test.testapp.models import EventIndex, SimplePage
 
+from .models import SitemapShard
+from .shards import SitemapShardBuilder, write_urlset
 from .sitemap_generator import Sitemap
 
 
@@ -284,3 +294,340 @@ class TestSitemapView(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response["Content-Type"], "application/xml")
+
+
+class SitemapShardsTestMixin:
+    def setUp(self):
+        # Store shards in a separate directory, so that tests running in parallel
+        # don't overwrite each other's files
+        self.media_root = tempfile.mkdtemp()
+        media_root_override = override_settings(MEDIA_ROOT=self.media_root)
+        media_root_override.enable()
+        self.addCleanup(media_root_override.disable)
+
+        self.home_page = Page.objects.get(id=2)
+        self.site = Site.objects.get(is_default_site=True)
+
+        self.pages = [
+            self.home_page.add_child(
+                instance=SimplePage(
+                    title=f"Page {i}", slug=f"page-{i}", content="hello", live=True
+                )
+            )
+            for i in range(5)
+        ]
+        self.unpublished_page = self.home_page.add_child(
+            instance=SimplePage(
+                title="Unpublished", slug="unpublished", content="hello", live=False
+            )
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.media_root)
+
+    def read_shard(self, shard):
+        with default_storage.open(shard.file_name) as f:
+            return f.read().decode()
+
+    def get_shard_urls(self, shards):
+        urls = []
+        for shard in shards:
+            content = self.read_shard(shard)
+            urls += [part.split("</loc>")[0] for part in content.split("<loc>")[1:]]
+        return urls
+
+
+class TestSitemapShardBuilder(SitemapShardsTestMixin, TestCase):
+    def test_build(self):
+        shards = SitemapShardBuilder(self.site, shard_size=2).build()
+
+        self.assertEqual([shard.number for shard in shards], [1, 2, 3])
+        self.assertEqual(
+            [shard.first_path for shard in shards],
+            ["", self.pages[1].path, self.pages[3].path],
+        )
+        self.assertEqual([shard.url_count for shard in shards], [2, 2, 2])
+        self.assertEqual(SitemapShard.objects.filter(site=self.site).count(), 3)
+
+        # The shards contain the same URLs as the sitemap, in the same order
+        self.assertEqual(
+            self.get_shard_urls(shards),
+            [
+                url["location"]
+                for page in Sitemap(site=self.site).items()
+                for url in page.get_sitemap_urls()
+            ],
+        )
+        self.assertNotIn("http://localhost/unpublished/", self.get_shard_urls(shards))
+
+    def test_build_fetches_pages_in_chunks(self):
+        builder = SitemapShardBuilder(self.site, chunk_size=3)
+
+        with CaptureQueriesContext(connection) as queries:
+            pages = list(builder.iter_pages())
+
+        self.assertEqual(pages, [self.home_page.specific] + self.pages)
+        # Each chunk starts after the last page of the previous one, rather than
+        # using an offset
+        page_queries = [query["sql"] for query in queries if "LIMIT 3" in query["sql"]]
+        self.assertEqual(len(page_queries), 3)
+        self.assertFalse(any("OFFSET" in sql for sql in page_queries))
+
+    def test_build_replaces_existing_shards(self):
+        old_shards = SitemapShardBuilder(self.site, shard_size=2).build()
+        shards = SitemapShardBuilder(self.site).build()
+
+        self.assertEqual(len(shards), 1)
+        self.assertEqual(SitemapShard.objects.filter(site=self.site).count(), 1)
+        self.assertEqual(shards[0].url_count, 6)
+        self.assertTrue(default_storage.exists(shards[0].file_name))
+        self.assertFalse(default_storage.exists(old_shards[2].file_name))
+
+    def test_build_empty_site(self):
+        site = Site.objects.create(
+            hostname="other.example.com", root_page=self.unpublished_page
+        )
+        shards = SitemapShardBuilder(site).build()
+
+        self.assertEqual(len(shards), 1)
+        self.assertEqual(shards[0].url_count, 0)
+        self.assertIn("<urlset", self.read_shard(shards[0]))
+
+    def test_rebuild_shard(self):
+        shards = SitemapShardBuilder(self.site, shard_size=2).build()
+        self.unpublished_page.live = True
+        self.unpublished_page.save()
+
+        SitemapShardBuilder(self.site, shard_size=2).rebuild_shard(shards[2])
+
+        shard = SitemapShard.objects.get(pk=shards[2].pk)
+        self.assertEqual(shard.url_count, 3)
+        self.assertIn("http://localhost/unpublished/", self.read_shard(shard))
+        self.assertEqual(SitemapShard.objects.get(pk=shards[1].pk).url_count, 2)
+
+    def test_rebuild_shard_over_limit_rebuilds_sitemap(self):
+        shards = SitemapShardBuilder(self.site, shard_size=2).build()
+        self.unpublished_page.live = True
+        self.unpublished_page.save()
+
+        builder = SitemapShardBuilder(self.site, shard_size=2)
+        builder.sitemap.limit = 2
+        builder.rebuild_shard(shards[2])
+
+        shards = SitemapShard.objects.filter(site=self.site)
+        self.assertEqual([shard.url_count for shard in shards], [2, 2, 2, 1])
+
+
+class TestWriteUrlset(TestCase):
+    def test_write_urlset(self):
+        file = io.BytesIO()
+        count, lastmod = write_urlset(
+            file,
+            [
+                {
+                    "location": "http://localhost/?a=1&b=2",
+                    "lastmod": datetime.datetime(
+                        2017, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc
+                    ),
+                    "changefreq": "daily",
+                    "priority": 0.5,
+                    "alternates": [
+                        {"lang_code": "fr", "location": "http://localhost/fr/"}
+                    ],
+                },
+                {
+                    "location": "http://localhost/other/",
+                    "lastmod": datetime.datetime(
+                        2017, 2, 1, 12, 0, 0, tzinfo=datetime.timezone.utc
+                    ),
+                },
+            ],
+        )
+
+        self.assertEqual(count, 2)
+        self.assertEqual(
+            lastmod,
+            datetime.datetime(2017, 2, 1, 12, 0, 0, tzinfo=datetime.timezone.utc),
+        )
+        self.assertEqual(
+            file.getvalue().decode(),
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" '
+            'xmlns:xhtml="http://www.w3.org/1999/xhtml">'
+            "<url><loc>http://localhost/?a=1&amp;b=2</loc>"
+            "<lastmod>2017-01-01</lastmod>"
+            "<changefreq>daily</changefreq>"
+            "<priority>0.5</priority>"
+            '<xhtml:link rel="alternate" hreflang="fr" href="http://localhost/fr/"/>'
+            "</url>"
+            "<url><loc>http://localhost/other/</loc>"
+            "<lastmod>2017-02-01</lastmod></url>"
+            "</urlset>\n",
+        )
+
+    def test_lastmod_missing(self):
+        count, lastmod = write_urlset(
+            io.BytesIO(),
+            [
+                {"location": "http://localhost/", "lastmod": timezone.now()},
+                {"location": "http://localhost/other/"},
+            ],
+        )
+        self.assertEqual(count, 2)
+        self.assertIsNone(lastmod)
+
+
+class TestShardedSitemapViews(SitemapShardsTestMixin, TestCase):
+    def test_index_enqueues_build(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.get("/sharded-sitemap.xml")
+
+        # The sitemap isn't built while handling the request
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "300")
+        self.assertFalse(SitemapShard.objects.filter(site=self.site).exists())
+
+        # Requests made while the sitemap is being built don't enqueue another build
+        with self.captureOnCommitCallbacks() as more_callbacks:
+            response = self.client.get("/sharded-sitemap.xml")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(more_callbacks, [])
+
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        self.assertEqual(SitemapShard.objects.filter(site=self.site).count(), 1)
+
+        response = self.client.get("/sharded-sitemap.xml")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/xml")
+        self.assertContains(
+            response, "<loc>http://testserver/sharded-sitemap-1.xml</loc>"
+        )
+
+    def test_index(self):
+        SitemapShardBuilder(self.site, shard_size=2).build()
+
+        with self.assertNumQueries(2):
+            response = self.client.get("/sharded-sitemap.xml")
+
+        self.assertContains(
+            response, "<loc>http://testserver/sharded-sitemap-3.xml</loc>"
+        )
+        self.assertNotContains(response, "sharded-sitemap-4.xml")
+
+    def test_shard(self):
+        SitemapShardBuilder(self.site, shard_size=2).build()
+
+        with self.assertNumQueries(2):
+            response = self.client.get("/sharded-sitemap-2.xml")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/xml")
+        self.assertIn("Last-Modified", response)
+        content = b"".join(response.streaming_content).decode()
+        self.assertIn("<loc>http://localhost/page-1/</loc>", content)
+        self.assertNotIn("<loc>http://localhost/page-3/</loc>", content)
+
+    def test_missing_shard(self):
+        SitemapShardBuilder(self.site, shard_size=2).build()
+
+        response = self.client.get("/sharded-sitemap-4.xml")
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_missing_shard_file(self):
+        shards = SitemapShardBuilder(self.site, shard_size=2).build()
+        default_storage.delete(shards[1].file_name)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.get("/sharded-sitemap-2.xml")
+
+        # The file is rebuilt in a background task rather than in the request
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "300")
+        self.assertTrue(default_storage.exists(shards[1].file_name))
+
+        response = self.client.get("/sharded-sitemap-2.xml")
+        self.assertEqual(response.status_code, 200)
+        content = b"".join(response.streaming_content).decode()
+        self.assertIn("<loc>http://localhost/page-1/</loc>", content)
+
+
+class TestSitemapShardInvalidation(SitemapShardsTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.shards = SitemapShardBuilder(self.site, shard_size=2).build()
+
+    def test_publish(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.unpublished_page.save_revision().publish()
+
+        urls = self.get_shard_urls(SitemapShard.objects.filter(site=self.site))
+        self.assertIn("http://localhost/unpublished/", urls)
+
+        # Only the shard containing the page is rebuilt
+        self.assertEqual(
+            SitemapShard.objects.get(pk=self.shards[0].pk).updated_at,
+            self.shards[0].updated_at,
+        )
+
+    def test_unpublish(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.pages[2].unpublish()
+
+        urls = self.get_shard_urls(SitemapShard.objects.filter(site=self.site))
+        self.assertNotIn("http://localhost/page-2/", urls)
+        self.assertEqual(SitemapShard.objects.get(number=2).url_count, 1)
+
+    def test_shards_rebuilt_once_per_transaction(self):
+        with mock.patch.object(SitemapShardBuilder, "rebuild_shard") as rebuild_shard:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.pages[3].save_revision().publish()
+                self.pages[4].save_revision().publish()
+
+        rebuild_shard.assert_called_once()
+        self.assertEqual(rebuild_shard.call_args.args[0].pk, self.shards[2].pk)
+
+    def test_slug_change_rebuilds_descendants(self):
+        child = self.pages[0].add_child(
+            instance=SimplePage(title="Child", slug="child", content="hello", live=True)
+        )
+        SitemapShardBuilder(self.site, shard_size=2).build()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.pages[0].slug = "renamed"
+            self.pages[0].save_revision().publish()
+
+        urls = self.get_shard_urls(SitemapShard.objects.filter(site=self.site))
+        self.assertIn("http://localhost/renamed/", urls)
+        self.assertIn("http://localhost/renamed/child/", urls)
+        self.assertNotIn(child.full_url, urls)
+
+    def test_move_rebuilds_old_and_new_locations(self):
+        child = self.pages[0].add_child(
+            instance=SimplePage(title="Child", slug="child", content="hello", live=True)
+        )
+        SitemapShardBuilder(self.site, shard_size=2).build()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            child.move(self.pages[4], pos="last-child")
+
+        urls = self.get_shard_urls(SitemapShard.objects.filter(site=self.site))
+        self.assertIn("http://localhost/page-4/child/", urls)
+        self.assertNotIn("http://localhost/page-0/child/", urls)
+
+    def test_reorder_does_not_rebuild(self):
+        with mock.patch.object(SitemapShardBuilder, "rebuild_shard") as rebuild_shard:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.pages[4].move(self.pages[0], pos="left")
+
+        rebuild_shard.assert_not_called()
+
+
+class TestBuildSitemapsCommand(SitemapShardsTestMixin, TestCase):
+    def test_build_sitemaps(self):
+        stdout = io.StringIO()
+        call_command("build_sitemaps", shard_size=4, stdout=stdout)
+
+        self.assertEqual(SitemapShard.objects.filter(site=self.site).count(), 2)
+        self.assertIn("Built 2 sitemap(s) with 6 URLs", stdout.getvalue())
@@ -1,6 +1,16 @@
 import inspect
+from functools import partial
 
 from django.contrib.sitemaps import views as sitemap_views
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.http import FileResponse, HttpResponse
+from django.shortcuts import get_object_or_404
+from django.template.response import TemplateResponse
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
 
 from .sitemap_generator import Sitemap
 
@@ -26,3 +36,92 @@ def prepare_sitemaps(request, sitemaps):
         else:
             initialised_sitemaps[name] = sitemap_cls
     return initialised_sitemaps
+
+
+# Number of seconds crawlers are asked to wait while a sitemap is being built, which
+# is also the minimum time between two builds being enqueued for the same sitemap
+SITEMAP_BUILD_RETRY_AFTER = 300
+
+
+def _get_site(request):
+    return Sitemap(request).get_wagtail_site()
+
+
+def _enqueue_build(cache_key, task, *args):
+    """
+    Enqueue a task to build (part of) a sitemap, unless one has recently been
+    enqueued for it already, and return a response asking the client to try again
+    later.
+    """
+    if cache.add(cache_key, True, SITEMAP_BUILD_RETRY_AFTER):
+        transaction.on_commit(partial(task.enqueue, *args))
+
+    response = HttpResponse(status=503)
+    response["Retry-After"] = SITEMAP_BUILD_RETRY_AFTER
+    return response
+
+
+@sitemap_views.x_robots_tag
+def sharded_index(
+    request,
+    template_name="sitemap_index.xml",
+    content_type="application/xml",
+    sitemap_url_name="wagtail_sitemap_shard",
+):
+    """
+    Serve a sitemap index listing the shards of the site's sitemap built by the
+    ``build_sitemaps`` management command. If the sitemap hasn't been built yet,
+    a background task is enqueued to build it and a 503 response is returned.
+    """
+    # Models are imported here, as wagtail.contrib.sitemaps doesn't need to be
+    # installed to use the other views
+    from .models import SitemapShard
+    from .tasks import build_sitemaps_task
+
+    site = _get_site(request)
+    shards = list(SitemapShard.objects.filter(site=site).order_by("number"))
+    if not shards:
+        return _enqueue_build(
+            f"wagtail-sitemap-build-{site.pk}", build_sitemaps_task, site.pk
+        )
+
+    sitemaps = [
+        sitemap_views.SitemapIndexItem(
+            request.build_absolute_uri(
+                reverse(sitemap_url_name, kwargs={"number": shard.number})
+            ),
+            shard.lastmod,
+        )
+        for shard in shards
+    ]
+    return TemplateResponse(
+        request, template_name, {"sitemaps": sitemaps}, content_type=content_type
+    )
+
+
+@sitemap_views.x_robots_tag
+def sharded_sitemap(request, number, content_type="application/xml"):
+    """
+    Serve a shard of the site's sitemap from storage. If the file is missing from
+    storage, a background task is enqueued to build it again and a 503 response is
+    returned.
+    """
+    from .models import SitemapShard
+    from .tasks import rebuild_sitemap_shard_task
+
+    site = _get_site(request)
+    shard = get_object_or_404(SitemapShard, site=site, number=number)
+
+    try:
+        file = default_storage.open(shard.file_name)
+    except FileNotFoundError:
+        return _enqueue_build(
+            f"wagtail-sitemap-shard-build-{shard.pk}",
+            rebuild_sitemap_shard_task,
+            shard.pk,
+            timezone.now().timestamp(),
+        )
+
+    response = FileResponse(file, content_type=content_type)
+    response["Last-Modified"] = http_date(shard.updated_at.timestamp())
+    return response
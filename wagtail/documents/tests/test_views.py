@@ -183,6 +183,101 @@ class TestServeView(TestCase):
     def test_has_etag_header(self):
         self.assertEqual(self.get()["ETag"], '"123456"')
 
+    def get_range(self, range_header, document=None, **extra):
+        document = document or self.document
+        self.response = self.client.get(
+            reverse("wagtaildocs_serve", args=(document.id, document.filename)),
+            HTTP_RANGE=range_header,
+            **extra,
+        )
+        return self.response
+
+    def test_accept_ranges_header(self):
+        self.assertEqual(self.get()["Accept-Ranges"], "bytes")
+
+    def test_range(self):
+        response = self.get_range("bytes=2-7")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], "bytes 2-7/25")
+        self.assertEqual(response["Content-Length"], "6")
+        self.assertEqual(response["Content-Type"], "application/msword")
+        self.assertEqual(response["ETag"], '"123456"')
+        self.assertEqual(b"".join(response.streaming_content), b"boring")
+
+    def test_open_ended_range(self):
+        response = self.get_range("bytes=17-")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], "bytes 17-24/25")
+        self.assertEqual(b"".join(response.streaming_content), b"document")
+
+    def test_suffix_range(self):
+        response = self.get_range("bytes=-8")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], "bytes 17-24/25")
+        self.assertEqual(b"".join(response.streaming_content), b"document")
+
+    def test_unsatisfiable_range(self):
+        response = self.get_range("bytes=100-")
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], "bytes */25")
+
+    def test_multiple_ranges_serve_whole_file(self):
+        response = self.get_range("bytes=0-1,4-5")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            b"".join(response.streaming_content), b"A boring example document"
+        )
+
+    def test_invalid_range_serves_whole_file(self):
+        response = self.get_range("bytes=7-2")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Length"], "25")
+
+    def test_if_range(self):
+        response = self.get_range("bytes=2-7", HTTP_IF_RANGE='"123456"')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), b"boring")
+        self.read_response(response)
+
+        # The file has changed since the client's partial download
+        response = self.get_range("bytes=2-7", HTTP_IF_RANGE='"654321"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            b"".join(response.streaming_content), b"A boring example document"
+        )
+
+    def test_if_none_match(self):
+        response = self.client.get(
+            reverse(
+                "wagtaildocs_serve", args=(self.document.id, self.document.filename)
+            ),
+            HTTP_IF_NONE_MATCH='"123456"',
+        )
+        self.assertEqual(response.status_code, 304)
+
+    @mock.patch("wagtail.documents.views.serve.hooks")
+    @mock.patch("wagtail.documents.views.serve.get_object_or_404")
+    def test_non_local_filesystem_range(self, mock_get_object_or_404, mock_hooks):
+        # Create a mock document with no local file to hit the correct code path
+        mock_doc = mock.Mock()
+        mock_doc.filename = self.document.filename
+        mock_doc.content_type = self.document.content_type
+        mock_doc.content_disposition = self.document.content_disposition
+        mock_doc.file = ContentFile(b"A boring example document")
+        mock_doc.file.path = None
+        mock_doc.file.url = None
+        mock_get_object_or_404.return_value = mock_doc
+
+        # Bypass 'before_serve_document' hooks
+        mock_hooks.get_hooks.return_value = []
+
+        response = self.get_range("bytes=2-7")
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], "bytes 2-7/25")
+        self.assertEqual(response["Content-Length"], "6")
+        self.assertEqual(b"".join(response.streaming_content), b"boring")
+
     def clear_sendfile_cache(self):
         from wagtail.utils.sendfile import _get_sendfile
 
@@ -1,8 +1,11 @@
+from functools import partial
+
 from django.conf import settings
-from django.http import FileResponse, Http404, HttpResponse
+from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.template.response import TemplateResponse
 from django.urls import reverse
+from django.utils.cache import quote_etag
 from django.utils.http import url_has_allowed_host_and_scheme
 from django.views.decorators.http import etag
 
@@ -74,6 +77,14 @@ def serve(request, document_id, document_filename):
         # backwards compatibility behaviour.
         return redirect(direct_url)
 
+    # Range requests with an If-Range header are only answered with part of the
+    # file if it matches the ETag set by the etag decorator
+    etag = None
+    if "if-range" in request.headers:
+        file_hash = document_etag(request, document_id, document_filename)
+        if file_hash:
+            etag = quote_etag(file_hash)
+
     if local_path:
         # Use wagtail.utils.sendfile to serve the file;
         # this provides support for mimetypes, if-modified-since and django-sendfile backends
@@ -85,7 +96,9 @@ def serve(request, document_id, document_filename):
         }
         if not hasattr(settings, "SENDFILE_BACKEND"):
             # Fallback to streaming backend if user hasn't specified SENDFILE_BACKEND
-            sendfile_opts["backend"] = sendfile_streaming_backend.sendfile
+            sendfile_opts["backend"] = partial(
+                sendfile_streaming_backend.sendfile, etag=etag
+            )
 
         response = sendfile(request, local_path, **sendfile_opts)
 
@@ -94,15 +107,19 @@ def serve(request, document_id, document_filename):
         # (e.g. storages.backends.s3boto.S3BotoStorage) AND the developer has not allowed
         # redirecting to the file url directly.
         # Fall back on pre-sendfile behaviour of reading the file content and serving it
-        # as a FileResponse
-        response = FileResponse(doc.file, doc.content_type)
+        # as a FileResponse, or part of it for range requests
+        # FIXME: storage backends are not guaranteed to implement 'size'
+        size = doc.file.size
+        response = sendfile_streaming_backend.file_response(
+            request, doc.file, size, content_type=doc.content_type, etag=etag
+        )
 
         # set filename and filename* to handle non-ascii characters in filename
         # see https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Content-Disposition
         response["Content-Disposition"] = doc.content_disposition
 
-        # FIXME: storage backends are not guaranteed to implement 'size'
-        response["Content-Length"] = doc.file.size
+        if response.status_code == 200:
+            response["Content-Length"] = size
 
     # Add a CSP header to prevent inline execution
     if getattr(settings, "WAGTAILDOCS_BLOCK_EMBEDDED_CONTENT", True):
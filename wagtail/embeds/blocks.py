@@ -3,7 +3,7 @@ from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from wagtail import blocks
-from wagtail.embeds.format import embed_to_frontend_html
+from wagtail.embeds.format import embed_to_frontend_html, embeds_to_frontend_html
 
 
 class EmbedValue:
@@ -19,10 +19,28 @@ class EmbedValue:
         self.url = url
         self.max_width = max_width
         self.max_height = max_height
+        # Values of the same block whose embeds are looked up along with this one
+        self._prefetch_group = [self]
 
     @cached_property
     def html(self):
-        return embed_to_frontend_html(self.url, self.max_width, self.max_height)
+        others = [
+            value
+            for value in self._prefetch_group
+            if value is not self and "html" not in value.__dict__
+        ]
+        if not others:
+            return embed_to_frontend_html(self.url, self.max_width, self.max_height)
+
+        html, *others_html = embeds_to_frontend_html(
+            [self.url] + [value.url for value in others],
+            self.max_width,
+            self.max_height,
+        )
+        for value, value_html in zip(others, others_html):
+            # Populate the cached_property of the other values
+            value.__dict__["html"] = value_html
+        return html
 
     def __str__(self):
         return self.html
@@ -56,6 +74,15 @@ class EmbedBlock(blocks.URLBlock):
                 getattr(self.meta, "max_height", None),
             )
 
+    def bulk_to_python(self, values):
+        # The embeds of all the values are looked up together when the first of
+        # them is rendered
+        embed_values = [self.to_python(value) for value in values]
+        prefetch_group = [value for value in embed_values if value is not None]
+        for value in prefetch_group:
+            value._prefetch_group = prefetch_group
+        return embed_values
+
     def get_prep_value(self, value):
         # serialisable value should be a URL string
         if value is None:
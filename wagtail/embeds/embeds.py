@@ -1,13 +1,30 @@
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
+from urllib.parse import urlsplit
 
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, InvalidCacheBackendError, caches
+from django.db import transaction
 from django.utils.timezone import now
 
 from wagtail.coreutils import accepts_kwarg, safe_md5
 
-from .exceptions import EmbedUnsupportedProviderException
+from .exceptions import EmbedException, EmbedUnsupportedProviderException
 from .finders import get_finders
 from .models import Embed
 
+logger = logging.getLogger("wagtail.embeds")
+
+# The maximum number of embeds fetched from finders at the same time
+EMBED_FETCH_MAX_WORKERS = 8
+
+# The maximum number of embeds refreshed from the same provider at the same time
+EMBED_REFRESH_MAX_PER_PROVIDER = 2
+
 
 def get_finder_for_embed(url, max_width=None, max_height=None):
     for finder in get_finders():
@@ -26,14 +43,95 @@ def get_embed(url, max_width=None, max_height=None):
     """
     embed_hash = get_embed_hash(url, max_width, max_height)
 
-    # Check database
-    try:
-        return Embed.objects.exclude(cache_until__lte=now()).get(hash=embed_hash)
-    except Embed.DoesNotExist:
-        pass
+    # Check cache and database
+    embed = get_existing_embeds([embed_hash]).get(embed_hash)
+    if embed is not None:
+        return embed
 
     embed_dict = get_finder_for_embed(url, max_width, max_height)
+    return create_embed(url, max_width, embed_hash, embed_dict, max_height=max_height)
+
+
+def get_embeds(urls, max_width=None, max_height=None):
+    """
+    Retrieve embeds for a list of URLs. Embeds that have already been fetched are
+    looked up with a single cache lookup and database query, and the others are
+    fetched from the configured finders concurrently.
+
+    Returns a list of ``Embed`` objects in the same order as ``urls``, with ``None``
+    for any URL that no embed could be found for.
+    """
+    hashes = {url: get_embed_hash(url, max_width, max_height) for url in urls}
+    embeds = get_existing_embeds(hashes.values())
+
+    missing_urls = [
+        url for url, embed_hash in hashes.items() if embed_hash not in embeds
+    ]
+    if missing_urls:
+        # Only fetch from the finders in worker threads; the embeds are saved to
+        # the database from this thread
+        with ThreadPoolExecutor(
+            max_workers=min(len(missing_urls), EMBED_FETCH_MAX_WORKERS)
+        ) as executor:
+            futures = {
+                url: executor.submit(get_finder_for_embed, url, max_width, max_height)
+                for url in missing_urls
+            }
+
+        for url, future in futures.items():
+            try:
+                embed_dict = future.result()
+            except EmbedException:
+                continue
+
+            embeds[hashes[url]] = create_embed(
+                url, max_width, hashes[url], embed_dict, max_height=max_height
+            )
+
+    return [embeds.get(hashes[url]) for url in urls]
+
 
+def get_existing_embeds(hashes):
+    """
+    Return a dict of the unexpired embeds with the given hashes that have already
+    been fetched, keyed by hash. Embeds are looked up in the cache first, then in
+    the database.
+
+    If ``WAGTAILEMBEDS_REFRESH_IN_BACKGROUND`` is enabled, expired embeds are
+    returned too, and a task is enqueued to fetch each of them again.
+    """
+    cache = get_embed_cache()
+    cache_keys = {embed_hash: get_embed_cache_key(embed_hash) for embed_hash in hashes}
+    cached = cache.get_many(cache_keys.values())
+    embeds = {
+        embed_hash: cached[cache_key]
+        for embed_hash, cache_key in cache_keys.items()
+        if cache_key in cached
+    }
+
+    missing_hashes = [
+        embed_hash for embed_hash in cache_keys if embed_hash not in embeds
+    ]
+    if missing_hashes:
+        queryset = Embed.objects.filter(hash__in=missing_hashes)
+        if not refresh_in_background():
+            queryset = queryset.exclude(cache_until__lte=now())
+
+        for embed in queryset:
+            embeds[embed.hash] = embed
+            cache_embed(embed)
+            if embed.is_expired:
+                from .tasks import refresh_embed_task
+
+                transaction.on_commit(partial(refresh_embed_task.enqueue, embed.pk))
+
+    return embeds
+
+
+def create_embed(url, max_width, embed_hash, embed_dict, max_height=None):
+    """
+    Save the embed returned by a finder to the database, and add it to the cache.
+    """
     # Make sure width and height are valid integers before inserting into database
     try:
         embed_dict["width"] = int(embed_dict["width"])
@@ -55,16 +153,118 @@ def get_embed(url, max_width=None, max_height=None):
 
     # Create database record
     embed, created = Embed.objects.update_or_create(
-        hash=embed_hash, defaults=dict(url=url, max_width=max_width, **embed_dict)
+        hash=embed_hash,
+        defaults=dict(
+            url=url, max_width=max_width, max_height=max_height, **embed_dict
+        ),
     )
 
     # Save
     embed.last_updated = datetime.now()
     embed.save()
 
+    cache_embed(embed)
     return embed
 
 
+def refresh_embeds(embeds, max_per_provider=EMBED_REFRESH_MAX_PER_PROVIDER):
+    """
+    Fetch the given embeds again from the configured finders, and update them.
+    Embeds are fetched concurrently, with no more than ``max_per_provider`` embeds
+    fetched from each provider at the same time.
+
+    Embeds that can't be fetched are left as they are. Returns the list of embeds
+    that were updated.
+    """
+    embeds_to_fetch = []
+    for embed in embeds:
+        if embed.hash == get_embed_hash(embed.url, embed.max_width, embed.max_height):
+            embeds_to_fetch.append(embed)
+        else:
+            # This embed was saved before its max_height was stored, so it can't be
+            # fetched again with the same size. It will be fetched when next used.
+            embed.delete()
+
+    if not embeds_to_fetch:
+        return []
+
+    semaphores = defaultdict(lambda: threading.BoundedSemaphore(max_per_provider))
+
+    def fetch(embed, semaphore):
+        with semaphore:
+            return get_finder_for_embed(embed.url, embed.max_width, embed.max_height)
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(embeds_to_fetch), EMBED_FETCH_MAX_WORKERS)
+    ) as executor:
+        futures = [
+            (embed, executor.submit(fetch, embed, semaphores[get_provider_key(embed)]))
+            for embed in embeds_to_fetch
+        ]
+
+    refreshed = []
+    for embed, future in futures:
+        try:
+            embed_dict = future.result()
+        except EmbedException:
+            logger.warning("Unable to refresh embed for %s", embed.url, exc_info=True)
+            continue
+
+        refreshed.append(
+            create_embed(
+                embed.url,
+                embed.max_width,
+                embed.hash,
+                embed_dict,
+                max_height=embed.max_height,
+            )
+        )
+
+    return refreshed
+
+
+def get_provider_key(embed):
+    return embed.provider_name or urlsplit(embed.url).hostname or ""
+
+
+def refresh_in_background():
+    return getattr(settings, "WAGTAILEMBEDS_REFRESH_IN_BACKGROUND", False)
+
+
+def get_embed_cache():
+    try:
+        return caches["embeds"]
+    except InvalidCacheBackendError:
+        return caches[DEFAULT_CACHE_ALIAS]
+
+
+def get_embed_cache_key(embed_hash):
+    return f"wagtail-embed-{embed_hash}"
+
+
+def cache_embed(embed):
+    """
+    Add an embed to the cache, until its ``cache_until`` time if it has one.
+    Expired embeds are only cached when they are refreshed in the background, for
+    the default timeout of the cache (they are removed from the cache once the
+    refresh saves them).
+    """
+    cache_key = get_embed_cache_key(embed.hash)
+    if embed.cache_until is None:
+        get_embed_cache().set(cache_key, embed)
+        return
+
+    timeout = (embed.cache_until - now()).total_seconds()
+    if timeout > 0:
+        get_embed_cache().set(cache_key, embed, timeout)
+    elif refresh_in_background():
+        get_embed_cache().set(cache_key, embed)
+
+
+def purge_embed_from_cache(embed):
+    get_embed_cache().delete(get_embed_cache_key(embed.hash))
+
+
 def get_embed_hash(url, max_width=None, max_height=None):
     h = safe_md5(url.encode("utf-8"), usedforsecurity=False)
     if max_width is not None:
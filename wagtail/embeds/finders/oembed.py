@@ -10,13 +10,21 @@ from wagtail.embeds.oembed_providers import all_providers
 
 from .base import EmbedFinder
 
+# The number of seconds to wait for a provider to respond
+DEFAULT_TIMEOUT = 10
+
 
 class OEmbedFinder(EmbedFinder):
     options = {}
     _endpoints = None
 
-    def __init__(self, providers=None, options=None):
+    def __init__(self, providers=None, options=None, timeout=DEFAULT_TIMEOUT):
         self._endpoints = {}
+        self.timeout = timeout
+
+        # Reuse connections to providers across requests. Sessions can be shared
+        # between the threads fetching several embeds at once.
+        self.session = requests.Session()
 
         for provider in providers or all_providers:
             patterns = []
@@ -58,8 +66,11 @@ class OEmbedFinder(EmbedFinder):
 
         # Perform request
         try:
-            r = requests.get(
-                endpoint, params=params, headers={"User-agent": "Mozilla/5.0"}
+            r = self.session.get(
+                endpoint,
+                params=params,
+                headers={"User-agent": "Mozilla/5.0"},
+                timeout=self.timeout,
             )
             r.raise_for_status()
             oembed = r.json()
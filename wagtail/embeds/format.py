@@ -20,6 +20,22 @@ def embed_to_frontend_html(url, max_width=None, max_height=None):
         return ""
 
 
+def embeds_to_frontend_html(urls, max_width=None, max_height=None):
+    """
+    Return the front-end HTML for each of the given URLs, looking up all of the
+    embeds at once. Failed embeds are rendered as an empty string.
+    """
+    if len(urls) == 1:
+        return [embed_to_frontend_html(urls[0], max_width, max_height)]
+
+    return [
+        render_to_string("wagtailembeds/embed_frontend.html", {"embed": embed})
+        if embed is not None
+        else ""
+        for embed in embeds.get_embeds(urls, max_width, max_height)
+    ]
+
+
 def embed_to_editor_html(url):
     embed = embeds.get_embed(url)
     # catching EmbedException is the responsibility of the caller
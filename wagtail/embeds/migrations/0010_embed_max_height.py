@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtailembeds", "0009_embed_cache_until"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="embed",
+            name="max_height",
+            field=models.SmallIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.db import models
+from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 
 EMBED_TYPES = (
@@ -24,6 +25,7 @@ class Embed(models.Model):
 
     url = models.TextField()
     max_width = models.SmallIntegerField(null=True, blank=True)
+    max_height = models.SmallIntegerField(null=True, blank=True)
     hash = models.CharField(max_length=32, unique=True, db_index=True)
     type = models.CharField(max_length=10, choices=EMBED_TYPES)
     html = models.TextField(blank=True)
@@ -40,6 +42,10 @@ class Embed(models.Model):
         verbose_name = _("embed")
         verbose_name_plural = _("embeds")
 
+    @property
+    def is_expired(self):
+        return self.cache_until is not None and self.cache_until <= now()
+
     @property
     def ratio(self):
         if self.width and self.height:
@@ -0,0 +1,16 @@
+from django_tasks import task
+
+from .embeds import refresh_embeds
+from .models import Embed
+
+
+@task()
+def refresh_embed_task(embed_id):
+    try:
+        embed = Embed.objects.get(pk=embed_id)
+    except Embed.DoesNotExist:
+        return
+
+    # The embed may have been refreshed since this task was enqueued
+    if embed.is_expired:
+        refresh_embeds([embed])
@@ -1,10 +1,13 @@
 import datetime
 import json
+import threading
+import time
 import unittest
 import urllib.request
 from unittest.mock import Mock, patch
 from urllib.error import HTTPError, URLError
 
+import requests
 import responses
 from django import template
 from django.core.exceptions import ValidationError
@@ -16,7 +19,13 @@ from responses import matchers
 from wagtail import blocks
 from wagtail.embeds import oembed_providers
 from wagtail.embeds.blocks import EmbedBlock, EmbedValue
-from wagtail.embeds.embeds import get_embed, get_embed_hash
+from wagtail.embeds.embeds import (
+    get_embed,
+    get_embed_cache,
+    get_embed_hash,
+    get_embeds,
+    refresh_embeds,
+)
 from wagtail.embeds.exceptions import (
     EmbedNotFoundException,
     EmbedUnsupportedProviderException,
@@ -292,6 +301,247 @@ class TestEmbeds(TestCase):
             get_embed("www.test.com/1234", max_width=400)
 
 
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "wagtail-embeds-tests",
+        }
+    }
+)
+class TestGetEmbeds(TestCase):
+    def setUp(self):
+        self.hit_urls = []
+        get_embed_cache().clear()
+
+    def dummy_finder(self, url, max_width=None, max_height=None):
+        self.hit_urls.append(url)
+        if "missing" in url:
+            raise EmbedNotFoundException
+        return {
+            "title": "Test: " + url,
+            "type": "video",
+            "width": 640,
+            "height": 480,
+            "html": "<p>Blah blah blah</p>",
+        }
+
+    def get_embeds(self, urls, **kwargs):
+        with patch("wagtail.embeds.embeds.get_finders") as get_finders:
+            get_finders.return_value = [DummyFinder(self.dummy_finder)]
+            return get_embeds(urls, **kwargs)
+
+    def test_get_embeds(self):
+        urls = [
+            "www.test.com/1",
+            "www.test.com/2",
+            "www.test.com/1",
+            "www.test.com/missing",
+        ]
+        embeds = self.get_embeds(urls)
+
+        self.assertEqual(embeds[0].title, "Test: www.test.com/1")
+        self.assertEqual(embeds[1].title, "Test: www.test.com/2")
+        self.assertEqual(embeds[2].title, "Test: www.test.com/1")
+        self.assertIsNone(embeds[3])
+        # Each URL is only fetched once
+        self.assertEqual(
+            sorted(self.hit_urls),
+            ["www.test.com/1", "www.test.com/2", "www.test.com/missing"],
+        )
+        self.assertEqual(Embed.objects.count(), 2)
+
+        # Fetched embeds are cached
+        with self.assertNumQueries(0):
+            embeds = self.get_embeds(urls[:3])
+        self.assertEqual(
+            [embed.title for embed in embeds],
+            ["Test: www.test.com/1", "Test: www.test.com/2", "Test: www.test.com/1"],
+        )
+        self.assertEqual(len(self.hit_urls), 3)
+
+    def test_get_embeds_from_database(self):
+        urls = [f"www.test.com/{i}" for i in range(5)]
+        self.get_embeds(urls, max_width=400)
+        get_embed_cache().clear()
+
+        with self.assertNumQueries(1):
+            embeds = self.get_embeds(urls, max_width=400)
+
+        self.assertEqual([embed.url for embed in embeds], urls)
+        self.assertEqual(len(self.hit_urls), 5)
+
+        # A different width is a different embed
+        self.get_embeds(urls[:1])
+        self.assertEqual(len(self.hit_urls), 6)
+
+    def test_get_embeds_ignores_expired(self):
+        embed = self.get_embeds(["www.test.com/1"])[0]
+        embed.cache_until = now() - datetime.timedelta(minutes=1)
+        embed.save()
+
+        self.get_embeds(["www.test.com/1"])
+
+        self.assertEqual(self.hit_urls, ["www.test.com/1", "www.test.com/1"])
+
+    def test_cache_cleared_on_save(self):
+        embed = self.get_embeds(["www.test.com/1"])[0]
+        embed.title = "Changed"
+        embed.save()
+
+        self.assertEqual(get_embed("www.test.com/1").title, "Changed")
+
+    def test_cache_cleared_on_delete(self):
+        self.get_embeds(["www.test.com/1"])
+        Embed.objects.all().delete()
+
+        self.get_embeds(["www.test.com/1"])
+
+        self.assertEqual(self.hit_urls, ["www.test.com/1", "www.test.com/1"])
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "wagtail-embeds-tests",
+        }
+    },
+    WAGTAILEMBEDS_REFRESH_IN_BACKGROUND=True,
+)
+class TestRefreshEmbeds(TestCase):
+    def setUp(self):
+        self.hit_urls = []
+        get_embed_cache().clear()
+        self.finders = patch("wagtail.embeds.embeds.get_finders")
+        self.finders.start().return_value = [DummyFinder(self.dummy_finder)]
+        self.addCleanup(self.finders.stop)
+
+    def dummy_finder(self, url, max_width=None, max_height=None):
+        self.hit_urls.append(url)
+        if "missing" in url:
+            raise EmbedNotFoundException
+        return {
+            "title": f"Test: {url} {len(self.hit_urls)}",
+            "type": "video",
+            "width": 640,
+            "height": 480,
+            "html": "<p>Blah blah blah</p>",
+            "cache_until": now() + datetime.timedelta(hours=1),
+        }
+
+    def create_expired_embed(self, url, max_width=None, max_height=None):
+        embed = get_embed(url, max_width=max_width, max_height=max_height)
+        embed.cache_until = now() - datetime.timedelta(minutes=1)
+        embed.save()
+        return embed
+
+    def test_stale_embed_served_and_refresh_enqueued(self):
+        embed = self.create_expired_embed("www.test.com/1", max_height=300)
+
+        with (
+            patch("wagtail.embeds.tasks.refresh_embed_task") as task,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            stale_embed = get_embed("www.test.com/1", max_height=300)
+
+        self.assertEqual(stale_embed.title, "Test: www.test.com/1 1")
+        self.assertEqual(self.hit_urls, ["www.test.com/1"])
+        task.enqueue.assert_called_once_with(embed.pk)
+
+        # The stale embed is served from the cache until it is refreshed
+        with (
+            patch("wagtail.embeds.tasks.refresh_embed_task") as task,
+            self.assertNumQueries(0),
+        ):
+            get_embed("www.test.com/1", max_height=300)
+        task.enqueue.assert_not_called()
+
+    def test_refresh_task(self):
+        embed = self.create_expired_embed("www.test.com/1", max_height=300)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            get_embed("www.test.com/1", max_height=300)
+
+        embed.refresh_from_db()
+        self.assertFalse(embed.is_expired)
+        self.assertEqual(embed.title, "Test: www.test.com/1 2")
+        self.assertEqual(embed.max_height, 300)
+        self.assertEqual(get_embed("www.test.com/1", max_height=300), embed)
+
+    @override_settings(WAGTAILEMBEDS_REFRESH_IN_BACKGROUND=False)
+    def test_expired_embed_fetched_when_not_refreshing_in_background(self):
+        self.create_expired_embed("www.test.com/1")
+
+        embed = get_embed("www.test.com/1")
+
+        self.assertEqual(embed.title, "Test: www.test.com/1 2")
+
+    def test_refresh_embeds(self):
+        embeds = [
+            self.create_expired_embed("www.test.com/1", max_width=400),
+            Embed.objects.create(
+                url="www.test.com/missing",
+                hash=get_embed_hash("www.test.com/missing"),
+                cache_until=now(),
+            ),
+        ]
+        self.hit_urls = []
+
+        refreshed = refresh_embeds(embeds)
+
+        self.assertEqual([embed.pk for embed in refreshed], [embeds[0].pk])
+        self.assertFalse(refreshed[0].is_expired)
+        self.assertEqual(refreshed[0].max_width, 400)
+        self.assertCountEqual(self.hit_urls, ["www.test.com/1", "www.test.com/missing"])
+        # The embed that couldn't be fetched is left as it was
+        self.assertTrue(Embed.objects.get(pk=embeds[1].pk).is_expired)
+
+    def test_refresh_embeds_deletes_embeds_without_max_height(self):
+        embed = self.create_expired_embed("www.test.com/1", max_height=300)
+        # Embeds saved before max_height was stored can't be fetched again
+        Embed.objects.filter(pk=embed.pk).update(max_height=None)
+        embed.refresh_from_db()
+
+        self.assertEqual(refresh_embeds([embed]), [])
+        self.assertFalse(Embed.objects.filter(pk=embed.pk).exists())
+
+    def test_refresh_embeds_limits_concurrency_per_provider(self):
+        lock = threading.Lock()
+        active = {}
+        max_active = {}
+
+        def slow_finder(url, max_width=None, max_height=None):
+            provider = url.split("/")[0]
+            with lock:
+                active[provider] = active.get(provider, 0) + 1
+                max_active[provider] = max(
+                    max_active.get(provider, 0), active[provider]
+                )
+            time.sleep(0.02)
+            with lock:
+                active[provider] -= 1
+            return self.dummy_finder(url, max_width, max_height)
+
+        embeds = [
+            Embed.objects.create(
+                url=f"{provider}/{i}",
+                hash=get_embed_hash(f"{provider}/{i}"),
+                cache_until=now(),
+            )
+            for provider in ["www.test.com", "www.example.com"]
+            for i in range(4)
+        ]
+        self.finders.stop()
+        with patch("wagtail.embeds.embeds.get_finders") as get_finders:
+            get_finders.return_value = [DummyFinder(slow_finder)]
+            refreshed = refresh_embeds(embeds, max_per_provider=1)
+        self.finders.start()
+
+        self.assertEqual(len(refreshed), 8)
+        self.assertEqual(max_active, {"www.test.com": 1, "www.example.com": 1})
+
+
 class TestEmbedHash(TestCase):
     def test_get_embed_hash(self):
         url = "www.test.com/1234"
@@ -491,6 +741,19 @@ class TestOembed(TestCase):
             "https://www.youtube.com/watch/",
         )
 
+    def test_oembed_timeout(self):
+        finder = OEmbedFinder(timeout=5)
+        with patch.object(
+            finder.session, "get", side_effect=requests.Timeout
+        ) as session_get:
+            self.assertRaises(
+                EmbedNotFoundException,
+                finder.find_embed,
+                "https://www.youtube.com/watch/",
+            )
+
+        self.assertEqual(session_get.call_args.kwargs["timeout"], 5)
+
     @responses.activate
     def test_oembed_non_json_response(self):
         responses.get(
@@ -1020,6 +1283,34 @@ class TestEmbedBlock(TestCase):
         empty_block_val = block.to_python("")
         self.assertIsNone(empty_block_val)
 
+    def test_bulk_to_python(self):
+        block = EmbedBlock(max_width=400)
+        values = block.bulk_to_python(
+            ["https://www.youtube.com/watch/1", "", "https://www.youtube.com/watch/2"]
+        )
+
+        self.assertEqual(values[0].url, "https://www.youtube.com/watch/1")
+        self.assertIsNone(values[1])
+        self.assertEqual(values[2].url, "https://www.youtube.com/watch/2")
+
+        with patch("wagtail.embeds.embeds.get_embeds") as get_embeds:
+            get_embeds.return_value = [
+                Embed(html="<p>second</p>"),
+                Embed(html="<p>first</p>"),
+            ]
+            # The embeds of all the values are looked up when the first is rendered
+            self.assertIn("<p>second</p>", values[2].html)
+            self.assertIn("<p>first</p>", values[0].html)
+
+        get_embeds.assert_called_once_with(
+            [
+                "https://www.youtube.com/watch/2",
+                "https://www.youtube.com/watch/1",
+            ],
+            400,
+            None,
+        )
+
     def test_serialize(self):
         block = EmbedBlock(required=False)
 
@@ -146,6 +146,33 @@ class TestFrontendMediaEmbedHandler(TestCase):
             "https://www.youtube.com/watch?v=O7D-1RG-VRk&t=25", None, None
         )
 
+    @patch("wagtail.embeds.embeds.get_embeds")
+    def test_expand_db_html_with_several_embeds(self, get_embeds):
+        get_embeds.return_value = [
+            Embed(html="first embed"),
+            None,
+            Embed(html="third embed"),
+        ]
+
+        result = expand_db_html(
+            '<embed embedtype="media" url="https://www.youtube.com/watch?v=1" />'
+            '<embed embedtype="media" url="https://www.youtube.com/watch?v=2" />'
+            '<embed embedtype="media" url="https://www.youtube.com/watch?v=3" />'
+        )
+
+        self.assertIn("first embed", result)
+        self.assertIn("third embed", result)
+        # The embeds are looked up together
+        get_embeds.assert_called_once_with(
+            [
+                "https://www.youtube.com/watch?v=1",
+                "https://www.youtube.com/watch?v=2",
+                "https://www.youtube.com/watch?v=3",
+            ],
+            None,
+            None,
+        )
+
 
 class TestEntityFeatureChooserUrls(TestCase):
     def test_chooser_urls_exist(self):
@@ -66,6 +66,17 @@ IMAGE_FORMAT_EXTENSIONS = {
     "heic": ".heic",
 }
 
+IMAGE_EXTENSION_MIME_TYPES = {
+    ".avif": "image/avif",
+    ".jpg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".svg": "image/svg+xml",
+    ".ico": "image/x-icon",
+    ".heic": "image/heic",
+}
+
 
 class SourceImageIOError(IOError):
     """
@@ -316,6 +327,31 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
 
         return self.file_hash
 
+    @classmethod
+    def construct_cache_key(cls, image_id):
+        return f"wagtail-image-{cls._meta.label_lower}-{image_id}"
+
+    @classmethod
+    def get_cached(cls, image_id):
+        """
+        Returns the image with the given ID, from the rendition cache if possible.
+        Otherwise, the image is fetched from the database and added to the cache,
+        where it remains until the image is saved or deleted.
+
+        Raises ``DoesNotExist`` if there is no image with this ID.
+        """
+        cache_backend = cls.get_rendition_model().cache_backend
+        image = cache_backend.get(cls.construct_cache_key(image_id))
+        if image is None:
+            image = cls.objects.get(id=image_id)
+            cache_backend.set(cls.construct_cache_key(image.id), image)
+        return image
+
+    def purge_from_cache(self):
+        self.get_rendition_model().cache_backend.delete(
+            self.construct_cache_key(self.id)
+        )
+
     def _set_image_file_metadata(self):
         self.file.open()
 
@@ -1343,6 +1379,20 @@ class AbstractRendition(ImageFileMixin, models.Model):
     def url(self):
         return self.file.url
 
+    @property
+    def mime_type(self):
+        """
+        The MIME type of the rendition file. This is derived from the file
+        extension, which is set from the output format when the rendition is
+        generated, so that the file doesn't need to be opened.
+        """
+        extension = os.path.splitext(self.file.name)[1].lower()
+        try:
+            return IMAGE_EXTENSION_MIME_TYPES[extension]
+        except KeyError:
+            with self.get_willow_image() as willow_image:
+                return willow_image.mime_type
+
     @property
     def alt(self):
         # 'decorative' and 'contextual_alt_text' exist only for ImageBlock
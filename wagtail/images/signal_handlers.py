@@ -20,6 +20,10 @@ def post_delete_purge_rendition_cache(instance, **kwargs):
     instance.purge_from_cache()
 
 
+def purge_image_cache(instance, **kwargs):
+    instance.purge_from_cache()
+
+
 def post_save_image_feature_detection(instance, **kwargs):
     if getattr(settings, "WAGTAILIMAGES_FEATURE_DETECTION_ENABLED", False):
         # Make sure the image is not from a fixture
@@ -36,6 +40,8 @@ def register_signal_handlers():
     Rendition = Image.get_rendition_model()
 
     post_save.connect(post_save_image_feature_detection, sender=Image)
+    post_save.connect(purge_image_cache, sender=Image)
+    post_delete.connect(purge_image_cache, sender=Image)
     post_delete.connect(post_delete_file_cleanup, sender=Image)
     post_delete.connect(post_delete_file_cleanup, sender=Rendition)
     post_delete.connect(post_delete_purge_rendition_cache, sender=Rendition)
@@ -1,14 +1,17 @@
 import os
 import unittest
 from io import BytesIO
+from unittest import mock
 
 import willow
 from django import forms, template
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.core.files.uploadedfile import InMemoryUploadedFile, TemporaryUploadedFile
+from django.db import connection
 from django.test import TestCase, override_settings
 from django.test.signals import setting_changed
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from taggit.forms import TagField, TagWidget
 from willow.image import (
@@ -606,6 +609,85 @@ class TestFrontendServeView(TestCase):
         )
         self.assertEqual(response["Cache-Control"], "max-age=3600, public")
 
+    def test_get_etag(self):
+        self.image.get_file_hash()
+        signature = generate_signature(self.image.id, "fill-800x600")
+        url = reverse(
+            "wagtailimages_serve", args=(signature, self.image.id, "fill-800x600")
+        )
+        response = self.client.get(url)
+        etag = response["ETag"]
+        rendition = self.image.get_rendition("fill-800x600")
+        self.assertEqual(
+            etag, f'"{self.image.get_file_hash()}-{rendition.focal_point_key}"'
+        )
+
+        # Conditional requests for an unchanged rendition are answered without
+        # sending the file
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response["Cache-Control"], "max-age=3600, public")
+
+        # Changing the focal point changes the rendition, and its ETag
+        self.image.focal_point_x = 100
+        self.image.focal_point_y = 100
+        self.image.focal_point_width = 50
+        self.image.focal_point_height = 50
+        self.image.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_no_etag_without_stored_file_hash(self):
+        Image.objects.filter(pk=self.image.pk).update(file_hash="")
+        signature = generate_signature(self.image.id, "fill-800x600")
+        url = reverse(
+            "wagtailimages_serve", args=(signature, self.image.id, "fill-800x600")
+        )
+
+        # The hash isn't computed, as this would require reading the whole file
+        with mock.patch.object(Image, "get_file_hash") as get_file_hash:
+            response = self.client.get(url)
+            response = self.client.get(url, HTTP_IF_NONE_MATCH='"-"')
+
+        get_file_hash.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response)
+
+    def test_get_existing_rendition_without_queries(self):
+        signature = generate_signature(self.image.id, "fill-800x600")
+        url = reverse(
+            "wagtailimages_serve", args=(signature, self.image.id, "fill-800x600")
+        )
+        self.client.get(url)
+
+        # The image and rendition are both found in the cache, and the MIME type
+        # is found without opening the file
+        with (
+            CaptureQueriesContext(connection) as queries,
+            mock.patch.object(
+                Image.get_rendition_model(), "get_willow_image"
+            ) as get_willow_image,
+        ):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "image/png")
+        get_willow_image.assert_not_called()
+        for query in queries:
+            self.assertNotIn("wagtailimages_", query["sql"])
+
+    def test_get_deleted_image(self):
+        signature = generate_signature(self.image.id, "fill-800x600")
+        url = reverse(
+            "wagtailimages_serve", args=(signature, self.image.id, "fill-800x600")
+        )
+        self.client.get(url)
+        self.image.delete()
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 404)
+
 
 class TestFrontendSendfileView(TestCase):
     def setUp(self):
@@ -1,7 +1,8 @@
 from django.core.exceptions import ImproperlyConfigured, PermissionDenied
-from django.http import FileResponse, HttpResponse
-from django.shortcuts import get_object_or_404, redirect
+from django.http import FileResponse, Http404, HttpResponse
+from django.shortcuts import redirect
 from django.urls import reverse
+from django.utils.cache import get_conditional_response, quote_etag
 from django.utils.decorators import classonlymethod, method_decorator
 from django.views.decorators.cache import cache_control
 from django.views.generic import View
@@ -42,7 +43,12 @@ class ServeView(View):
         ):
             raise PermissionDenied
 
-        image = get_object_or_404(self.model, id=image_id)
+        # The image is cached along with its renditions, so that serving an
+        # existing rendition doesn't need any database queries
+        try:
+            image = self.model.get_cached(image_id)
+        except self.model.DoesNotExist as e:
+            raise Http404 from e
 
         # Get/generate the rendition
         try:
@@ -60,20 +66,37 @@ class ServeView(View):
 
         return getattr(self, self.action)(rendition)
 
-    def serve(self, rendition):
-        with rendition.get_willow_image() as willow_image:
-            mime_type = willow_image.mime_type
+    def get_etag(self, rendition):
+        # The URL identifies the image and filter, so the rendition only changes
+        # if the image file or focal point does. The file hash is only used if it
+        # has already been stored, as computing it would mean reading the whole
+        # original file.
+        file_hash = rendition.image.file_hash
+        if not file_hash:
+            return None
+        return quote_etag(f"{file_hash}-{rendition.focal_point_key}")
+
+    def get_conditional_response(self, etag):
+        if etag is None:
+            return None
+        return get_conditional_response(self.request, etag=etag)
 
-        # Serve the file
-        rendition.file.open("rb")
-        response = FileResponse(rendition.file, content_type=mime_type)
+    def serve(self, rendition):
+        etag = self.get_etag(rendition)
+        response = self.get_conditional_response(etag)
+        if response is None:
+            # Serve the file
+            rendition.file.open("rb")
+            response = FileResponse(rendition.file, content_type=rendition.mime_type)
 
-        # Add a CSP header to prevent inline execution
-        response["Content-Security-Policy"] = "default-src 'none'"
+            # Add a CSP header to prevent inline execution
+            response["Content-Security-Policy"] = "default-src 'none'"
 
-        # Prevent browsers from auto-detecting the content-type of a document
-        response["X-Content-Type-Options"] = "nosniff"
+            # Prevent browsers from auto-detecting the content-type of a document
+            response["X-Content-Type-Options"] = "nosniff"
 
+        if etag is not None:
+            response["ETag"] = etag
         return response
 
     def redirect(self, rendition):
@@ -88,12 +111,17 @@ class SendFileView(ServeView):
     backend = None
 
     def serve(self, rendition):
-        response = sendfile(self.request, rendition.file.path, backend=self.backend)
+        etag = self.get_etag(rendition)
+        response = self.get_conditional_response(etag)
+        if response is None:
+            response = sendfile(self.request, rendition.file.path, backend=self.backend)
 
-        # Add a CSP header to prevent inline execution
-        response["Content-Security-Policy"] = "default-src 'none'"
+            # Add a CSP header to prevent inline execution
+            response["Content-Security-Policy"] = "default-src 'none'"
 
-        # Prevent browsers from auto-detecting the content-type of a document
-        response["X-Content-Type-Options"] = "nosniff"
+            # Prevent browsers from auto-detecting the content-type of a document
+            response["X-Content-Type-Options"] = "nosniff"
 
+        if etag is not None:
+            response["ETag"] = etag
         return response
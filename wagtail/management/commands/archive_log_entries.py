@@ -0,0 +1,53 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from wagtail.log_actions import registry as log_action_registry
+from wagtail.models.audit_log import LOG_ENTRY_ARCHIVE_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = "Move log entries older than a number of days to the archive tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=365,
+            help="Archive log entries older than this number of days (default: 365)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=LOG_ENTRY_ARCHIVE_BATCH_SIZE,
+            help=(
+                "Number of log entries to archive in each transaction "
+                f"(default: {LOG_ENTRY_ARCHIVE_BATCH_SIZE})"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        before = timezone.now() - timedelta(days=options["days"])
+
+        archived_count = 0
+        for log_model in log_action_registry.get_log_entry_models():
+            if log_model.get_archive_model() is None:
+                continue
+
+            model_archived_count = log_model.objects.archive(
+                before, batch_size=options["batch_size"]
+            )
+            archived_count += model_archived_count
+
+            if options["verbosity"] >= 2:
+                self.stdout.write(
+                    f"Archived {model_archived_count} {log_model._meta.verbose_name_plural}"
+                )
+
+        if options["verbosity"] >= 1:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Successfully archived {archived_count} log entries"
+                )
+            )
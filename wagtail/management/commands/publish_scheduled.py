@@ -1,8 +1,14 @@
-from django.apps import apps
+import time
+
 from django.core.management.base import BaseCommand
+from django.db import close_old_connections
 from django.utils import dateparse, timezone
 
-from wagtail.models import DraftStateMixin, Page, Revision
+from wagtail.actions.publish_scheduled import (
+    PUBLISH_SCHEDULED_BATCH_SIZE,
+    PublishScheduledAction,
+)
+from wagtail.models import Page
 
 
 def revision_date_expired(r):
@@ -25,93 +31,108 @@ class Command(BaseCommand):
             default=False,
             help="Dry run -- don't change anything.",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            dest="batch_size",
+            default=PUBLISH_SCHEDULED_BATCH_SIZE,
+            help="The number of objects to process in each transaction.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            dest="interval",
+            default=None,
+            help=(
+                "Keep running, checking for scheduled actions every INTERVAL seconds. "
+                "Several instances can safely run at the same time."
+            ),
+        )
 
     def handle(self, *args, **options):
-        dryrun = False
+        action = PublishScheduledAction(batch_size=options["batch_size"])
+
         if options["dryrun"]:
             self.stdout.write("Will do a dry run.")
-            dryrun = True
+            self.dry_run(action)
+            return
 
-        models = [Page]
-        models += [
-            model
-            for model in apps.get_models()
-            if issubclass(model, DraftStateMixin) and not issubclass(model, Page)
-        ]
+        while True:
+            unpublished_count, publish_lags = action.execute()
+            if options["verbosity"] > 1:
+                self.write_summary(unpublished_count, publish_lags)
 
-        # 1. get all expired objects with live = True
-        expired_objects = []
-        for model in models:
-            expired_objects += [
-                model.objects.filter(live=True, expire_at__lt=timezone.now()).order_by(
-                    "expire_at"
+            if options["interval"] is None:
+                return
+
+            # As in the request/response cycle, close database connections that
+            # have become unusable or outlived CONN_MAX_AGE between runs
+            close_old_connections()
+            time.sleep(options["interval"])
+
+    def write_summary(self, unpublished_count, publish_lags):
+        self.stdout.write(f"Unpublished {unpublished_count} expired objects.")
+        if publish_lags:
+            lags = [lag.total_seconds() for lag in publish_lags]
+            self.stdout.write(
+                "Published {} scheduled revisions. Publish lag: "
+                "average {:.1f}s, maximum {:.1f}s.".format(
+                    len(lags), sum(lags) / len(lags), max(lags)
                 )
-            ]
+            )
+        else:
+            self.stdout.write("Published 0 scheduled revisions.")
 
-        if dryrun:
-            self.stdout.write("\n---------------------------------")
-            if expired_objects:
-                self.stdout.write("Expired objects to be deactivated:")
-                self.stdout.write("Expiry datetime\t\tModel\t\tSlug\t\tName")
-                self.stdout.write("---------------\t\t-----\t\t----\t\t----")
-                for queryset in expired_objects:
-                    if queryset.model is Page:
-                        for obj in queryset:
-                            self.stdout.write(
-                                "{}\t{}\t{}\t{}".format(
-                                    obj.expire_at.strftime("%Y-%m-%d %H:%M"),
-                                    obj.specific_class.__name__,
-                                    obj.slug,
-                                    obj.title,
-                                )
+    def dry_run(self, action):
+        # 1. get all expired objects with live = True
+        expired_objects = action.get_expired_objects()
+
+        self.stdout.write("\n---------------------------------")
+        if expired_objects:
+            self.stdout.write("Expired objects to be deactivated:")
+            self.stdout.write("Expiry datetime\t\tModel\t\tSlug\t\tName")
+            self.stdout.write("---------------\t\t-----\t\t----\t\t----")
+            for queryset in expired_objects:
+                if queryset.model is Page:
+                    for obj in queryset:
+                        self.stdout.write(
+                            "{}\t{}\t{}\t{}".format(
+                                obj.expire_at.strftime("%Y-%m-%d %H:%M"),
+                                obj.specific_class.__name__,
+                                obj.slug,
+                                obj.title,
                             )
-                    else:
-                        for obj in queryset:
-                            self.stdout.write(
-                                "{}\t{}\t{}\t\t{}".format(
-                                    obj.expire_at.strftime("%Y-%m-%d %H:%M"),
-                                    queryset.model.__name__,
-                                    "",
-                                    str(obj),
-                                )
+                        )
+                else:
+                    for obj in queryset:
+                        self.stdout.write(
+                            "{}\t{}\t{}\t\t{}".format(
+                                obj.expire_at.strftime("%Y-%m-%d %H:%M"),
+                                queryset.model.__name__,
+                                "",
+                                str(obj),
                             )
-            else:
-                self.stdout.write("No expired objects to be deactivated found.")
+                        )
         else:
-            # Unpublish the expired objects
-            for queryset in expired_objects:
-                # Cast to list to make sure the query is fully evaluated
-                # before unpublishing anything
-                for obj in list(queryset):
-                    obj.unpublish(
-                        set_expired=True, log_action="wagtail.unpublish.scheduled"
-                    )
+            self.stdout.write("No expired objects to be deactivated found.")
 
         # 2. get all revisions that need to be published
-        revs_for_publishing = Revision.objects.filter(
-            approved_go_live_at__lt=timezone.now()
-        ).order_by("approved_go_live_at")
-        if dryrun:
-            self.stdout.write("\n---------------------------------")
-            if revs_for_publishing:
-                self.stdout.write("Revisions to be published:")
-                self.stdout.write("Go live datetime\tModel\t\tSlug\t\tName")
-                self.stdout.write("----------------\t-----\t\t----\t\t----")
-                for rp in revs_for_publishing:
-                    model = rp.content_type.model_class()
-                    rev_data = rp.content
-                    self.stdout.write(
-                        "{}\t{}\t{}\t\t{}".format(
-                            rp.approved_go_live_at.strftime("%Y-%m-%d %H:%M"),
-                            model.__name__,
-                            rev_data.get("slug", ""),
-                            rev_data.get("title", rp.object_str),
-                        )
+        revs_for_publishing = action.get_due_revisions()
+        self.stdout.write("\n---------------------------------")
+        if revs_for_publishing:
+            self.stdout.write("Revisions to be published:")
+            self.stdout.write("Go live datetime\tModel\t\tSlug\t\tName")
+            self.stdout.write("----------------\t-----\t\t----\t\t----")
+            for rp in revs_for_publishing:
+                model = rp.content_type.model_class()
+                rev_data = rp.content
+                self.stdout.write(
+                    "{}\t{}\t{}\t\t{}".format(
+                        rp.approved_go_live_at.strftime("%Y-%m-%d %H:%M"),
+                        model.__name__,
+                        rev_data.get("slug", ""),
+                        rev_data.get("title", rp.object_str),
                     )
-            else:
-                self.stdout.write("No objects to go live.")
+                )
         else:
-            for rp in revs_for_publishing:
-                # just run publish for the revision -- since the approved go
-                # live datetime is before now it will make the object live
-                rp.publish(log_action="wagtail.publish.scheduled")
+            self.stdout.write("No objects to go live.")
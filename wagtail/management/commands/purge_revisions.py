@@ -1,10 +1,15 @@
+import time
+
 from django.conf import settings
 from django.core.management.base import BaseCommand
-from django.db.models import Q
-from django.db.models.deletion import ProtectedError
+from django.db import models, transaction
+from django.db.models import OuterRef, Q, Subquery
+from django.db.models.deletion import ProtectedError, get_candidate_relations_to_delete
 from django.utils import timezone
 
-from wagtail.models import Revision, WorkflowState
+from wagtail.models import Comment, Revision, WorkflowState
+
+DEFAULT_BATCH_SIZE = 1000
 
 
 class Command(BaseCommand):
@@ -26,17 +31,49 @@ class Command(BaseCommand):
             action="store_true",
             help="Only delete revisions of non-page models",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of revisions to delete in each transaction",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Count the revisions that would be deleted, without deleting them",
+        )
 
     def handle(self, *args, **options):
         days = options.get("days")
         pages = options.get("pages")
         non_pages = options.get("non_pages")
+        batch_size = options["batch_size"]
+        dry_run = options["dry_run"]
+        verbosity = options["verbosity"]
 
+        def report_progress(revisions_deleted, elapsed):
+            if verbosity > 1:
+                self.stdout.write(
+                    "Deleted %d revisions in %.1fs" % (revisions_deleted, elapsed)
+                )
+
+        start_time = time.monotonic()
         revisions_deleted, protected_error_count = purge_revisions(
-            days=days, pages=pages, non_pages=non_pages
+            days=days,
+            pages=pages,
+            non_pages=non_pages,
+            batch_size=batch_size,
+            dry_run=dry_run,
+            progress_callback=report_progress,
         )
+        elapsed = time.monotonic() - start_time
 
-        if revisions_deleted:
+        if dry_run:
+            self.stdout.write(
+                "Would delete %d revisions. %d revisions would be ignored because one or more protected relations exist that prevent deletion."
+                % (revisions_deleted, protected_error_count)
+            )
+        elif revisions_deleted:
             self.stdout.write(
                 self.style.SUCCESS(
                     "Successfully deleted %s revisions" % revisions_deleted
@@ -48,11 +85,55 @@ class Command(BaseCommand):
                     % protected_error_count
                 )
             )
+            if verbosity > 1:
+                self.stdout.write(
+                    "Took %.1fs (%.0f revisions per second)"
+                    % (elapsed, revisions_deleted / elapsed if elapsed else 0)
+                )
         else:
             self.stdout.write("No revisions deleted")
 
 
-def purge_revisions(days=None, pages=True, non_pages=True):
+def get_protected_revisions_q():
+    """
+    Return a Q object matching revisions that are referenced through a
+    ``PROTECT`` or ``RESTRICT`` foreign key, and so cannot be deleted.
+    """
+    q = Q()
+    for related in get_candidate_relations_to_delete(Revision._meta):
+        if related.on_delete not in (models.PROTECT, models.RESTRICT):
+            continue
+        field = related.field
+        q |= Q(
+            **{
+                f"{field.target_field.attname}__in": related.related_model._base_manager.filter(
+                    **{f"{field.attname}__isnull": False}
+                ).values(field.attname)
+            }
+        )
+    return q
+
+
+def purge_revisions(
+    days=None,
+    pages=True,
+    non_pages=True,
+    batch_size=DEFAULT_BATCH_SIZE,
+    dry_run=False,
+    progress_callback=None,
+):
+    """
+    Delete revisions which are not the latest revision of their object,
+    approved to go live, or in moderation. Return a tuple of the number of
+    revisions deleted and the number of revisions left in place because they
+    are protected from deletion.
+
+    Revisions are deleted in batches of ``batch_size``, each in its own
+    transaction. If ``dry_run`` is true, nothing is deleted and the numbers
+    of revisions that would be deleted and ignored are returned instead.
+    ``progress_callback`` is called after each batch with the number of
+    revisions deleted so far and the elapsed time in seconds.
+    """
     if pages == non_pages:
         # If both are True or both are False, purge revisions of pages and non-pages
         objects = Revision.objects.all()
@@ -78,16 +159,77 @@ def purge_revisions(days=None, pages=True, non_pages=True):
         # only include revisions which were created before the cut off date
         purgeable_revisions = purgeable_revisions.filter(created_at__lt=purgeable_until)
 
+    # don't delete the latest revision of each object
+    latest_revision_id = (
+        Revision.objects.filter(
+            base_content_type_id=OuterRef("base_content_type_id"),
+            object_id=OuterRef("object_id"),
+        )
+        .order_by("-created_at", "-id")
+        .values("id")[:1]
+    )
+    purgeable_revisions = purgeable_revisions.exclude(id=Subquery(latest_revision_id))
+
+    protected_q = get_protected_revisions_q()
+    if protected_q:
+        protected_error_count = purgeable_revisions.filter(protected_q).count()
+        purgeable_revisions = purgeable_revisions.exclude(protected_q)
+    else:
+        protected_error_count = 0
+
+    if dry_run:
+        return purgeable_revisions.count(), protected_error_count
+
     deleted_revisions_count = 0
-    protected_error_count = 0
+    start_time = time.monotonic()
+    last_id = None
 
-    for revision in purgeable_revisions.iterator():
-        # don't delete the latest revision
-        if not revision.is_latest_revision():
-            try:
-                revision.delete()
-                deleted_revisions_count += 1
-            except ProtectedError:
-                protected_error_count += 1
+    while True:
+        batch = purgeable_revisions.order_by("id")
+        if last_id is not None:
+            batch = batch.filter(id__gt=last_id)
+        batch_ids = list(batch.values_list("id", flat=True)[:batch_size])
+        if not batch_ids:
+            break
+        last_id = batch_ids[-1]
+
+        try:
+            with transaction.atomic():
+                deleted_revisions_count += _delete_revisions(batch_ids)
+        except ProtectedError:
+            # A relation of one of the revisions is protected, so fall back to
+            # deleting the revisions in this batch one at a time
+            for revision in Revision.objects.filter(id__in=batch_ids):
+                try:
+                    with transaction.atomic():
+                        revision.delete()
+                    deleted_revisions_count += 1
+                except ProtectedError:
+                    protected_error_count += 1
+
+        if progress_callback:
+            progress_callback(deleted_revisions_count, time.monotonic() - start_time)
 
     return deleted_revisions_count, protected_error_count
+
+
+def _delete_revisions(revision_ids):
+    deleted_count = 0
+    revision_ids = set(revision_ids)
+
+    # Revisions with comments are deleted individually, so that Revision.delete()
+    # can move their comments to the next revision
+    while revisions_with_comments := list(
+        Revision.objects.filter(
+            id__in=Comment.objects.filter(revision_created_id__in=revision_ids).values(
+                "revision_created_id"
+            )
+        ).order_by("created_at", "id")
+    ):
+        for revision in revisions_with_comments:
+            revision.delete()
+            revision_ids.discard(revision.id)
+            deleted_count += 1
+
+    _, deleted_per_model = Revision.objects.filter(id__in=revision_ids).delete()
+    return deleted_count + deleted_per_model.get(Revision._meta.label, 0)
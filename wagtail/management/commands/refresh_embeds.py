@@ -0,0 +1,65 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils.timezone import now
+
+from wagtail.embeds.embeds import EMBED_REFRESH_MAX_PER_PROVIDER, refresh_embeds
+from wagtail.embeds.models import Embed
+
+
+class Command(BaseCommand):
+    help = "Fetches embeds that have expired or are about to expire again from their providers"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--expiring-within",
+            type=int,
+            default=60,
+            help="Refresh embeds that expire within this number of minutes (default: 60)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of embeds to refresh at a time (default: 100)",
+        )
+        parser.add_argument(
+            "--max-per-provider",
+            type=int,
+            default=EMBED_REFRESH_MAX_PER_PROVIDER,
+            help=(
+                "Maximum number of embeds fetched from each provider at the same time "
+                f"(default: {EMBED_REFRESH_MAX_PER_PROVIDER})"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        expiring_before = now() + timedelta(minutes=options["expiring_within"])
+        queryset = Embed.objects.filter(cache_until__lte=expiring_before).order_by("pk")
+
+        refreshed_count = 0
+        failed_count = 0
+        last_pk = 0
+        while True:
+            batch = list(queryset.filter(pk__gt=last_pk)[: options["batch_size"]])
+            if not batch:
+                break
+
+            refreshed = refresh_embeds(
+                batch, max_per_provider=options["max_per_provider"]
+            )
+            refreshed_count += len(refreshed)
+            failed_count += len(batch) - len(refreshed)
+            last_pk = batch[-1].pk
+
+            if options["verbosity"] >= 2:
+                self.stdout.write(
+                    f"Refreshed {len(refreshed)} of {len(batch)} embeds in batch"
+                )
+
+        if options["verbosity"] >= 1:
+            self.stdout.write(
+                self.style.SUCCESS(f"Successfully refreshed {refreshed_count} embeds")
+            )
+            if failed_count:
+                self.stdout.write(f"{failed_count} embeds could not be refreshed")
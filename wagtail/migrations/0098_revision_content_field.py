@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 11:47
+
+import django.core.serializers.json
+from django.db import migrations
+
+import wagtail.models.revisions
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtailcore", "0097_baselogentry_uuid_action_timestamp_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="revision",
+            name="content",
+            field=wagtail.models.revisions.RevisionContentField(
+                encoder=django.core.serializers.json.DjangoJSONEncoder,
+                verbose_name="content JSON",
+            ),
+        ),
+    ]
@@ -19,8 +19,10 @@ from wagtail.query import PageQuerySet  # noqa: F401
 from .audit_log import (  # noqa: F401
     BaseLogEntry,
     BaseLogEntryManager,
+    BaseModelLogEntry,
     LogEntryQuerySet,
     ModelLogEntry,
+    ModelLogEntryArchive,
 )
 from .content_types import get_default_page_content_type  # noqa: F401
 from .copying import _copy, _copy_m2m_relations, _extract_field_data  # noqa: F401
@@ -47,6 +49,11 @@ from .media import (  # noqa: F401
     get_root_collection_id,
 )
 from .orderable import Orderable  # noqa: F401
+from .page_tree import (  # noqa: F401
+    PageNode,
+    get_cached_page_tree,
+    invalidate_page_tree_cache,
+)
 from .pages import (  # noqa: F401
     COMMENTS_RELATION_NAME,
     PAGE_MODEL_CLASSES,
@@ -55,6 +62,7 @@ from .pages import (  # noqa: F401
     PAGE_PERMISSION_TYPES,
     PAGE_TEMPLATE_VAR,
     AbstractPage,
+    BasePageLogEntry,
     BasePageManager,
     Comment,
     CommentReply,
@@ -63,12 +71,16 @@ from .pages import (  # noqa: F401
     Page,
     PageBase,
     PageLogEntry,
+    PageLogEntryArchive,
+    PageLogEntryArchiveManager,
     PageLogEntryManager,
     PageLogEntryQuerySet,
     PageManager,
     PagePermissionTester,
     PageSubscription,
     PageViewRestriction,
+    PendingAliasUpdate,
+    PendingPageDeletion,
     WorkflowPage,
     get_page_content_types,
     get_page_models,
@@ -4,15 +4,18 @@ such as Page, but the definitions here should remain generic and not depend on t
 wagtail.models module or specific models such as Page.
 """
 
+import logging
 from collections import defaultdict
+from weakref import WeakValueDictionary
 
+from asgiref.local import Local
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Permission
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db import models
+from django.db import models, router, transaction
 from django.utils import timezone
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
@@ -20,6 +23,87 @@ from django.utils.translation import gettext_lazy as _
 from wagtail.log_actions import registry as log_action_registry
 from wagtail.users.utils import get_deleted_user_display_name
 
+logger = logging.getLogger("wagtail")
+
+# The number of log entries moved to the archive table in each transaction
+LOG_ENTRY_ARCHIVE_BATCH_SIZE = 1000
+
+# The LogEntryBuffers of each database connection, keyed by alias and then by the
+# savepoint IDs they were created in. The buffers are only held strongly by their
+# on_commit callbacks, so they are dropped along with these if the transaction or
+# savepoint is rolled back.
+_log_entry_buffers = Local()
+
+
+def buffer_log_entries():
+    return getattr(settings, "WAGTAIL_BUFFER_LOG_ENTRIES", False)
+
+
+class LogEntryBuffer:
+    """
+    Collects the log entries created within a database transaction (or savepoint),
+    and inserts them with a single query per log model once the transaction is
+    committed. Log entries are discarded if the transaction is rolled back.
+    """
+
+    def __init__(self, using):
+        self.using = using
+        self.log_entries = []
+        transaction.on_commit(self.flush, using=using, robust=True)
+
+    @classmethod
+    def get_for_connection(cls, using):
+        """
+        Return the buffer for the current transaction or savepoint of the ``using``
+        database connection, creating it if needed, or ``None`` if the connection
+        is not in a transaction.
+        """
+        connection = transaction.get_connection(using)
+        if not connection.in_atomic_block:
+            return None
+
+        buffers = getattr(_log_entry_buffers, using, None)
+        if buffers is None:
+            buffers = WeakValueDictionary()
+            setattr(_log_entry_buffers, using, buffers)
+
+        # Each savepoint has its own buffer, so that entries logged within it are
+        # inserted (or discarded) along with it
+        savepoint_ids = tuple(connection.savepoint_ids)
+        buffer = buffers.get(savepoint_ids)
+        if buffer is None:
+            buffer = cls(using)
+            buffers[savepoint_ids] = buffer
+        return buffer
+
+    def add(self, log_entry):
+        self.log_entries.append(log_entry)
+
+    def flush(self):
+        # Entries logged from now on belong to a new transaction
+        buffers = getattr(_log_entry_buffers, self.using, {})
+        for savepoint_ids, buffer in list(buffers.items()):
+            if buffer is self:
+                del buffers[savepoint_ids]
+
+        log_entries_by_model = defaultdict(list)
+        for log_entry in self.log_entries:
+            log_entries_by_model[type(log_entry)].append(log_entry)
+
+        # Entries are inserted in the order they were logged, so that entries of
+        # the same model with the same timestamp keep their order
+        for model, log_entries in log_entries_by_model.items():
+            try:
+                model.objects.using(self.using).bulk_create(log_entries)
+            except Exception:
+                # The changes being logged have already been committed, so there
+                # is nothing to roll back
+                logger.exception(
+                    "Failed to save %d %s",
+                    len(log_entries),
+                    model._meta.verbose_name_plural,
+                )
+
 
 class LogEntryQuerySet(models.QuerySet):
     def get_actions(self):
@@ -138,7 +222,9 @@ class BaseLogEntryManager(models.Manager):
             - title: the instance title
             - data: any additional metadata
             - content_changed, deleted - Boolean flags
-        :return: The new log entry
+        :return: The new log entry. If the ``WAGTAIL_BUFFER_LOG_ENTRIES`` setting is
+            enabled and a transaction is active, the entry is saved when the
+            transaction is committed.
         """
         if instance.pk is None:
             raise ValueError(
@@ -152,7 +238,7 @@ class BaseLogEntryManager(models.Manager):
             title = self.get_instance_title(instance)
 
         timestamp = kwargs.pop("timestamp", timezone.now())
-        return self.model.objects.create(
+        log_entry = self.model(
             content_type=ContentType.objects.get_for_model(
                 instance, for_concrete_model=False
             ),
@@ -163,6 +249,18 @@ class BaseLogEntryManager(models.Manager):
             **kwargs,
         )
 
+        using = self._db or router.db_for_write(self.model)
+        if buffer_log_entries():
+            buffer = LogEntryBuffer.get_for_connection(using)
+            if buffer is not None:
+                # The entry is saved when the transaction is committed
+                log_entry.full_clean()
+                buffer.add(log_entry)
+                return log_entry
+
+        log_entry.save(force_insert=True, using=using)
+        return log_entry
+
     def viewable_by_user(self, user):
         if user.is_superuser:
             return self.all()
@@ -212,6 +310,37 @@ class BaseLogEntryManager(models.Manager):
         """
         raise NotImplementedError  # must be implemented by subclass
 
+    def archive(self, before, batch_size=LOG_ENTRY_ARCHIVE_BATCH_SIZE):
+        """
+        Move the log entries with a timestamp earlier than ``before`` to the archive
+        model of this log model, keeping their IDs. Entries are moved in batches of
+        ``batch_size``, each in its own transaction. Returns the number of log entries
+        archived.
+        """
+        archive_model = self.model.get_archive_model()
+        if archive_model is None:
+            raise ValueError(f"{self.model._meta.label} has no archive model")
+
+        field_names = [field.attname for field in self.model._meta.concrete_fields]
+        pk_name = self.model._meta.pk.attname
+        queryset = self.filter(timestamp__lt=before).order_by(pk_name)
+
+        archived_count = 0
+        while True:
+            with transaction.atomic():
+                rows = list(queryset.values(*field_names)[:batch_size])
+                if not rows:
+                    break
+
+                archive_model.objects.bulk_create(
+                    [archive_model(**row) for row in rows]
+                )
+                self.filter(pk__in=[row[pk_name] for row in rows]).delete()
+
+            archived_count += len(rows)
+
+        return archived_count
+
 
 class BaseLogEntry(models.Model):
     content_type = models.ForeignKey(
@@ -274,6 +403,14 @@ class BaseLogEntry(models.Model):
         self.full_clean()
         return super().save(*args, **kwargs)
 
+    @classmethod
+    def get_archive_model(cls):
+        """
+        Return the model that old log entries of this model are moved to by
+        ``objects.archive()``, or ``None`` if they can't be archived.
+        """
+        return None
+
     def clean(self):
         if not log_action_registry.action_exists(self.action):
             raise ValidationError(
@@ -357,9 +494,9 @@ class ModelLogEntryManager(BaseLogEntryManager):
         )
 
 
-class ModelLogEntry(BaseLogEntry):
+class BaseModelLogEntry(BaseLogEntry):
     """
-    Simple logger for generic Django models
+    Base class for log entries of generic Django models
     """
 
     object_id = models.CharField(max_length=255, blank=False, db_index=True)
@@ -367,14 +504,39 @@ class ModelLogEntry(BaseLogEntry):
     objects = ModelLogEntryManager()
 
     class Meta(BaseLogEntry.Meta):
+        abstract = True
         ordering = ["-timestamp", "-id"]
-        verbose_name = _("model log entry")
-        verbose_name_plural = _("model log entries")
 
     def __str__(self):
-        return "ModelLogEntry %d: '%s' on '%s' with id %s" % (
+        return "%s %d: '%s' on '%s' with id %s" % (
+            self.__class__.__name__,
             self.pk,
             self.action,
             self.object_verbose_name(),
             self.object_id,
         )
+
+
+class ModelLogEntry(BaseModelLogEntry):
+    """
+    Simple logger for generic Django models
+    """
+
+    class Meta(BaseModelLogEntry.Meta):
+        verbose_name = _("model log entry")
+        verbose_name_plural = _("model log entries")
+
+    @classmethod
+    def get_archive_model(cls):
+        return ModelLogEntryArchive
+
+
+class ModelLogEntryArchive(BaseModelLogEntry):
+    """
+    Log entries of generic Django models that have been moved out of the
+    ``ModelLogEntry`` table by ``ModelLogEntry.objects.archive()``
+    """
+
+    class Meta(BaseModelLogEntry.Meta):
+        verbose_name = _("archived model log entry")
+        verbose_name_plural = _("archived model log entries")
@@ -1,5 +1,7 @@
+from collections import defaultdict
+
 from django.contrib.contenttypes.fields import GenericRelation
-from django.db import models
+from django.db import connections, models
 from modelcluster.fields import ParentalKey, ParentalManyToManyField
 from modelcluster.models import ClusterableModel
 
@@ -111,3 +113,65 @@ def _copy(source, exclude_fields=None, update_attrs=None):
         child_object_map = {}
 
     return target, child_object_map
+
+
+def _bulk_insert(objs, using):
+    """
+    Insert the given unsaved model instances into the database in as few queries
+    as possible, and set their primary keys.
+
+    Unlike ``QuerySet.bulk_create``, this supports multi-table inherited models,
+    and instances of different models that share a concrete parent model (such as
+    pages of different types). Rows are inserted into each parent table before the
+    tables that inherit from it. As with ``bulk_create``, ``save()`` is not called
+    and no signals are sent.
+
+    This requires a database that can return the primary keys of rows inserted in
+    bulk (see ``can_return_rows_from_bulk_insert``).
+    """
+    connection = connections[using]
+
+    for obj in objs:
+        obj._prepare_related_fields_for_save(operation_name="bulk_create")
+
+    # Group the instances by each of the tables they have rows in
+    objs_by_table_model = defaultdict(list)
+    for obj in objs:
+        model = obj._meta.concrete_model
+        for table_model in [model, *model._meta.get_parent_list()]:
+            objs_by_table_model[table_model].append(obj)
+
+    # Insert parent tables first, so that their primary keys can be used by the
+    # parent links of the tables that inherit from them
+    for table_model in sorted(
+        objs_by_table_model, key=lambda model: len(model._meta.get_parent_list())
+    ):
+        table_objs = objs_by_table_model[table_model]
+        opts = table_model._meta
+
+        for obj in table_objs:
+            for parent, link_field in opts.parents.items():
+                if link_field:
+                    setattr(obj, link_field.attname, obj._get_pk_val(parent._meta))
+
+        fields = [
+            field
+            for field in opts.local_concrete_fields
+            if field is not opts.auto_field and not field.generated
+        ]
+        returning_fields = opts.db_returning_fields if opts.auto_field else None
+        batch_size = max(connection.ops.bulk_batch_size(fields, table_objs), 1)
+
+        for start in range(0, len(table_objs), batch_size):
+            batch = table_objs[start : start + batch_size]
+            rows = table_model._base_manager.using(using)._insert(
+                batch, fields=fields, returning_fields=returning_fields
+            )
+            if returning_fields:
+                for obj, row in zip(batch, rows):
+                    for field, value in zip(returning_fields, row):
+                        setattr(obj, field.attname, value)
+
+    for obj in objs:
+        obj._state.adding = False
+        obj._state.db = using
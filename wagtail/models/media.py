@@ -7,6 +7,7 @@ from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 from treebeard.mp_tree import MP_Node
 
+from wagtail.permission_policies.base import invalidate_permissions_cache
 from wagtail.query import TreeQuerySet
 from wagtail.search import index
 
@@ -79,6 +80,11 @@ class Collection(MP_Node):
     def __str__(self):
         return self.name
 
+    def move(self, target, pos=None):
+        super().move(target, pos)
+        # Cached collection permissions refer to the paths of the moved collections
+        invalidate_permissions_cache()
+
     def get_ancestors(self, inclusive=False):
         return Collection.objects.ancestor_of(self, inclusive)
 
@@ -0,0 +1,258 @@
+"""
+Lightweight, read-only representations of page trees, for use when rendering
+navigation such as menus where full Page instances are not required.
+"""
+
+import uuid
+from types import SimpleNamespace
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+
+from .pages import Page
+
+PAGE_TREE_CACHE_PREFIX = "wagtail_page_tree"
+
+# Fields loaded for each node, in the order they are passed to PageNode()
+PAGE_NODE_FIELDS = (
+    "id",
+    "title",
+    "path",
+    "depth",
+    "url_path",
+    "locale_id",
+    "locale__language_code",
+    "content_type_id",
+)
+
+
+class PageNode:
+    """
+    A read-only reference to a page within a tree built by
+    :meth:`PageQuerySet.as_tree() <wagtail.query.PageQuerySet.as_tree>`.
+
+    Nodes only hold the fields needed for navigation, along with their
+    ``parent`` node and a list of ``children`` nodes, and provide the same URL
+    methods as ``Page``. The full specific page instance can be retrieved
+    (with an additional query) through the ``specific`` property.
+    """
+
+    __slots__ = (
+        "id",
+        "title",
+        "path",
+        "depth",
+        "url_path",
+        "locale_id",
+        "language_code",
+        "content_type_id",
+        "parent",
+        "children",
+        "_specific",
+        "_tree",
+    )
+
+    def __init__(
+        self,
+        id,
+        title,
+        path,
+        depth,
+        url_path,
+        locale_id,
+        language_code,
+        content_type_id,
+        parent=None,
+        tree=None,
+    ):
+        set_attr = object.__setattr__
+        set_attr(self, "id", id)
+        set_attr(self, "title", title)
+        set_attr(self, "path", path)
+        set_attr(self, "depth", depth)
+        set_attr(self, "url_path", url_path)
+        set_attr(self, "locale_id", locale_id)
+        set_attr(self, "language_code", language_code)
+        set_attr(self, "content_type_id", content_type_id)
+        set_attr(self, "parent", parent)
+        set_attr(self, "children", [])
+        set_attr(self, "_specific", None)
+        # an object shared by all nodes in the same tree, used to cache site root paths
+        set_attr(self, "_tree", tree if tree is not None else SimpleNamespace())
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} objects are read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} objects are read-only")
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.title}>"
+
+    def __str__(self):
+        return self.title
+
+    def __eq__(self, other):
+        if isinstance(other, PageNode):
+            return self.id == other.id
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.id)
+
+    @property
+    def pk(self):
+        return self.id
+
+    @property
+    def specific_class(self):
+        """
+        Return the class of the specific page, or ``None`` if the model no longer exists.
+        """
+        return ContentType.objects.get_for_id(self.content_type_id).model_class()
+
+    @property
+    def specific(self):
+        """
+        Return the specific page instance for this node, making a database query
+        the first time it is accessed.
+        """
+        if self._specific is None:
+            model = self.specific_class or Page
+            object.__setattr__(
+                self, "_specific", model._default_manager.get(pk=self.id)
+            )
+        return self._specific
+
+    def get_descendants(self):
+        """
+        Return a list of all descendant nodes, in tree order.
+        """
+        descendants = []
+        for child in self.children:
+            descendants.append(child)
+            descendants.extend(child.get_descendants())
+        return descendants
+
+    def _get_site_root_paths(self, cache_object=None):
+        return Page._get_site_root_paths(self, cache_object or self._tree)
+
+    _get_relevant_site_root_paths = Page._get_relevant_site_root_paths
+
+    def get_url_parts(self, request=None):
+        specific_class = self.specific_class
+        if (
+            specific_class is not None
+            and specific_class.get_url_parts is not Page.get_url_parts
+        ):
+            # the page model has custom URL routing, which may depend on fields
+            # that are not available on the node
+            return self.specific.get_url_parts(request=request)
+        return Page.get_url_parts(self, request=request)
+
+    get_full_url = Page.get_full_url
+    full_url = property(get_full_url)
+    get_url = Page.get_url
+    url = property(get_url)
+    relative_url = Page.relative_url
+
+
+def build_page_tree(rows):
+    """
+    Build a tree of PageNode objects from an iterable of tuples of the values
+    listed in PAGE_NODE_FIELDS, ordered by path. Return the list of nodes whose
+    parent is not included in ``rows``.
+    """
+    steplen = Page.steplen
+    tree = SimpleNamespace()
+    nodes_by_path = {}
+    top_level_nodes = []
+    for row in rows:
+        path = row[2]
+        parent = nodes_by_path.get(path[:-steplen])
+        node = PageNode(*row, parent=parent, tree=tree)
+        if parent is None:
+            top_level_nodes.append(node)
+        else:
+            parent.children.append(node)
+        nodes_by_path[path] = node
+    return top_level_nodes
+
+
+def _get_version_keys(path):
+    # one key for the page at the given path and each of its ancestors
+    return [
+        f"{PAGE_TREE_CACHE_PREFIX}:version:{path[:length]}"
+        for length in range(Page.steplen, len(path) + 1, Page.steplen)
+    ]
+
+
+def invalidate_page_tree_cache(page):
+    """
+    Invalidate any cached page trees that include the given page, or that are
+    rooted at one of its descendants.
+    """
+    version_keys = _get_version_keys(page.path)
+
+    def bump_versions():
+        cache.set_many({key: uuid.uuid4().hex for key in version_keys})
+
+    bump_versions()
+
+    # A concurrent request may cache the old tree under a new version before the
+    # changes are committed, so invalidate it once more after the commit
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(bump_versions)
+
+
+def get_cached_page_tree(root, max_depth=None, in_menu=False):
+    """
+    Return a PageNode for ``root`` with its live descendants (up to ``max_depth``
+    levels below it, and only those shown in menus if ``in_menu`` is true)
+    populated as ``children``.
+
+    The result is cached in Django's default cache, and invalidated whenever a
+    page in the tree (or one of the root's ancestors) is published, unpublished,
+    moved or deleted.
+    """
+    version_keys = _get_version_keys(root.path)
+    versions = cache.get_many(version_keys)
+    missing_versions = {
+        key: uuid.uuid4().hex for key in version_keys if key not in versions
+    }
+    if missing_versions:
+        cache.set_many(missing_versions)
+        versions.update(missing_versions)
+
+    cache_key = ":".join(
+        [
+            PAGE_TREE_CACHE_PREFIX,
+            str(root.pk),
+            str(max_depth),
+            str(int(bool(in_menu))),
+            uuid.uuid5(
+                uuid.NAMESPACE_OID, "".join(versions[key] for key in version_keys)
+            ).hex,
+        ]
+    )
+    rows = cache.get(cache_key)
+
+    if rows is None:
+        queryset = Page.objects.all()
+        descendants_q = queryset.descendant_of_q(root) & queryset.live_q()
+        if in_menu:
+            descendants_q &= queryset.in_menu_q()
+        if max_depth is not None:
+            descendants_q &= Q(depth__lte=root.depth + max_depth)
+        rows = list(
+            queryset.filter(Q(pk=root.pk) | descendants_q)
+            .order_by("path")
+            .values_list(*PAGE_NODE_FIELDS)
+        )
+        cache.set(cache_key, rows)
+
+    for node in build_page_tree(rows):
+        if node.id == root.pk:
+            return node
@@ -3,7 +3,6 @@ from __future__ import annotations
 import functools
 import logging
 import posixpath
-import uuid
 import warnings
 
 from django.conf import settings
@@ -11,13 +10,14 @@ from django.contrib.auth.models import Group, Permission
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.contenttypes.models import ContentType
 from django.core import checks
+from django.core.cache import cache
 from django.core.exceptions import (
     FieldDoesNotExist,
     PermissionDenied,
     ValidationError,
 )
 from django.db import models, transaction
-from django.db.models import Q, Value
+from django.db.models import Exists, OuterRef, Q, Value
 from django.db.models.expressions import Subquery
 from django.db.models.functions import Concat, Substr
 from django.dispatch import receiver
@@ -59,7 +59,6 @@ from wagtail.log_actions import registry as log_registry
 from wagtail.query import PageQuerySet
 from wagtail.search import index
 from wagtail.signals import (
-    page_published,
     page_slug_changed,
     pre_validate_delete,
 )
@@ -69,7 +68,6 @@ from wagtail.utils.timestamps import ensure_utc
 
 from .audit_log import BaseLogEntry, BaseLogEntryManager, LogEntryQuerySet
 from .content_types import get_default_page_content_type
-from .copying import _copy_m2m_relations
 from .draft_state import DraftStateMixin
 from .i18n import Locale, TranslatableMixin
 from .locking import LockableMixin
@@ -88,6 +86,10 @@ COMMENTS_RELATION_NAME = getattr(
     settings, "WAGTAIL_COMMENTS_RELATION_NAME", "wagtail_admin_comments"
 )
 
+VIEW_RESTRICTION_PATHS_CACHE_KEY = "wagtail_view_restriction_paths"
+# Increase the cache version whenever the structure of the cached paths changes
+VIEW_RESTRICTION_PATHS_CACHE_VERSION = 2
+
 
 @receiver(pre_validate_delete, sender=Locale)
 def reassign_root_page_locale_on_delete(sender, instance, **kwargs):
@@ -208,6 +210,80 @@ class BasePageManager(models.Manager):
             )
             page._parent_page = parent_page
 
+    def annotate_permissions_for_user(self, pages, user):
+        """
+        Annotates each page with a ``PagePermissionTester`` for the given user,
+        to be returned by ``page.permissions_for_user(user)``. The checks made by
+        ``can_delete()`` and ``can_move()`` that depend on the page's descendants
+        are evaluated for all pages in a single query, rather than one query per
+        page. This is implemented as a manager-only method instead of a QuerySet
+        method so it can be used with search results.
+
+        As with ``annotate_parent_page``, a QuerySet passed to this method will
+        be evaluated, so only use it when you are ready to consume the queryset.
+        """
+        testers = []
+        for page in pages:
+            tester = page.permissions_for_user(user)
+            page._permission_tester = tester
+            if isinstance(tester, PagePermissionTester):
+                testers.append(tester)
+
+        if not user.is_active or user.is_superuser:
+            return
+
+        # Only non-leaf pages need to query their descendants - for leaf pages, the
+        # page itself is the only page that would be deleted
+        subtree_states = {}
+        testers_to_check = []
+        for tester in testers:
+            page = tester.page
+            if not tester.permissions & {"add", "change"}:
+                continue
+            if page.is_leaf():
+                not_owned = page.owner_id is None or page.owner_id != user.pk
+                tester._subtree_state = {
+                    "has_live_pages": page.live,
+                    "has_pages_not_owned": not_owned,
+                    "has_live_or_not_owned_pages": page.live or not_owned,
+                }
+            else:
+                testers_to_check.append(tester)
+
+        if testers_to_check:
+            subtree = Page.objects.filter(path__startswith=OuterRef("path"))
+            for (
+                page_id,
+                has_live_pages,
+                has_pages_not_owned,
+                has_live_or_not_owned_pages,
+            ) in (
+                Page.objects.filter(
+                    pk__in=[tester.page.pk for tester in testers_to_check]
+                )
+                .annotate(
+                    has_live_pages=Exists(subtree.filter(live=True)),
+                    has_pages_not_owned=Exists(subtree.exclude(owner=user)),
+                    has_live_or_not_owned_pages=Exists(
+                        subtree.exclude(live=False, owner=user)
+                    ),
+                )
+                .values_list(
+                    "pk",
+                    "has_live_pages",
+                    "has_pages_not_owned",
+                    "has_live_or_not_owned_pages",
+                )
+            ):
+                subtree_states[page_id] = {
+                    "has_live_pages": has_live_pages,
+                    "has_pages_not_owned": has_pages_not_owned,
+                    "has_live_or_not_owned_pages": has_live_or_not_owned_pages,
+                }
+
+            for tester in testers_to_check:
+                tester._subtree_state = subtree_states.get(tester.page.pk)
+
 
 PageManager = BasePageManager.from_queryset(PageQuerySet)
 
@@ -1104,115 +1180,23 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
         :param revision: The revision of the original page that we are updating to (used for logging purposes)
         :type revision: Revision, Optional
         """
-        specific_self = self.specific
-
-        # Only compute this if necessary since it's quite a heavy operation
-        if _content is None:
-            _content = self.serializable_data()
-
-        # A list of IDs that have already been updated. This is just in case someone has
-        # created an alias loop (which is impossible to do with the UI Wagtail provides)
-        _updated_ids = _updated_ids or []
-
-        for alias in self.specific_class.objects.filter(alias_of=self).exclude(
-            id__in=_updated_ids
-        ):
-            # FIXME: Switch to the same fields that are excluded from copy
-            # We can't do this right now because we can't exclude fields from with_content_json
-            exclude_fields = [
-                "id",
-                "path",
-                "depth",
-                "numchild",
-                "url_path",
-                "path",
-                "index_entries",
-                "postgres_index_entries",
-            ]
-
-            # Copy field content
-            alias_updated = alias.with_content_json(_content)
-
-            # Publish the alias if it's currently in draft
-            alias_updated.live = True
-            alias_updated.has_unpublished_changes = False
-
-            # Copy child relations
-            child_object_map = specific_self.copy_all_child_relations(
-                target=alias_updated, exclude=exclude_fields
-            )
-
-            # Process child objects
-            # This has two jobs:
-            #  - If the alias is in a different locale, this updates the
-            #    locale of any translatable child objects to match
-            #  - If the alias is not a translation of the original, this
-            #    changes the translation_key field of all child objects
-            #    so they do not clash
-            if child_object_map:
-                alias_is_translation = alias.translation_key == self.translation_key
-
-                def process_child_object(child_object):
-                    if isinstance(child_object, TranslatableMixin):
-                        # Child object's locale must always match the page
-                        child_object.locale = alias_updated.locale
-
-                        # If the alias isn't a translation of the original page,
-                        # change the child object's translation_keys so they are
-                        # not either
-                        if not alias_is_translation:
-                            child_object.translation_key = uuid.uuid4()
-
-                for (rel, previous_id), child_objects in child_object_map.items():
-                    if previous_id is None:
-                        for child_object in child_objects:
-                            process_child_object(child_object)
-                    else:
-                        process_child_object(child_objects)
-
-            # Copy M2M relations
-            _copy_m2m_relations(
-                specific_self, alias_updated, exclude_fields=exclude_fields
-            )
-
-            # Don't change the aliases slug
-            # Aliases can have their own slugs so they can be siblings of the original
-            alias_updated.slug = alias.slug
-            alias_updated.set_url_path(alias_updated.get_parent())
-
-            # Aliases don't have revisions, so update fields that would normally be updated by save_revision
-            alias_updated.draft_title = alias_updated.title
-            alias_updated.latest_revision_created_at = self.latest_revision_created_at
-
-            alias_updated.save(clean=False)
-
-            page_published.send(
-                sender=alias_updated.specific_class,
-                instance=alias_updated,
-                revision=revision,
-                alias=True,
-            )
-
-            # Update any aliases of that alias
-
-            # Design note:
-            # It could be argued that this will be faster if we just changed these alias-of-alias
-            # pages to all point to the original page and avoid having to update them recursively.
-            #
-            # But, it's useful to have a record of how aliases have been chained.
-            # For example, In Wagtail Localize, we use aliases to create mirrored trees, but those
-            # trees themselves could have aliases within them. If an alias within a tree is
-            # converted to a regular page, we want the alias in the mirrored tree to follow that
-            # new page and stop receiving updates from the original page.
-            #
-            # Doing it this way requires an extra lookup query per alias but this is small in
-            # comparison to the work required to update the alias.
-
-            alias.update_aliases(
-                revision=revision,
-                _content=_content,
-                _updated_ids=_updated_ids,
-            )
+        from wagtail.actions.update_aliases import UpdateAliasesAction
+
+        # Design note:
+        # It could be argued that this will be faster if we just changed alias-of-alias
+        # pages to all point to the original page and avoid having to update them recursively.
+        #
+        # But, it's useful to have a record of how aliases have been chained.
+        # For example, In Wagtail Localize, we use aliases to create mirrored trees, but those
+        # trees themselves could have aliases within them. If an alias within a tree is
+        # converted to a regular page, we want the alias in the mirrored tree to follow that
+        # new page and stop receiving updates from the original page.
+        #
+        # Doing it this way requires an extra lookup query per level of aliases but this is
+        # small in comparison to the work required to update the aliases.
+        UpdateAliasesAction(
+            self, revision=revision, content=_content, exclude_ids=_updated_ids
+        ).execute()
 
     update_aliases.alters_data = True
 
@@ -1813,6 +1797,11 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
         )
         if is_overridden and not isinstance(self, self.specific_class):
             return self.specific_deferred.permissions_for_user(user)
+
+        # Use the tester added by PageManager.annotate_permissions_for_user, if any
+        tester = getattr(self, "_permission_tester", None)
+        if tester is not None and tester.user is user:
+            return tester
         return PagePermissionTester(user, self)
 
     def is_previewable(self):
@@ -1934,6 +1923,19 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
         """
         page_ids_to_check = set()
 
+        if PageViewRestriction.restricted_paths_cache_enabled():
+            restricted_paths = PageViewRestriction.get_restricted_paths()
+
+            # Check the current page and each of its ancestors for view restrictions,
+            # by looking up the paths in the cached index
+            for length in range(self.steplen, len(self.path) + 1, self.steplen):
+                page_ids_to_check.update(restricted_paths.get(self.path[:length], ()))
+
+            if not page_ids_to_check:
+                return PageViewRestriction.objects.none()
+
+            return PageViewRestriction.objects.filter(page_id__in=page_ids_to_check)
+
         def add_page_to_check_list(page):
             # If the page is an alias, add the source page to the check list instead
             if page.alias_of:
@@ -2193,6 +2195,9 @@ class PagePermissionTester:
         self.permission_policy = page_permission_policy
         self.page = page
         self.page_is_root = page.depth == 1  # Equivalent to page.is_root()
+        # The results of the checks on the pages that deleting this page would
+        # delete, if precomputed by PageManager.annotate_permissions_for_user
+        self._subtree_state = None
 
         if self.user.is_active and not self.user.is_superuser:
             self.permissions = {
@@ -2276,26 +2281,36 @@ class PagePermissionTester:
             # if the user does not have publish permission, we also need to confirm that there
             # are no published pages here
             if "publish" not in self.permissions:
-                pages_to_delete = self.page.get_descendants(inclusive=True)
-                if pages_to_delete.live().exists():
+                if self._check_pages_to_delete("has_live_pages"):
                     return False
 
             return True
 
         elif "add" in self.permissions:
-            pages_to_delete = self.page.get_descendants(inclusive=True)
             if "publish" in self.permissions:
                 # we don't care about live state, but all pages must be owned by this user
                 # (i.e. eliminating pages owned by this user must give us the empty set)
-                return not pages_to_delete.exclude(owner=self.user).exists()
+                return not self._check_pages_to_delete("has_pages_not_owned")
             else:
                 # all pages must be owned by this user and non-live
                 # (i.e. eliminating non-live pages owned by this user must give us the empty set)
-                return not pages_to_delete.exclude(live=False, owner=self.user).exists()
+                return not self._check_pages_to_delete("has_live_or_not_owned_pages")
 
         else:
             return False
 
+    def _check_pages_to_delete(self, check):
+        if self._subtree_state is not None:
+            return self._subtree_state[check]
+
+        pages_to_delete = self.page.get_descendants(inclusive=True)
+        if check == "has_live_pages":
+            return pages_to_delete.live().exists()
+        elif check == "has_pages_not_owned":
+            return pages_to_delete.exclude(owner=self.user).exists()
+        elif check == "has_live_or_not_owned_pages":
+            return pages_to_delete.exclude(live=False, owner=self.user).exists()
+
     def can_unpublish(self):
         if not self.user.is_active:
             return False
@@ -2481,6 +2496,106 @@ class PageViewRestriction(BaseViewRestriction):
         verbose_name = _("page view restriction")
         verbose_name_plural = _("page view restrictions")
 
+    @staticmethod
+    def get_restricted_paths():
+        """
+        Return a dict mapping the path of each page that has view restrictions
+        applied to it to the IDs of the pages whose restrictions apply.
+
+        Aliases use the view restrictions of their source page, so the paths of
+        aliases of restricted pages are included too, mapped to the source page.
+        Pages that are not in the dict, and have no ancestors in the dict, are
+        public. If the ``WAGTAIL_CACHE_VIEW_RESTRICTIONS`` setting is enabled, the
+        result is cached, and invalidated whenever view restrictions are changed
+        or pages are moved.
+        """
+        return PageViewRestriction._get_cached_paths()[1]
+
+    @staticmethod
+    def get_restricted_page_paths():
+        """
+        Return the set of paths of the pages that view restrictions are set on,
+        including aliases. This is cached along with ``get_restricted_paths()``.
+        """
+        return PageViewRestriction._get_cached_paths()[0]
+
+    @staticmethod
+    def restricted_paths_cache_enabled():
+        # The cache is only invalidated in the process that changes the view
+        # restrictions, so it must be opted into when the cache is shared
+        return getattr(settings, "WAGTAIL_CACHE_VIEW_RESTRICTIONS", False)
+
+    @staticmethod
+    def _get_cached_paths():
+        if PageViewRestriction.restricted_paths_cache_enabled():
+            result = cache.get(
+                VIEW_RESTRICTION_PATHS_CACHE_KEY,
+                version=VIEW_RESTRICTION_PATHS_CACHE_VERSION,
+            )
+        else:
+            result = None
+
+        if result is None:
+            restricted_page_paths = set()
+            restricted_paths = {}
+
+            source_page_ids = {}
+            for page_id, path, alias_of_id in (
+                PageViewRestriction.objects.values_list(
+                    "page_id", "page__path", "page__alias_of_id"
+                )
+                .order_by()
+                .distinct()
+            ):
+                restricted_page_paths.add(path)
+                # Restrictions on alias pages are ignored when checking pages, as
+                # aliases cannot have their own
+                if alias_of_id is None:
+                    restricted_paths.setdefault(path, set()).add(page_id)
+                    source_page_ids[page_id] = page_id
+
+            # Map aliases (and aliases of aliases) back to the restricted source page
+            while source_page_ids:
+                alias_source_page_ids = {}
+                for page_id, path, alias_of_id in Page.objects.filter(
+                    alias_of_id__in=source_page_ids
+                ).values_list("id", "path", "alias_of_id"):
+                    source_page_id = source_page_ids[alias_of_id]
+                    restricted_paths.setdefault(path, set()).add(source_page_id)
+                    alias_source_page_ids[page_id] = source_page_id
+                source_page_ids = alias_source_page_ids
+
+            result = (restricted_page_paths, restricted_paths)
+            if PageViewRestriction.restricted_paths_cache_enabled():
+                cache.set(
+                    VIEW_RESTRICTION_PATHS_CACHE_KEY,
+                    result,
+                    3600,
+                    version=VIEW_RESTRICTION_PATHS_CACHE_VERSION,
+                )
+
+        return result
+
+    @staticmethod
+    def clear_restricted_paths_cache():
+        if not PageViewRestriction.restricted_paths_cache_enabled():
+            return
+
+        cache.delete(
+            VIEW_RESTRICTION_PATHS_CACHE_KEY,
+            version=VIEW_RESTRICTION_PATHS_CACHE_VERSION,
+        )
+
+        # A concurrent request may cache the old paths again before the changes are
+        # committed, so clear the cache once more after the commit
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(
+                lambda: cache.delete(
+                    VIEW_RESTRICTION_PATHS_CACHE_KEY,
+                    version=VIEW_RESTRICTION_PATHS_CACHE_VERSION,
+                )
+            )
+
     def save(self, user=None, **kwargs):
         """
         Custom save handler to include logging.
@@ -2614,19 +2729,32 @@ class PageLogEntryManager(BaseLogEntryManager):
             or root_page_permissions.can_edit()
         ):
             # Include deleted entries
-            q = q | Q(
-                page_id__in=Subquery(
-                    PageLogEntry.objects.filter(deleted=True).values("page_id")
-                )
-            )
+            q = q | self.get_deleted_pages_q()
 
-        return PageLogEntry.objects.filter(q)
+        return self.filter(q)
+
+    def get_deleted_pages_q(self):
+        return Q(
+            page_id__in=Subquery(
+                PageLogEntry.objects.filter(deleted=True).values("page_id")
+            )
+        )
 
     def for_instance(self, instance):
         return self.filter(page=instance)
 
 
-class PageLogEntry(BaseLogEntry):
+class PageLogEntryArchiveManager(PageLogEntryManager):
+    def get_deleted_pages_q(self):
+        # A page may have been deleted after its older log entries were archived
+        return super().get_deleted_pages_q() | Q(
+            page_id__in=Subquery(
+                PageLogEntryArchive.objects.filter(deleted=True).values("page_id")
+            )
+        )
+
+
+class BasePageLogEntry(BaseLogEntry):
     page = models.ForeignKey(
         "wagtailcore.Page",
         on_delete=models.DO_NOTHING,
@@ -2637,12 +2765,12 @@ class PageLogEntry(BaseLogEntry):
     objects = PageLogEntryManager()
 
     class Meta(BaseLogEntry.Meta):
+        abstract = True
         ordering = ["-timestamp", "-id"]
-        verbose_name = _("page log entry")
-        verbose_name_plural = _("page log entries")
 
     def __str__(self):
-        return "PageLogEntry %d: '%s' on '%s' with id %s" % (
+        return "%s %d: '%s' on '%s' with id %s" % (
+            self.__class__.__name__,
             self.pk,
             self.action,
             self.object_verbose_name(),
@@ -2662,6 +2790,29 @@ class PageLogEntry(BaseLogEntry):
             return super().message
 
 
+class PageLogEntry(BasePageLogEntry):
+    class Meta(BasePageLogEntry.Meta):
+        verbose_name = _("page log entry")
+        verbose_name_plural = _("page log entries")
+
+    @classmethod
+    def get_archive_model(cls):
+        return PageLogEntryArchive
+
+
+class PageLogEntryArchive(BasePageLogEntry):
+    """
+    Page log entries that have been moved out of the ``PageLogEntry`` table by
+    ``PageLogEntry.objects.archive()``
+    """
+
+    objects = PageLogEntryArchiveManager()
+
+    class Meta(BasePageLogEntry.Meta):
+        verbose_name = _("archived page log entry")
+        verbose_name_plural = _("archived page log entries")
+
+
 class Comment(ClusterableModel):
     """
     A comment on a field, or a field within a streamfield block
@@ -2852,3 +3003,82 @@ class PageSubscription(models.Model):
         unique_together = [
             ("page", "user"),
         ]
+
+
+class PendingPageDeletion(models.Model):
+    """
+    Marks a page whose subtree is being deleted in batches by a background task.
+
+    The record is created before any pages are deleted, and is removed along with
+    the page itself once all of its descendants have been deleted, so that an
+    interrupted deletion can be identified and resumed.
+    """
+
+    page = models.OneToOneField(
+        "Page",
+        verbose_name=_("page"),
+        on_delete=models.CASCADE,
+        related_name="pending_deletion",
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_("requested by"),
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
+    created_at = models.DateTimeField(verbose_name=_("created at"), auto_now_add=True)
+    total_pages = models.PositiveIntegerField(verbose_name=_("total pages"), default=0)
+    deleted_pages = models.PositiveIntegerField(
+        verbose_name=_("deleted pages"), default=0
+    )
+
+    wagtail_reference_index_ignore = True
+
+    class Meta:
+        verbose_name = _("pending page deletion")
+        verbose_name_plural = _("pending page deletions")
+
+    def __str__(self):
+        return f"Pending deletion of page {self.page_id}"
+
+
+class PendingAliasUpdate(models.Model):
+    """
+    Records that the aliases of a page are being updated in batches by a background
+    task, along with the progress of the update.
+
+    The record is removed once all of the aliases have been updated.
+    """
+
+    page = models.OneToOneField(
+        "Page",
+        verbose_name=_("page"),
+        on_delete=models.CASCADE,
+        related_name="pending_alias_update",
+    )
+    revision = models.ForeignKey(
+        "wagtailcore.Revision",
+        verbose_name=_("revision"),
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
+    created_at = models.DateTimeField(verbose_name=_("created at"), auto_now_add=True)
+    total_aliases = models.PositiveIntegerField(
+        verbose_name=_("total aliases"), default=0
+    )
+    updated_aliases = models.PositiveIntegerField(
+        verbose_name=_("updated aliases"), default=0
+    )
+
+    wagtail_reference_index_ignore = True
+
+    class Meta:
+        verbose_name = _("pending alias update")
+        verbose_name_plural = _("pending alias updates")
+
+    def __str__(self):
+        return f"Pending update of aliases of page {self.page_id}"
@@ -1,4 +1,7 @@
+import base64
+import json
 import logging
+import zlib
 
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
@@ -27,6 +30,45 @@ from .i18n import TranslatableMixin
 logger = logging.getLogger("wagtail")
 
 
+# Key marking a compressed revision content value. Model field names cannot contain
+# double underscores, so this can never clash with serialized content.
+COMPRESSED_CONTENT_KEY = "__compressed__"
+
+
+class RevisionContentField(models.JSONField):
+    """
+    A JSONField that, when the ``WAGTAIL_COMPRESS_REVISIONS`` setting is enabled,
+    stores its value zlib-compressed and base64-encoded within a JSON object.
+    Compressed values are decompressed transparently when loaded from the
+    database, so both formats can be read regardless of the setting.
+    """
+
+    def get_prep_value(self, value):
+        value = super().get_prep_value(value)
+        if isinstance(value, dict) and getattr(
+            settings, "WAGTAIL_COMPRESS_REVISIONS", False
+        ):
+            value = self.compress(value)
+        return value
+
+    def from_db_value(self, value, expression, connection):
+        value = super().from_db_value(value, expression, connection)
+        if isinstance(value, dict) and COMPRESSED_CONTENT_KEY in value:
+            value = self.decompress(value)
+        return value
+
+    def compress(self, value):
+        data = json.dumps(value, cls=self.encoder, separators=(",", ":"))
+        return {
+            COMPRESSED_CONTENT_KEY: "zlib",
+            "data": base64.b64encode(zlib.compress(data.encode())).decode("ascii"),
+        }
+
+    def decompress(self, value):
+        data = zlib.decompress(base64.b64decode(value["data"]))
+        return json.loads(data, cls=self.decoder)
+
+
 class RevisionQuerySet(models.QuerySet):
     def page_revisions_q(self):
         return Q(base_content_type=get_default_page_content_type())
@@ -107,7 +149,7 @@ class Revision(models.Model):
         related_name="wagtail_revisions",
     )
     object_str = models.TextField(default="")
-    content = models.JSONField(
+    content = RevisionContentField(
         verbose_name=_("content JSON"), encoder=DjangoJSONEncoder
     )
     approved_go_live_at = models.DateTimeField(
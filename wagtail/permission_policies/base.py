@@ -1,12 +1,47 @@
+import uuid
+
+from django.conf import settings
 from django.contrib.auth import get_permission_codename, get_user_model
 from django.contrib.auth.models import Permission
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import transaction
 from django.db.models import Q
 from django.utils.functional import cached_property
 
 from wagtail.coreutils import resolve_model_string
 
+PERMISSIONS_CACHE_PREFIX = "wagtail_permissions"
+PERMISSIONS_CACHE_VERSION_KEY = f"{PERMISSIONS_CACHE_PREFIX}:version"
+PERMISSIONS_CACHE_TIMEOUT = 3600
+
+
+def get_permissions_cache_version():
+    """
+    Return a token that identifies the current state of all permission records,
+    for use in the keys of permissions cached by
+    BasePermissionPolicy.get_cached_permissions_for_user.
+    """
+    version = cache.get(PERMISSIONS_CACHE_VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.set(PERMISSIONS_CACHE_VERSION_KEY, version, None)
+    return version
+
+
+def invalidate_permissions_cache():
+    """
+    Invalidate the permissions of all users cached by
+    BasePermissionPolicy.get_cached_permissions_for_user.
+    """
+    cache.delete(PERMISSIONS_CACHE_VERSION_KEY)
+
+    # A concurrent request may cache the old permissions under a new version before
+    # the changes are committed, so invalidate them once more after the commit
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: cache.delete(PERMISSIONS_CACHE_VERSION_KEY))
+
 
 class BasePermissionPolicy:
     """
@@ -64,11 +99,44 @@ class BasePermissionPolicy:
         if hasattr(user, self.permission_cache_name):
             perms = getattr(user, self.permission_cache_name)
         else:
-            perms = self.get_all_permissions_for_user(user)
+            if self._use_shared_permission_cache(user):
+                perms = self._get_shared_cached_permissions_for_user(user)
+            else:
+                perms = self.get_all_permissions_for_user(user)
             if self.permission_cache_name:
                 setattr(user, self.permission_cache_name, perms)
         return perms
 
+    def _use_shared_permission_cache(self, user):
+        # Permissions of inactive, anonymous and superusers can be determined
+        # without a query, so are not worth caching
+        return (
+            self.permission_cache_name
+            and getattr(settings, "WAGTAIL_CACHE_PERMISSIONS", False)
+            and user.is_active
+            and user.is_authenticated
+            and not user.is_superuser
+        )
+
+    def _get_shared_cached_permissions_for_user(self, user):
+        """
+        Return a list of all permissions that the given user has on this model,
+        using Django's cache to share them between requests.
+        """
+        cache_key = ":".join(
+            [
+                PERMISSIONS_CACHE_PREFIX,
+                self.permission_cache_name,
+                str(user.pk),
+                get_permissions_cache_version(),
+            ]
+        )
+        perms = cache.get(cache_key)
+        if perms is None:
+            perms = list(self.get_all_permissions_for_user(user))
+            cache.set(cache_key, perms, PERMISSIONS_CACHE_TIMEOUT)
+        return perms
+
     # Basic user permission tests. Most policies are expected to override these,
     # since the default implementation is to query the set of permitted users
     # (which is pretty inefficient).
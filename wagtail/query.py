@@ -6,7 +6,8 @@ from typing import Any
 
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import CharField, Prefetch, Q
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import CharField, Prefetch, Q, prefetch_related_objects
 from django.db.models.expressions import Exists, OuterRef
 from django.db.models.functions import Cast, Length, Substr
 from django.db.models.query import ModelIterable
@@ -143,6 +144,9 @@ class SpecificQuerySetMixin:
         self._defer_streamfields = False
         self._specific_select_related_fields = ()
         self._specific_prefetch_related_lookups = ()
+        # set by filters such as PageQuerySet.type() that restrict the results to a
+        # known set of models, allowing SpecificIterable to fetch them in one query
+        self._specific_models = None
 
     def _clone(self):
         """Ensure clones inherit custom attribute values."""
@@ -152,6 +156,33 @@ class SpecificQuerySetMixin:
         clone._specific_prefetch_related_lookups = (
             self._specific_prefetch_related_lookups
         )
+        clone._specific_models = self._specific_models
+        return clone
+
+    def _restrict_specific_models(self, models):
+        """
+        Record that the results of this queryset can only be instances of the given
+        models (typically after applying a content type filter).
+        """
+        models = frozenset(models)
+        if self._specific_models is not None:
+            models &= self._specific_models
+        self._specific_models = models
+
+    def __or__(self, other):
+        combined = super().__or__(other)
+        if combined is not self and combined is not other:
+            combined._specific_models = None
+        return combined
+
+    def __xor__(self, other):
+        combined = super().__xor__(other)
+        combined._specific_models = None
+        return combined
+
+    def _combinator_query(self, *args, **kwargs):
+        clone = super()._combinator_query(*args, **kwargs)
+        clone._specific_models = None
         return clone
 
     def specific(self, defer=False):
@@ -369,7 +400,11 @@ class PageQuerySet(SearchableQuerySetMixin, SpecificQuerySetMixin, TreeQuerySet)
         This filters the QuerySet to only contain pages that are an instance
         of the specified model(s) (including subclasses).
         """
-        return self.filter(self.type_q(*types))
+        clone = self.filter(self.type_q(*types))
+        clone._restrict_specific_models(
+            model for model in apps.get_models() if issubclass(model, types)
+        )
+        return clone
 
     def not_type(self, *types):
         """
@@ -386,7 +421,9 @@ class PageQuerySet(SearchableQuerySetMixin, SpecificQuerySetMixin, TreeQuerySet)
         This filters the QuerySet to only contain pages that are an instance of the specified model(s)
         (matching the model exactly, not subclasses).
         """
-        return self.filter(self.exact_type_q(*types))
+        clone = self.filter(self.exact_type_q(*types))
+        clone._restrict_specific_models(types)
+        return clone
 
     def not_exact_type(self, *types):
         """
@@ -395,12 +432,28 @@ class PageQuerySet(SearchableQuerySetMixin, SpecificQuerySetMixin, TreeQuerySet)
         """
         return self.exclude(self.exact_type_q(*types))
 
+    def as_tree(self):
+        """
+        Return the pages in this queryset as a tree of lightweight, read-only
+        :class:`~wagtail.models.PageNode` objects, fetched in a single query.
+        Each node's ``children`` contains the nodes for its child pages that are
+        included in the queryset. The return value is the list of nodes whose
+        parent page is not included in the queryset.
+        """
+        from wagtail.models.page_tree import PAGE_NODE_FIELDS, build_page_tree
+
+        return build_page_tree(self.order_by("path").values_list(*PAGE_NODE_FIELDS))
+
     def private_q(self):
         from wagtail.models import PageViewRestriction
 
         q = Q()
-        for restriction in PageViewRestriction.objects.select_related("page").all():
-            q |= self.descendant_of_q(restriction.page, inclusive=True)
+        if PageViewRestriction.restricted_paths_cache_enabled():
+            for path in PageViewRestriction.get_restricted_page_paths():
+                q |= Q(path__startswith=path)
+        else:
+            for restriction in PageViewRestriction.objects.select_related("page").all():
+                q |= self.descendant_of_q(restriction.page, inclusive=True)
 
         # do not match any page if no private section exists.
         return q if q else Q(pk__in=[])
@@ -653,11 +706,145 @@ class PageQuerySet(SearchableQuerySetMixin, SpecificQuerySetMixin, TreeQuerySet)
 
 
 class SpecificIterable(ModelIterable):
+    # The maximum number of specific models that will be fetched in a single
+    # query by joining their tables. If the results of the queryset could be
+    # instances of more models than this, a query is made for each model instead.
+    max_joined_models = 5
+
     def __iter__(self):
         """
         Identify and return all specific items in a queryset, and return them
         in the same order, with any annotations intact.
         """
+        relation_paths = self._get_specific_relation_paths()
+        if relation_paths is None:
+            yield from self._iter_with_query_per_model()
+        else:
+            yield from self._iter_with_joins(relation_paths)
+
+    def _get_specific_relation_paths(self):
+        """
+        If the queryset is known to only return instances of a small number of models
+        (for example, because it has been filtered with ``PageQuerySet.type()``),
+        return a dict mapping each of those models to the list of
+        ``(query_name, accessor_name)`` pairs that lead from the queryset's model to it
+        through the multi-table inheritance links. Otherwise, return None.
+        """
+        qs = self.queryset
+        if (
+            qs._specific_models is None
+            or qs._defer_streamfields
+            or qs.query.combinator
+            or qs.query.deferred_loading != (frozenset(), True)
+        ):
+            return None
+
+        models = {
+            model
+            for model in qs._specific_models
+            if issubclass(model, qs.model) and not model._meta.proxy
+        }
+        if len(models) > self.max_joined_models:
+            return None
+
+        relation_paths = {}
+        for model in models:
+            path = []
+            child = model
+            # walk up the chain of concrete parents until the queryset's model is reached
+            for parent in model._meta.get_base_chain(qs.model._meta.concrete_model):
+                link = child._meta.parents[parent]
+                path.insert(
+                    0,
+                    (link.related_query_name(), link.remote_field.get_accessor_name()),
+                )
+                child = parent
+            relation_paths[model] = path
+        return relation_paths
+
+    def _iter_with_joins(self, relation_paths):
+        """
+        Fetch the specific items in a single query, using select_related() to join
+        the tables of all specific models that might be included in the result.
+        """
+        qs = self.queryset
+        annotation_aliases = qs.query.annotation_select
+
+        select_related_fields = []
+        for path in relation_paths.values():
+            prefix = "__".join(query_name for query_name, _ in path)
+            if prefix:
+                select_related_fields.append(prefix)
+            select_related_fields.extend(
+                f"{prefix}__{field}" if prefix else field
+                for field in qs._specific_select_related_fields
+            )
+
+        joined_qs = qs._chain()
+        joined_qs._iterable_class = ModelIterable
+        # prefetching is applied to the specific items below, not the base objects
+        joined_qs._prefetch_related_lookups = ()
+        if select_related_fields:
+            joined_qs = joined_qs.select_related(*select_related_fields)
+
+        for chunk in self._get_chunks(joined_qs):
+            items = []
+            unresolved = {}
+            for index, obj in enumerate(chunk):
+                model = ContentType.objects.get_for_id(
+                    obj.content_type_id
+                ).model_class()
+                item = obj
+                try:
+                    for _, accessor_name in relation_paths[model]:
+                        item = getattr(item, accessor_name)
+                except (KeyError, ObjectDoesNotExist):
+                    # The content type is not one of the joined models (for example, a
+                    # proxy model or a missing model), or the specific row is missing;
+                    # resolve these separately below
+                    unresolved[obj.pk] = index
+                    items.append(obj)
+                    continue
+
+                for annotation in annotation_aliases:
+                    setattr(item, annotation, getattr(obj, annotation))
+                items.append(item)
+
+            if unresolved:
+                for item in self._get_specific_items(
+                    [items[index] for index in unresolved.values()]
+                ):
+                    items[unresolved[item.pk]] = item
+
+            if qs._specific_prefetch_related_lookups:
+                items_by_model = defaultdict(list)
+                for item in items:
+                    items_by_model[type(item)].append(item)
+                for model_items in items_by_model.values():
+                    prefetch_related_objects(
+                        model_items, *qs._specific_prefetch_related_lookups
+                    )
+
+            yield from items
+
+    def _get_specific_items(self, objs):
+        """
+        Fetch specific instances of the given non-specific objects, using a query
+        per model, and reapply any annotations from the original objects.
+        """
+        qs = self.queryset
+        annotation_aliases = qs.query.annotation_select
+        fallback_qs = qs.model._default_manager.filter(
+            pk__in=[obj.pk for obj in objs]
+        ).specific()
+        fallback_qs._specific_select_related_fields = qs._specific_select_related_fields
+        objs_by_pk = {obj.pk: obj for obj in objs}
+        for item in fallback_qs:
+            for annotation in annotation_aliases:
+                setattr(item, annotation, getattr(objs_by_pk[item.pk], annotation))
+            yield item
+
+    def _iter_with_query_per_model(self):
         qs = self.queryset
         annotation_aliases = qs.query.annotation_select
         values_qs = qs.values("pk", "content_type", *annotation_aliases)
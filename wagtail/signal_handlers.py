@@ -2,9 +2,11 @@ import logging
 from contextlib import contextmanager
 
 from asgiref.local import Local
+from django.contrib.auth import get_user_model
 from django.core.cache import cache
 from django.db import transaction
 from django.db.models.signals import (
+    m2m_changed,
     post_delete,
     post_migrate,
     post_save,
@@ -12,7 +14,21 @@ from django.db.models.signals import (
     pre_migrate,
 )
 
-from wagtail.models import Locale, Page, ReferenceIndex, Site
+from wagtail.models import (
+    Collection,
+    GroupCollectionPermission,
+    GroupPagePermission,
+    GroupSitePermission,
+    Locale,
+    Page,
+    PageViewRestriction,
+    ReferenceIndex,
+    Site,
+    get_page_models,
+    invalidate_page_tree_cache,
+)
+from wagtail.permission_policies.base import invalidate_permissions_cache
+from wagtail.signals import page_published, page_unpublished, post_page_move
 
 from .tasks import update_reference_index_task
 
@@ -39,6 +55,48 @@ def post_delete_page_log_deletion(sender, instance, **kwargs):
     logger.info('Page deleted: "%s" id=%d', instance.title, instance.id)
 
 
+def invalidate_page_tree_cache_on_change(sender, instance, **kwargs):
+    invalidate_page_tree_cache(instance)
+
+
+def invalidate_page_tree_cache_on_move(sender, instance, parent_page_before, **kwargs):
+    invalidate_page_tree_cache(parent_page_before)
+    invalidate_page_tree_cache(instance)
+
+
+def clear_view_restriction_paths_cache(sender, instance, **kwargs):
+    PageViewRestriction.clear_restricted_paths_cache()
+
+
+def post_save_page_clear_view_restriction_paths_cache(
+    sender, instance, created=False, update_fields=None, **kwargs
+):
+    # Aliases use the view restrictions of their source page, so the cached paths
+    # need refreshing when an alias is created or converted to a regular page
+    if (created and instance.alias_of_id) or (
+        update_fields and "alias_of_id" in update_fields
+    ):
+        PageViewRestriction.clear_restricted_paths_cache()
+
+
+def post_delete_page_clear_view_restriction_paths_cache(sender, instance, **kwargs):
+    if instance.alias_of_id:
+        PageViewRestriction.clear_restricted_paths_cache()
+
+
+def invalidate_permissions_cache_on_change(sender, **kwargs):
+    invalidate_permissions_cache()
+
+
+def post_save_collection_invalidate_permissions_cache(
+    sender, instance, created=False, **kwargs
+):
+    # Collections are kept in order of name, so adding one may change the paths of
+    # its siblings, which cached collection permissions refer to
+    if created:
+        invalidate_permissions_cache()
+
+
 def reset_locales_display_names_cache(sender, instance, **kwargs):
     cache.delete("wagtail_locales_display_name")
 
@@ -111,6 +169,35 @@ def register_signal_handlers():
 
     pre_delete.connect(pre_delete_page_unpublish, sender=Page)
     post_delete.connect(post_delete_page_log_deletion, sender=Page)
+    post_delete.connect(invalidate_page_tree_cache_on_change, sender=Page)
+    page_published.connect(invalidate_page_tree_cache_on_change)
+    page_unpublished.connect(invalidate_page_tree_cache_on_change)
+    post_page_move.connect(invalidate_page_tree_cache_on_move)
+
+    post_save.connect(clear_view_restriction_paths_cache, sender=PageViewRestriction)
+    post_delete.connect(clear_view_restriction_paths_cache, sender=PageViewRestriction)
+    for model in get_page_models():
+        post_save.connect(
+            post_save_page_clear_view_restriction_paths_cache, sender=model
+        )
+    post_delete.connect(
+        post_delete_page_clear_view_restriction_paths_cache, sender=Page
+    )
+    post_page_move.connect(clear_view_restriction_paths_cache)
+
+    # Invalidate permissions cached across requests whenever the permission records,
+    # group memberships or the paths of the pages they refer to are changed
+    for model in [GroupPagePermission, GroupCollectionPermission, GroupSitePermission]:
+        post_save.connect(invalidate_permissions_cache_on_change, sender=model)
+        post_delete.connect(invalidate_permissions_cache_on_change, sender=model)
+    m2m_changed.connect(
+        invalidate_permissions_cache_on_change, sender=get_user_model().groups.through
+    )
+    post_page_move.connect(invalidate_permissions_cache_on_change)
+    post_save.connect(
+        post_save_collection_invalidate_permissions_cache, sender=Collection
+    )
+    post_delete.connect(invalidate_permissions_cache_on_change, sender=Collection)
 
     post_save.connect(reset_locales_display_names_cache, sender=Locale)
     post_delete.connect(reset_locales_display_names_cache, sender=Locale)
@@ -4,7 +4,10 @@ from django.utils.module_loading import import_string
 from django_tasks import task
 from modelcluster.fields import ParentalKey
 
-from wagtail.models import ReferenceIndex
+from wagtail.actions.delete_page import DeletePageAction
+from wagtail.actions.publish_scheduled import PublishScheduledAction
+from wagtail.actions.update_aliases import UpdateAliasesAction
+from wagtail.models import PendingAliasUpdate, PendingPageDeletion, ReferenceIndex
 
 
 @task()
@@ -33,6 +36,41 @@ def update_reference_index_task(app_label, model_name, pk):
             ReferenceIndex.create_or_update_for_object(instance)
 
 
+@task()
+def delete_page_task(pending_deletion_id):
+    try:
+        pending_deletion = PendingPageDeletion.objects.select_related(
+            "page", "user"
+        ).get(pk=pending_deletion_id)
+    except PendingPageDeletion.DoesNotExist:
+        # The deletion has already been completed by another task
+        return
+
+    DeletePageAction(
+        pending_deletion.page, user=pending_deletion.user
+    ).delete_in_batches()
+
+
+@task()
+def update_aliases_task(pending_update_id):
+    try:
+        pending_update = PendingAliasUpdate.objects.select_related(
+            "page", "revision"
+        ).get(pk=pending_update_id)
+    except PendingAliasUpdate.DoesNotExist:
+        # The update has already been completed by another task
+        return
+
+    UpdateAliasesAction(
+        pending_update.page, revision=pending_update.revision
+    ).update_in_batches()
+
+
+@task()
+def publish_scheduled_task():
+    PublishScheduledAction().execute()
+
+
 @task()
 def delete_file_from_storage_task(deconstructed_storage, path):
     storage_module, storage_args, storage_kwargs = deconstructed_storage
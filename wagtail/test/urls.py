@@ -44,6 +44,12 @@ urlpatterns = [
         },
     ),
     path("sitemap-<str:section>.xml", sitemaps_views.sitemap, name="sitemap"),
+    path("sharded-sitemap.xml", sitemaps_views.sharded_index),
+    path(
+        "sharded-sitemap-<int:number>.xml",
+        sitemaps_views.sharded_sitemap,
+        name="wagtail_sitemap_shard",
+    ),
     path("testapp/", include(testapp_urls)),
     path("fallback/", lambda request: HttpResponse("ok"), name="fallback"),
 ]
@@ -0,0 +1,131 @@
+from django.test import SimpleTestCase, TestCase
+
+from wagtail import blocks
+from wagtail.models import Page
+from wagtail.test.benchmark import Benchmark
+from wagtail.test.testapp.models import EventPage, SimplePage
+
+
+def make_table_block(value_class):
+    row_block = blocks.StructBlock(
+        [
+            ("label", blocks.CharBlock()),
+            ("value", blocks.CharBlock()),
+            ("note", blocks.CharBlock(required=False)),
+        ],
+        value_class=value_class,
+    )
+    return blocks.StructBlock(
+        [
+            ("caption", blocks.CharBlock()),
+            ("rows", blocks.ListBlock(row_block)),
+        ],
+        value_class=value_class,
+    )
+
+
+TABLE_DATA = {
+    "caption": "Large table",
+    "rows": [
+        {
+            "type": "item",
+            "value": {"label": f"Row {i}", "value": str(i), "note": ""},
+            "id": f"00000000-0000-0000-0000-{i:012d}",
+        }
+        for i in range(2000)
+    ],
+}
+
+
+class BenchStructValueLargeTable(Benchmark, SimpleTestCase):
+    """
+    Converts a 2000-row table built from StructBlock / ListBlock to its native
+    value using the default StructValue. Values are kept alive so that the
+    reported memory figure is the size of one converted table.
+    """
+
+    value_class = blocks.StructValue
+
+    def setUp(self):
+        self.block = make_table_block(self.value_class)
+        self.results = []
+
+    def bench(self):
+        value = self.block.to_python(TABLE_DATA)
+        self.assertEqual(len(value["rows"]), 2000)
+        # iterate over the rows as a template would
+        for row in value["rows"]:
+            row["label"]
+        self.results.append(value)
+
+
+class BenchCompactStructValueLargeTable(BenchStructValueLargeTable):
+    """
+    As BenchStructValueLargeTable, but using CompactStructValue.
+    """
+
+    value_class = blocks.CompactStructValue
+
+
+class BenchMovePageSubtree(Benchmark, TestCase):
+    """
+    Moves a section of 500 pages back and forth between two parents.
+    """
+
+    def setUp(self):
+        root_page = Page.objects.get(id=1)
+        self.parents = [
+            root_page.add_child(
+                instance=SimplePage(
+                    title=f"Parent {i}", slug=f"parent-{i}", content="Hello"
+                )
+            )
+            for i in range(2)
+        ]
+        self.section = self.parents[0].add_child(
+            instance=SimplePage(title="Section", slug="section", content="Hello")
+        )
+        for i in range(20):
+            child = self.section.add_child(
+                instance=SimplePage(
+                    title=f"Child {i}", slug=f"child-{i}", content="Hello"
+                )
+            )
+            for j in range(24):
+                child.add_child(
+                    instance=SimplePage(
+                        title=f"Grandchild {j}", slug=f"grandchild-{j}", content="Hello"
+                    )
+                )
+        self.moves = 0
+
+    def bench(self):
+        self.moves += 1
+        parent = Page.objects.get(pk=self.parents[self.moves % 2].pk)
+        self.section.move(parent, pos="last-child")
+        self.assertEqual(
+            Page.objects.filter(url_path__startswith=parent.url_path).count(), 502
+        )
+
+
+class BenchUpdateAliases(Benchmark, TestCase):
+    """
+    Publishes a page with 100 aliases, each with child objects.
+    """
+
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        self.event_page = EventPage.objects.get(url_path="/home/events/christmas/")
+        for i in range(100):
+            self.event_page.create_alias(update_slug=f"christmas-{i}")
+
+    def bench(self):
+        self.event_page.title = "Updated title"
+        self.event_page.save_revision().publish()
+        self.assertEqual(
+            EventPage.objects.filter(alias_of=self.event_page)
+            .exclude(title="Updated title")
+            .count(),
+            0,
+        )
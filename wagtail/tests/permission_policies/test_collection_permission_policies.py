@@ -1,6 +1,8 @@
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser, Group, Permission
 from django.contrib.contenttypes.models import ContentType
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 
 from wagtail.documents.models import Document
 from wagtail.models import Collection, GroupCollectionPermission
@@ -1585,3 +1587,43 @@ class TestCollectionManagementPermission(
             ),
             [],
         )
+
+
+@override_settings(
+    WAGTAIL_CACHE_PERMISSIONS=True,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class TestSharedPermissionCache(PermissionPolicyTestCase):
+    def setUp(self):
+        cache.clear()
+        super().setUp()
+        self.policy = CollectionPermissionPolicy(Document)
+
+    def get_cached_collections(self, user):
+        # fetch a fresh user object, to bypass the per-instance permission cache
+        user = get_user_model().objects.get(pk=user.pk)
+        return [
+            group_permission.collection
+            for group_permission in self.policy.get_cached_permissions_for_user(user)
+        ]
+
+    def test_invalidated_on_collection_move(self):
+        other_collection = self.root_collection.add_child(name="Other")
+        self.get_cached_collections(self.report_changer)
+
+        # Move the collection from code, rather than the admin
+        self.reports_collection.move(other_collection, pos="sorted-child")
+
+        [collection] = self.get_cached_collections(self.report_changer)
+        self.reports_collection.refresh_from_db()
+        self.assertEqual(collection.path, self.reports_collection.path)
+
+    def test_invalidated_on_collection_added(self):
+        self.get_cached_collections(self.report_changer)
+
+        # Collections are ordered by name, so adding one before "Reports" moves it
+        self.root_collection.add_child(name="Accounts")
+
+        [collection] = self.get_cached_collections(self.report_changer)
+        self.reports_collection.refresh_from_db()
+        self.assertEqual(collection.path, self.reports_collection.path)
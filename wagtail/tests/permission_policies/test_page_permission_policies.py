@@ -1,7 +1,10 @@
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser, Group, Permission
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 
 from wagtail.models import GroupPagePermission, Page, get_default_page_content_type
+from wagtail.permission_policies.base import PERMISSIONS_CACHE_VERSION_KEY
 from wagtail.permission_policies.pages import PagePermissionPolicy
 from wagtail.test.utils import WagtailTestUtils
 from wagtail.tests.permission_policies.test_permission_policies import (
@@ -521,3 +524,87 @@ class TestPagePermissionPolicy(PermissionPolicyTestCase):
             ),
             [self.superuser],
         )
+
+
+@override_settings(
+    WAGTAIL_CACHE_PERMISSIONS=True,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class TestSharedPermissionCache(PermissionPolicyTestCase):
+    def setUp(self):
+        cache.clear()
+        super().setUp()
+        self.policy = PagePermissionPolicy()
+
+    def get_permissions(self, user):
+        # fetch a fresh user object, to bypass the per-instance permission cache
+        user = get_user_model().objects.get(pk=user.pk)
+        return self.policy.get_cached_permissions_for_user(user)
+
+    def test_permissions_shared_between_user_instances(self):
+        self.assertResultSetEqual(
+            self.get_permissions(self.report_editor), {self.report_edit_perm}
+        )
+        user = get_user_model().objects.get(pk=self.report_editor.pk)
+        with self.assertNumQueries(0):
+            self.assertResultSetEqual(
+                self.policy.get_cached_permissions_for_user(user),
+                {self.report_edit_perm},
+            )
+            self.assertTrue(
+                self.policy.user_has_permission_for_instance(
+                    user, "change", self.editor_report
+                )
+            )
+
+    def test_invalidated_on_permission_change(self):
+        self.assertResultSetEqual(
+            self.get_permissions(self.report_editor), {self.report_edit_perm}
+        )
+        report_delete_perm = GroupPagePermission.objects.create(
+            group=self.report_edit_perm.group,
+            page=self.reports_page,
+            permission=Permission.objects.get(codename="delete_page"),
+        )
+        self.assertResultSetEqual(
+            self.get_permissions(self.report_editor),
+            {self.report_edit_perm, report_delete_perm},
+        )
+
+        self.report_edit_perm.delete()
+        self.assertResultSetEqual(
+            self.get_permissions(self.report_editor), {report_delete_perm}
+        )
+
+    def test_invalidated_on_group_membership_change(self):
+        self.assertResultSetEqual(self.get_permissions(self.useless_user), {})
+
+        self.useless_user.groups.add(self.report_edit_perm.group)
+        self.assertResultSetEqual(
+            self.get_permissions(self.useless_user), {self.report_edit_perm}
+        )
+
+        self.report_edit_perm.group.user_set.remove(self.useless_user)
+        self.assertResultSetEqual(self.get_permissions(self.useless_user), {})
+
+    def test_invalidated_on_page_move(self):
+        self.get_permissions(self.report_editor)
+
+        self.reports_page.move(self.editor_page, pos="last-child")
+
+        [permission] = self.get_permissions(self.report_editor)
+        self.reports_page.refresh_from_db()
+        self.assertEqual(permission.page.path, self.reports_page.path)
+
+    def test_invalidated_again_on_commit(self):
+        self.get_permissions(self.report_editor)
+        version = cache.get(PERMISSIONS_CACHE_VERSION_KEY)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.report_edit_perm.delete()
+            # A concurrent request caches the permissions from before the change
+            # again, under the version it read before the change
+            cache.set(PERMISSIONS_CACHE_VERSION_KEY, version, None)
+            self.assertEqual(len(self.get_permissions(self.report_editor)), 1)
+
+        self.assertResultSetEqual(self.get_permissions(self.report_editor), {})
@@ -1,26 +1,33 @@
 import datetime
 import json
+import weakref
+from unittest import mock
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
-from django.test import TestCase
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, transaction
+from django.db.models import QuerySet
+from django.test import TestCase, override_settings
 from django.utils import timezone
 from freezegun import freeze_time
 
-from wagtail.log_actions import LogActionRegistry
+from wagtail.log_actions import LogActionRegistry, LogContext, log
 from wagtail.log_actions import registry as log_registry
 from wagtail.models import (
+    ModelLogEntryArchive,
     Page,
     PageLogEntry,
+    PageLogEntryArchive,
     PageViewRestriction,
     Task,
     Workflow,
     WorkflowTask,
 )
-from wagtail.models.audit_log import ModelLogEntry
+from wagtail.models.audit_log import LogEntryBuffer, ModelLogEntry
 from wagtail.test.testapp.models import FullFeaturedSnippet, SimplePage
 from wagtail.test.utils import WagtailTestUtils
 
@@ -134,6 +141,183 @@ class TestAuditLogManager(WagtailTestUtils, TestCase):
         self.assertEqual(entries.count(), 1)
         self.assertListEqual(list(entries), expected_entries)
 
+    def test_archive(self):
+        now = timezone.now()
+        with freeze_time(now - datetime.timedelta(days=10)):
+            old_page_entry = PageLogEntry.objects.log_action(
+                self.simple_page,
+                "wagtail.edit",
+                user=self.user,
+                data={"title": "Simple page"},
+            )
+            old_snippet_entry = ModelLogEntry.objects.log_action(
+                self.snippet_1, "wagtail.edit", user=self.user
+            )
+        new_page_entry = PageLogEntry.objects.log_action(
+            self.simple_page, "wagtail.edit"
+        )
+        new_snippet_entry = ModelLogEntry.objects.log_action(
+            self.snippet_1, "wagtail.edit"
+        )
+
+        # Move the create entry from setUp to the archive too
+        PageLogEntry.objects.filter(action="wagtail.create").update(
+            timestamp=now - datetime.timedelta(days=8)
+        )
+
+        before = now - datetime.timedelta(days=7)
+        self.assertEqual(PageLogEntry.objects.archive(before, batch_size=1), 2)
+        self.assertEqual(ModelLogEntry.objects.archive(before), 1)
+        self.assertEqual(PageLogEntry.objects.archive(before), 0)
+
+        self.assertListEqual(list(PageLogEntry.objects.all()), [new_page_entry])
+        self.assertListEqual(list(ModelLogEntry.objects.all()), [new_snippet_entry])
+
+        archived_page_entry = PageLogEntryArchive.objects.get(pk=old_page_entry.pk)
+        self.assertEqual(archived_page_entry.page_id, self.simple_page.pk)
+        self.assertEqual(archived_page_entry.user, self.user)
+        self.assertEqual(archived_page_entry.timestamp, old_page_entry.timestamp)
+        self.assertEqual(archived_page_entry.data, {"title": "Simple page"})
+        self.assertEqual(archived_page_entry.message, "Draft saved")
+        self.assertListEqual(
+            list(PageLogEntryArchive.objects.for_instance(self.simple_page)),
+            [
+                PageLogEntryArchive.objects.get(action="wagtail.create"),
+                archived_page_entry,
+            ],
+        )
+
+        archived_snippet_entry = ModelLogEntryArchive.objects.get()
+        self.assertEqual(archived_snippet_entry.pk, old_snippet_entry.pk)
+        self.assertEqual(archived_snippet_entry.object_id, str(self.snippet_1.pk))
+
+    def test_archived_entries_of_deleted_pages_viewable_by_user(self):
+        editor = self.create_user("editor")
+        editor.groups.add(Group.objects.get(name="Editors"))
+        self.simple_page.delete(user=self.user)
+        PageLogEntry.objects.filter(action="wagtail.create").update(
+            timestamp=timezone.now() - datetime.timedelta(days=10)
+        )
+        PageLogEntry.objects.archive(timezone.now() - datetime.timedelta(days=7))
+
+        # The page was deleted after its create entry was archived
+        self.assertFalse(PageLogEntryArchive.objects.filter(deleted=True).exists())
+        self.assertEqual(
+            PageLogEntryArchive.objects.viewable_by_user(editor).get().action,
+            "wagtail.create",
+        )
+
+
+@override_settings(WAGTAIL_BUFFER_LOG_ENTRIES=True)
+class TestBufferedLogEntries(WagtailTestUtils, TestCase):
+    def setUp(self):
+        self.user = self.create_superuser(username="administrator")
+        root_page = Page.objects.get(id=1)
+        self.pages = [
+            root_page.add_child(
+                instance=SimplePage(
+                    title=f"Page {i}", slug=f"page-{i}", content="hello"
+                )
+            )
+            for i in range(3)
+        ]
+        self.snippet = FullFeaturedSnippet.objects.create(text="snippet")
+
+    def test_entries_saved_on_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            with LogContext(user=self.user) as log_context:
+                entries = [log(page, "wagtail.publish") for page in self.pages]
+                snippet_entry = log(self.snippet, "wagtail.edit")
+
+        self.assertIsNone(entries[0].pk)
+        self.assertFalse(PageLogEntry.objects.filter(action="wagtail.publish").exists())
+        self.assertEqual(len(callbacks), 1)
+
+        # One query for each log model
+        with self.assertNumQueries(2):
+            callbacks[0]()
+
+        published_entries = PageLogEntry.objects.filter(
+            action="wagtail.publish"
+        ).order_by("pk")
+        self.assertEqual(
+            [entry.page_id for entry in published_entries],
+            [page.pk for page in self.pages],
+        )
+        self.assertEqual(
+            {entry.uuid for entry in published_entries}, {log_context.uuid}
+        )
+        self.assertEqual(published_entries[0].user, self.user)
+        self.assertEqual(
+            ModelLogEntry.objects.get(action="wagtail.edit").uuid, log_context.uuid
+        )
+        self.assertIsNotNone(snippet_entry.pk)
+
+    def test_entries_discarded_on_savepoint_rollback(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            log(self.pages[0], "wagtail.publish")
+            try:
+                with transaction.atomic():
+                    log(self.pages[1], "wagtail.publish")
+                    raise ValueError
+            except ValueError:
+                pass
+            log(self.pages[2], "wagtail.publish")
+
+        # The entries logged before and after the savepoint share a buffer
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(
+            list(
+                PageLogEntry.objects.filter(action="wagtail.publish")
+                .order_by("pk")
+                .values_list("page_id", flat=True)
+            ),
+            [self.pages[0].pk, self.pages[2].pk],
+        )
+
+    def test_unregistered_action(self):
+        with self.assertRaises(ValidationError):
+            log(self.pages[0], "test.unregistered_action")
+
+    def test_buffer_dropped_on_savepoint_rollback(self):
+        with self.captureOnCommitCallbacks():
+            try:
+                with transaction.atomic():
+                    log(self.pages[0], "wagtail.publish")
+                    buffer = LogEntryBuffer.get_for_connection(DEFAULT_DB_ALIAS)
+                    buffer_ref = weakref.ref(buffer)
+                    del buffer
+                    raise ValueError
+            except ValueError:
+                pass
+
+            # The on_commit callback of the savepoint has been discarded, and the
+            # buffer along with it
+            self.assertIsNone(buffer_ref())
+
+    def test_failed_flush_is_logged(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            log(self.pages[0], "wagtail.publish")
+            log(self.snippet, "wagtail.edit")
+
+        original_bulk_create = QuerySet.bulk_create
+
+        def bulk_create(queryset, objs, *args, **kwargs):
+            if queryset.model is PageLogEntry:
+                raise DatabaseError("Connection lost")
+            return original_bulk_create(queryset, objs, *args, **kwargs)
+
+        with (
+            mock.patch.object(QuerySet, "bulk_create", bulk_create),
+            self.assertLogs("wagtail", level="ERROR") as logs,
+        ):
+            callbacks[0]()
+
+        self.assertIn("Failed to save 1 page log entries", logs.output[0])
+        self.assertIn("DatabaseError: Connection lost", logs.output[0])
+        # Entries of other log models are still saved
+        self.assertTrue(ModelLogEntry.objects.filter(action="wagtail.edit").exists())
+
 
 class TestAuditLog(TestCase):
     def setUp(self):
@@ -12,13 +12,18 @@ from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
 from django.forms.utils import ErrorList
 from django.template.loader import render_to_string
-from django.test import SimpleTestCase, TestCase
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import translation
 from django.utils.safestring import SafeData, mark_safe
 from django.utils.translation import gettext_lazy as _
 
 from wagtail import blocks
 from wagtail.admin.telepath import registry
-from wagtail.blocks.base import get_error_json_data
+from wagtail.blocks.base import (
+    BlockWidget,
+    clear_packed_block_definitions_cache,
+    get_error_json_data,
+)
 from wagtail.blocks.definition_lookup import BlockDefinitionLookup
 from wagtail.blocks.field_block import FieldBlockAdapter
 from wagtail.blocks.list_block import ListBlockAdapter, ListBlockValidationError
@@ -3458,6 +3463,85 @@ class TestStructBlockWithCustomStructValue(SimpleTestCase):
         self.assertIsInstance(block.normalize(value), CustomStructValue)
 
 
+class TestStructBlockWithCompactStructValue(SimpleTestCase):
+    def setUp(self):
+        self.block = blocks.StructBlock(
+            [
+                ("title", blocks.CharBlock()),
+                ("link", blocks.URLBlock()),
+            ],
+            value_class=blocks.CompactStructValue,
+        )
+
+    def test_to_python(self):
+        value = self.block.to_python(
+            {"title": "Birthday party", "link": "https://myparty.co.uk"}
+        )
+        self.assertIsInstance(value, blocks.CompactStructValue)
+        self.assertEqual(value["title"], "Birthday party")
+        self.assertEqual(value.get("link"), "https://myparty.co.uk")
+        self.assertIsNone(value.get("missing"))
+        self.assertEqual(list(value.keys()), ["title", "link"])
+        self.assertEqual(len(value), 2)
+        self.assertEqual(
+            value, {"title": "Birthday party", "link": "https://myparty.co.uk"}
+        )
+        self.assertFalse(hasattr(value, "__dict__"))
+
+    def test_mapping_operations(self):
+        value = blocks.CompactStructValue(self.block, [("link", "https://x.com")])
+        self.assertEqual(list(value.items()), [("link", "https://x.com")])
+        self.assertNotIn("title", value)
+        with self.assertRaises(KeyError):
+            value["title"]
+
+        value["title"] = "Hello"
+        value["extra"] = 42
+        self.assertEqual(list(value), ["title", "link", "extra"])
+        self.assertEqual(len(value), 3)
+
+        del value["link"]
+        del value["extra"]
+        self.assertEqual(dict(value), {"title": "Hello"})
+        with self.assertRaises(KeyError):
+            del value["link"]
+
+    def test_equal_to_structvalue(self):
+        compact = self.block.to_python({"title": "Hello", "link": "https://x.com"})
+        regular = blocks.StructValue(
+            self.block, [("title", "Hello"), ("link", "https://x.com")]
+        )
+        self.assertEqual(compact, regular)
+        self.assertEqual(regular, compact)
+
+    def test_clean_and_prep_value(self):
+        value = self.block.to_python({"title": "Hello", "link": "https://x.com"})
+        clean_value = self.block.clean(value)
+        self.assertIsInstance(clean_value, blocks.CompactStructValue)
+        self.assertEqual(
+            self.block.get_prep_value(clean_value),
+            {"title": "Hello", "link": "https://x.com"},
+        )
+
+    def test_bound_blocks(self):
+        value = self.block.to_python({"title": "Hello", "link": "https://x.com"})
+        self.assertEqual(list(value.bound_blocks.keys()), ["title", "link"])
+        self.assertEqual(value.bound_blocks["title"].value, "Hello")
+
+    def test_render(self):
+        value = self.block.to_python({"title": "Hello", "link": "https://x.com"})
+        result = value.__html__()
+        self.assertIn("<dt>title</dt>", result)
+        self.assertIn("<dd>Hello</dd>", result)
+
+    def test_copy_and_deepcopy(self):
+        value = self.block.to_python({"title": "Hello", "link": "https://x.com"})
+        for copied in (copy.copy(value), copy.deepcopy(value), value.copy()):
+            self.assertIsNot(value, copied)
+            self.assertIsInstance(copied, blocks.CompactStructValue)
+            self.assertEqual(value, copied)
+
+
 class TestListBlock(WagtailTestUtils, SimpleTestCase):
     def assert_eq_list_values(self, p, q):
         # We can't directly compare ListValue instances yet
@@ -3996,6 +4080,34 @@ class TestListBlock(WagtailTestUtils, SimpleTestCase):
             list_val.bound_blocks[0].id, "11111111-1111-1111-1111-111111111111"
         )
 
+    def test_bound_blocks_are_created_lazily(self):
+        block = blocks.ListBlock(blocks.CharBlock())
+        list_val = block.to_python(
+            [
+                {
+                    "type": "item",
+                    "value": "foo",
+                    "id": "11111111-1111-1111-1111-111111111111",
+                },
+                "bar",
+            ]
+        )
+
+        # reading values should not create ListChild wrappers
+        self.assertEqual(list(list_val), ["foo", "bar"])
+        self.assertEqual(list_val[-1], "bar")
+        self.assertIsNone(list_val._bound_blocks)
+
+        bound_blocks = list_val.bound_blocks
+        self.assertIs(list_val.bound_blocks, bound_blocks)
+        self.assertEqual(bound_blocks[0].id, "11111111-1111-1111-1111-111111111111")
+        self.assertIsNone(bound_blocks[1].original_id)
+
+        # modifications after the bound blocks are created are reflected in the values
+        list_val.append("baz")
+        self.assertEqual(list(list_val), ["foo", "bar", "baz"])
+        self.assertEqual(len(list_val.bound_blocks), 3)
+
     def test_bulk_unpack_new_database_format(self):
         block = blocks.ListBlock(blocks.CharBlock())
         [list_1, list_2] = block.bulk_to_python(
@@ -6827,6 +6939,55 @@ class TestOverriddenGetTemplateBlockTag(TestCase):
         self.assertEqual(html, "<h1>HEADING</h1>")
 
 
+class TestBlockWidget(SimpleTestCase):
+    def setUp(self):
+        self.block = blocks.StreamBlock(
+            [
+                ("heading", blocks.CharBlock(label=_("Heading"))),
+                ("paragraph", blocks.TextBlock()),
+            ]
+        )
+        clear_packed_block_definitions_cache()
+        self.addCleanup(clear_packed_block_definitions_cache)
+
+    def test_block_definitions_not_cached_by_default(self):
+        widget_1 = BlockWidget(self.block)
+        widget_2 = BlockWidget(self.block)
+        self.assertEqual(widget_1.block_json, widget_2.block_json)
+        self.assertIsNot(widget_1.js_context, widget_2.js_context)
+
+    @override_settings(WAGTAILADMIN_CACHE_BLOCK_DEFINITIONS=True)
+    def test_block_definitions_cached(self):
+        widget_1 = BlockWidget(self.block)
+        block_json = widget_1.block_json
+
+        # a second widget for the same block should not pack the definition again
+        widget_2 = BlockWidget(self.block)
+        with unittest.mock.patch(
+            "wagtail.blocks.base.JSContext", side_effect=AssertionError
+        ):
+            self.assertEqual(widget_2.block_json, block_json)
+            self.assertIs(widget_2.js_context, widget_1.js_context)
+
+        # a different block definition is packed separately
+        other_block = blocks.StreamBlock([("heading", blocks.CharBlock())])
+        self.assertNotEqual(BlockWidget(other_block).block_json, block_json)
+
+    @override_settings(WAGTAILADMIN_CACHE_BLOCK_DEFINITIONS=True)
+    def test_block_definitions_cached_per_language(self):
+        with translation.override("en"):
+            english_json = BlockWidget(self.block).block_json
+        with translation.override("fr"):
+            BlockWidget(self.block).block_json
+        with translation.override("en"):
+            self.assertEqual(BlockWidget(self.block).block_json, english_json)
+
+        self.assertEqual(
+            {key[1] for key in blocks.base._packed_block_definitions},
+            {"en", "fr"},
+        )
+
+
 class TestValidationErrorAsJsonData(TestCase):
     def test_plain_validation_error(self):
         error = ValidationError("everything is broken")
@@ -11,10 +11,13 @@ from django.test import TestCase, override_settings
 from django.utils import timezone
 
 from wagtail.embeds.models import Embed
+from wagtail.management.commands.purge_revisions import purge_revisions
 from wagtail.models import (
     Collection,
+    Comment,
     Page,
     PageLogEntry,
+    PageLogEntryArchive,
     Revision,
     Task,
     Workflow,
@@ -225,7 +228,7 @@ class TestPublishScheduledPagesCommand(WagtailTestUtils, TestCase):
                 .exclude(approved_go_live_at__isnull=True)
                 .exists()
             )
-            with self.assertNumQueries(49):
+            with self.assertNumQueries(52):
                 with self.captureOnCommitCallbacks(execute=True):
                     management.call_command("publish_scheduled_pages")
 
@@ -283,7 +286,7 @@ class TestPublishScheduledPagesCommand(WagtailTestUtils, TestCase):
                 .exists()
             )
 
-            with self.assertNumQueries(49):
+            with self.assertNumQueries(52):
                 with self.captureOnCommitCallbacks(execute=True):
                     management.call_command("publish_scheduled_pages")
 
@@ -320,7 +323,7 @@ class TestPublishScheduledPagesCommand(WagtailTestUtils, TestCase):
         page.title = "Goodbye world!"
         page.save_revision()
 
-        with self.assertNumQueries(49):
+        with self.assertNumQueries(52):
             with self.captureOnCommitCallbacks(execute=True):
                 management.call_command("publish_scheduled_pages")
 
@@ -349,7 +352,7 @@ class TestPublishScheduledPagesCommand(WagtailTestUtils, TestCase):
             .exists()
         )
 
-        with self.assertNumQueries(42):
+        with self.assertNumQueries(45):
             with self.captureOnCommitCallbacks(execute=True):
                 management.call_command("publish_scheduled_pages")
 
@@ -386,7 +389,7 @@ class TestPublishScheduledPagesCommand(WagtailTestUtils, TestCase):
             p = Page.objects.get(slug="hello-world")
             self.assertTrue(p.live)
 
-            with self.assertNumQueries(29):
+            with self.assertNumQueries(32):
                 with self.captureOnCommitCallbacks(execute=True):
                     management.call_command("publish_scheduled_pages")
 
@@ -423,6 +426,102 @@ class TestPublishScheduledPagesCommand(WagtailTestUtils, TestCase):
         self.assertTrue(p.live)
         self.assertFalse(p.expired)
 
+    def test_go_live_pages_published_in_batches(self):
+        go_live_at = timezone.now() - timedelta(hours=1)
+        for i in range(3):
+            page = SimplePage(
+                title=f"Hello world {i}",
+                slug=f"hello-world-{i}",
+                content="hello",
+                live=False,
+                has_unpublished_changes=True,
+                go_live_at=go_live_at,
+            )
+            self.root_page.add_child(instance=page)
+            page.save_revision(approved_go_live_at=go_live_at)
+
+        stdout = StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            management.call_command(
+                "publish_scheduled", batch_size=2, verbosity=2, stdout=stdout
+            )
+
+        self.assertEqual(
+            SimplePage.objects.filter(
+                slug__startswith="hello-world-", live=True
+            ).count(),
+            3,
+        )
+        self.assertFalse(
+            Revision.objects.filter(approved_go_live_at__lt=timezone.now()).exists()
+        )
+        self.assertEqual(
+            PageLogEntry.objects.filter(action="wagtail.publish.scheduled").count(), 3
+        )
+        self.assertIn("Published 3 scheduled revisions.", stdout.getvalue())
+
+    def test_failure_is_logged_and_skipped(self):
+        go_live_at = timezone.now() - timedelta(hours=1)
+        for i in range(3):
+            page = SimplePage(
+                title=f"Hello world {i}",
+                slug=f"hello-world-{i}",
+                content="hello",
+                live=False,
+                has_unpublished_changes=True,
+                go_live_at=go_live_at,
+            )
+            self.root_page.add_child(instance=page)
+            page.save_revision(approved_go_live_at=go_live_at)
+
+        failing_revision = Revision.objects.get(object_str="Hello world 1")
+        original_publish = Revision.publish
+
+        def publish(revision, *args, **kwargs):
+            original_publish(revision, *args, **kwargs)
+            if revision.pk == failing_revision.pk:
+                raise ValueError("Something went wrong")
+
+        stdout = StringIO()
+        with mock.patch.object(Revision, "publish", publish):
+            with self.assertLogs("wagtail", level="ERROR") as logs:
+                with self.captureOnCommitCallbacks(execute=True):
+                    management.call_command(
+                        "publish_scheduled", batch_size=2, verbosity=2, stdout=stdout
+                    )
+
+        self.assertIn("Failed to process scheduled revision", logs.output[0])
+        self.assertIn("ValueError: Something went wrong", logs.output[0])
+
+        # The changes made while publishing the failing revision are rolled back,
+        # and the other revisions are published
+        self.assertEqual(
+            list(
+                SimplePage.objects.filter(
+                    slug__startswith="hello-world-", live=True
+                ).values_list("slug", flat=True)
+            ),
+            ["hello-world-0", "hello-world-2"],
+        )
+        failing_revision.refresh_from_db()
+        self.assertIsNotNone(failing_revision.approved_go_live_at)
+        self.assertIn("Published 2 scheduled revisions.", stdout.getvalue())
+
+    def test_interval_closes_old_connections(self):
+        with (
+            mock.patch(
+                "wagtail.management.commands.publish_scheduled.time.sleep",
+                side_effect=[None, KeyboardInterrupt],
+            ),
+            mock.patch(
+                "wagtail.management.commands.publish_scheduled.close_old_connections"
+            ) as close_old_connections,
+        ):
+            with self.assertRaises(KeyboardInterrupt):
+                management.call_command("publish_scheduled", interval=60)
+
+        self.assertEqual(close_old_connections.call_count, 2)
+
 
 @override_settings(
     CACHES={
@@ -464,7 +563,7 @@ class TestPublishScheduledCommand(WagtailTestUtils, TestCase):
                 .exists()
             )
 
-            with self.assertNumQueries(15):
+            with self.assertNumQueries(17):
                 with self.captureOnCommitCallbacks(execute=True):
                     management.call_command("publish_scheduled")
 
@@ -513,7 +612,7 @@ class TestPublishScheduledCommand(WagtailTestUtils, TestCase):
                 .exists()
             )
 
-            with self.assertNumQueries(15):
+            with self.assertNumQueries(17):
                 with self.captureOnCommitCallbacks(execute=True):
                     management.call_command("publish_scheduled")
 
@@ -543,7 +642,7 @@ class TestPublishScheduledCommand(WagtailTestUtils, TestCase):
         self.snippet.text = "Goodbye world!"
         self.snippet.save_revision()
 
-        with self.assertNumQueries(15):
+        with self.assertNumQueries(17):
             with self.captureOnCommitCallbacks(execute=True):
                 management.call_command("publish_scheduled")
 
@@ -568,7 +667,7 @@ class TestPublishScheduledCommand(WagtailTestUtils, TestCase):
             .exists()
         )
 
-        with self.assertNumQueries(14):
+        with self.assertNumQueries(16):
             with self.captureOnCommitCallbacks(execute=True):
                 management.call_command("publish_scheduled")
 
@@ -597,7 +696,7 @@ class TestPublishScheduledCommand(WagtailTestUtils, TestCase):
             self.snippet.refresh_from_db()
             self.assertTrue(self.snippet.live)
 
-            with self.assertNumQueries(10):
+            with self.assertNumQueries(12):
                 with self.captureOnCommitCallbacks(execute=True):
                     management.call_command("publish_scheduled")
 
@@ -736,6 +835,31 @@ class TestPurgeRevisionsCommandForPages(TestCase):
         # Any other revisions are deleted
         self.assertRevisionNotExists(revision_purged)
 
+    def test_purge_revisions_in_batches(self):
+        revisions = [self.object.save_revision() for i in range(5)]
+
+        self.run_command(batch_size=2)
+
+        for revision in revisions[:-1]:
+            self.assertRevisionNotExists(revision)
+        self.assertRevisionExists(revisions[-1])
+
+    def test_dry_run(self):
+        revision_old = self.object.save_revision()
+        PurgeRevisionsProtectedTestModel.objects.create(revision=revision_old)
+        revision_purgeable = self.object.save_revision()
+        self.object.save_revision()
+
+        stdout = StringIO()
+        management.call_command(
+            "purge_revisions", **self.base_options, dry_run=True, stdout=stdout
+        )
+
+        # nothing is deleted
+        self.assertRevisionExists(revision_old)
+        self.assertRevisionExists(revision_purgeable)
+        self.assertIn("Would delete", stdout.getvalue())
+
 
 class TestPurgeRevisionsCommandForSnippets(TestPurgeRevisionsCommandForPages):
     def get_object(self):
@@ -772,6 +896,49 @@ class TestPurgeRevisionsCommandForSnippetsWithPagesOnly(
         return self.assertRevisionExists(revision)
 
 
+class TestPurgeRevisionsFunction(WagtailTestUtils, TestCase):
+    def setUp(self):
+        self.root_page = Page.objects.get(id=2)
+        self.page = SimplePage(
+            title="Hello world!", slug="hello-world", content="hello"
+        )
+        self.root_page.add_child(instance=self.page)
+        self.page.refresh_from_db()
+
+    def test_counts(self):
+        revision_protected = self.page.save_revision()
+        PurgeRevisionsProtectedTestModel.objects.create(revision=revision_protected)
+        for i in range(3):
+            self.page.save_revision()
+
+        self.assertEqual(purge_revisions(dry_run=True), (2, 1))
+        self.assertEqual(Revision.objects.count(), 4)
+
+        self.assertEqual(purge_revisions(batch_size=1), (2, 1))
+        self.assertEqual(Revision.objects.count(), 2)
+
+    def test_comments_moved_to_next_revision(self):
+        user = self.create_test_user()
+        revision_1 = self.page.save_revision()
+        revision_2 = self.page.save_revision()
+        revision_3 = self.page.save_revision()
+        comment = Comment.objects.create(
+            page=self.page,
+            user=user,
+            text="A comment",
+            contentpath="title",
+            revision_created=revision_1,
+        )
+
+        self.assertEqual(purge_revisions(), (2, 0))
+
+        self.assertFalse(
+            Revision.objects.filter(id__in=[revision_1.id, revision_2.id]).exists()
+        )
+        comment.refresh_from_db()
+        self.assertEqual(comment.revision_created_id, revision_3.id)
+
+
 class TestPurgeEmbedsCommand(TestCase):
     fixtures = ["test.json"]
 
@@ -805,6 +972,61 @@ class TestPurgeEmbedsCommand(TestCase):
 
         self.assertEqual(Embed.objects.count(), 0)
 
+    def test_refresh_embeds(self):
+        Embed.objects.filter(hash__in=["0", "1"]).update(
+            cache_until=timezone.now() - timedelta(minutes=5)
+        )
+        Embed.objects.filter(hash="2").update(
+            cache_until=timezone.now() + timedelta(minutes=30)
+        )
+        Embed.objects.filter(hash="3").update(
+            cache_until=timezone.now() + timedelta(days=1)
+        )
+
+        with mock.patch(
+            "wagtail.management.commands.refresh_embeds.refresh_embeds",
+            side_effect=lambda embeds, max_per_provider: embeds[:1],
+        ) as refresh_embeds:
+            stdout = StringIO()
+            management.call_command(
+                "refresh_embeds", "--batch-size=2", "--verbosity=2", stdout=stdout
+            )
+
+        self.assertEqual(
+            [
+                [embed.hash for embed in call.args[0]]
+                for call in refresh_embeds.call_args_list
+            ],
+            [["0", "1"], ["2"]],
+        )
+        self.assertIn("Successfully refreshed 2 embeds", stdout.getvalue())
+        self.assertIn("1 embeds could not be refreshed", stdout.getvalue())
+
+
+class TestArchiveLogEntriesCommand(TestCase):
+    fixtures = ["test.json"]
+
+    def test_archive_log_entries(self):
+        page = Page.objects.get(url_path="/home/events/christmas/")
+        old_entry = PageLogEntry.objects.log_action(
+            page, "wagtail.edit", timestamp=timezone.now() - timedelta(days=400)
+        )
+        new_entry = PageLogEntry.objects.log_action(
+            page, "wagtail.edit", timestamp=timezone.now() - timedelta(days=300)
+        )
+
+        stdout = StringIO()
+        management.call_command("archive_log_entries", stdout=stdout)
+
+        self.assertIn("Successfully archived 1 log entries", stdout.getvalue())
+        self.assertFalse(PageLogEntry.objects.filter(pk=old_entry.pk).exists())
+        self.assertTrue(PageLogEntry.objects.filter(pk=new_entry.pk).exists())
+        self.assertTrue(PageLogEntryArchive.objects.filter(pk=old_entry.pk).exists())
+
+        management.call_command("archive_log_entries", "--days=200", stdout=StringIO())
+        self.assertFalse(PageLogEntry.objects.filter(pk=new_entry.pk).exists())
+        self.assertEqual(PageLogEntryArchive.objects.count(), 2)
+
 
 class TestCreateLogEntriesFromRevisionsCommand(TestCase):
     fixtures = ["test.json"]
@@ -1,7 +1,7 @@
 import datetime
 import json
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from asgiref.sync import async_to_sync
 from django.conf import settings
@@ -9,16 +9,22 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser, Group
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied, ValidationError
+from django.db import connection
 from django.http import Http404
 from django.test import Client, TestCase, override_settings
 from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone, translation
 from freezegun import freeze_time
+from treebeard.exceptions import InvalidMoveToDescendant
 
 from wagtail.actions.copy_for_translation import ParentNotTranslatedError
+from wagtail.actions.copy_page import CopyPageAction
+from wagtail.actions.update_aliases import UpdateAliasesAction
 from wagtail.coreutils import get_dummy_request
 from wagtail.locks import BasicLock, ScheduledForPublishLock, WorkflowLock
+from wagtail.log_actions import LogContext
 from wagtail.models import (
     Comment,
     GroupApprovalTask,
@@ -27,6 +33,7 @@ from wagtail.models import (
     PageLogEntry,
     PageManager,
     PageViewRestriction,
+    PendingAliasUpdate,
     Site,
     Workflow,
     WorkflowTask,
@@ -965,6 +972,43 @@ class TestMovePage(TestCase):
         self.assertEqual(christmas.depth, 5)
         self.assertEqual(christmas.url_path, "/home/about-us/events/christmas/")
 
+    def test_move_page_updates_tree(self):
+        homepage = Page.objects.get(url_path="/home/")
+        about_us_page = SimplePage.objects.get(url_path="/home/about-us/")
+        events_index = EventIndex.objects.get(url_path="/home/events/")
+        homepage_numchild = homepage.numchild
+        descendant_count = events_index.get_descendant_count()
+
+        events_index.move(about_us_page, pos="last-child")
+
+        # the in-memory instances are updated
+        self.assertEqual(events_index.depth, 4)
+        self.assertTrue(events_index.path.startswith(about_us_page.path))
+        self.assertEqual(about_us_page.numchild, 1)
+
+        self.assertEqual(Page.find_problems(), ([], [], [], [], []))
+        homepage.refresh_from_db()
+        self.assertEqual(homepage.numchild, homepage_numchild - 1)
+        self.assertEqual(events_index.get_descendant_count(), descendant_count)
+        for descendant in events_index.get_descendants():
+            self.assertTrue(descendant.url_path.startswith("/home/about-us/events/"))
+
+        # moving the page back to the end of its original parent
+        events_index.move(homepage, pos="last-child")
+        events_index.refresh_from_db()
+        self.assertEqual(events_index.url_path, "/home/events/")
+        self.assertEqual(events_index.get_parent().id, homepage.id)
+        self.assertEqual(Page.find_problems(), ([], [], [], [], []))
+
+    def test_cannot_move_page_to_descendant(self):
+        events_index = EventIndex.objects.get(url_path="/home/events/")
+        christmas = Page.objects.get(url_path="/home/events/christmas/")
+
+        with self.assertRaises(InvalidMoveToDescendant):
+            events_index.move(christmas, pos="last-child")
+        with self.assertRaises(InvalidMoveToDescendant):
+            events_index.move(events_index, pos="last-child")
+
 
 class TestPrevNextSiblings(TestCase):
     fixtures = ["test.json"]
@@ -2010,6 +2054,192 @@ class TestCopyPage(TestCase):
             "You cannot copy a tree branch recursively into itself",
         )
 
+    def _get_copied_tree(self, page):
+        return [
+            (
+                descendant.path[len(page.path) :],
+                descendant.depth - page.depth,
+                descendant.numchild,
+                descendant.url_path[len(page.url_path) :],
+                descendant.specific_class,
+                descendant.draft_title,
+                descendant.live,
+                descendant.latest_revision.content["title"],
+                descendant.live_revision_id == descendant.latest_revision_id,
+                descendant.revisions.count(),
+                list(
+                    PageLogEntry.objects.filter(page=descendant)
+                    .order_by("pk")
+                    .values_list("action", flat=True)
+                ),
+            )
+            for descendant in page.get_descendants().order_by("path")
+        ]
+
+    def test_copy_page_recursively_in_bulk(self):
+        events_index = EventIndex.objects.get(url_path="/home/events/")
+        christmas_event = EventPage.objects.get(url_path="/home/events/christmas/")
+        christmas_event.title = "Christmas draft"
+        christmas_event.save_revision()
+
+        with (
+            patch.object(CopyPageAction, "can_bulk_copy", return_value=False),
+            CaptureQueriesContext(connection) as per_page_queries,
+        ):
+            per_page_copy = events_index.copy(
+                recursive=True,
+                update_attrs={"title": "Per-page copy", "slug": "per-page-copy"},
+            )
+
+        with CaptureQueriesContext(connection) as bulk_queries:
+            bulk_copy = events_index.copy(
+                recursive=True,
+                update_attrs={"title": "Bulk copy", "slug": "bulk-copy"},
+            )
+
+        self.assertLess(len(bulk_queries), len(per_page_queries))
+        self.assertEqual(bulk_copy.numchild, events_index.numchild)
+        self.assertEqual(
+            self._get_copied_tree(bulk_copy), self._get_copied_tree(per_page_copy)
+        )
+
+        new_christmas_event = bulk_copy.get_children().get(slug="christmas").specific
+        self.assertEqual(new_christmas_event.draft_title, "Christmas draft")
+        self.assertEqual(new_christmas_event.title, "Christmas")
+        self.assertEqual(
+            new_christmas_event.speakers.count(), christmas_event.speakers.count()
+        )
+        self.assertNotEqual(
+            new_christmas_event.translation_key, christmas_event.translation_key
+        )
+        self.assertEqual(Page.find_problems(), ([], [], [], [], []))
+
+    def test_copy_page_recursively_in_bulk_options(self):
+        events_index = EventIndex.objects.get(url_path="/home/events/")
+
+        for i, options in enumerate(
+            [
+                {"copy_revisions": False},
+                {"keep_live": False},
+                {"log_action": None},
+            ]
+        ):
+            with self.subTest(**options):
+                with patch.object(CopyPageAction, "can_bulk_copy", return_value=False):
+                    per_page_copy = events_index.copy(
+                        recursive=True,
+                        update_attrs={"title": "Per-page", "slug": f"per-page-{i}"},
+                        **options,
+                    )
+                bulk_copy = events_index.copy(
+                    recursive=True,
+                    update_attrs={"title": "Bulk", "slug": f"bulk-{i}"},
+                    **options,
+                )
+
+                self.assertEqual(
+                    self._get_copied_tree(bulk_copy),
+                    self._get_copied_tree(per_page_copy),
+                )
+
+    def test_copy_page_recursively_in_bulk_uses_log_context(self):
+        events_index = EventIndex.objects.get(url_path="/home/events/")
+        user = get_user_model().objects.get(email="eventmoderator@example.com")
+
+        with LogContext(user=user) as log_context:
+            bulk_copy = events_index.copy(
+                recursive=True,
+                update_attrs={"title": "Bulk copy", "slug": "bulk-copy"},
+            )
+
+        log_entries = PageLogEntry.objects.filter(
+            page__in=bulk_copy.get_descendants(), action="wagtail.copy"
+        )
+        self.assertEqual(log_entries.count(), bulk_copy.get_descendants().count())
+        self.assertEqual({entry.uuid for entry in log_entries}, {log_context.uuid})
+        self.assertEqual({entry.user for entry in log_entries}, {user})
+
+    def test_copy_page_recursively_in_bulk_with_custom_save_descendant(self):
+        homepage = Page.objects.get(url_path="/home/")
+        section = homepage.add_child(
+            instance=SimplePage(title="Section", slug="section", content="hello")
+        )
+        subsection = section.add_child(
+            instance=SimplePage(title="Subsection", slug="subsection", content="hello")
+        )
+        subsection.add_child(
+            instance=EventPage(
+                title="Event",
+                slug="event",
+                location="the moon",
+                audience="public",
+                cost="free",
+                date_from=datetime.date(2026, 12, 25),
+            )
+        )
+
+        saved_titles = []
+
+        def save(self, *args, **kwargs):
+            saved_titles.append(self.title)
+            return Page.save(self, *args, **kwargs)
+
+        with patch.object(EventPage, "save", save):
+            section_copy = section.copy(
+                recursive=True,
+                update_attrs={"title": "Section copy", "slug": "section-copy"},
+            )
+
+        # The event page was saved with its own save() method, once its copied
+        # parent had been inserted
+        self.assertEqual(saved_titles, ["Event"])
+        event_copy = EventPage.objects.get(
+            url_path="/home/section-copy/subsection/event/"
+        )
+        self.assertEqual(
+            event_copy.get_parent().get_parent().specific, section_copy.specific
+        )
+        self.assertEqual(
+            list(
+                PageLogEntry.objects.filter(page=event_copy)
+                .order_by("pk")
+                .values_list("action", flat=True)
+            ),
+            ["wagtail.create", "wagtail.copy", "wagtail.publish"],
+        )
+        self.assertEqual(Page.find_problems(), ([], [], [], [], []))
+
+    @override_settings(WAGTAIL_BUFFER_LOG_ENTRIES=True)
+    def test_copy_page_recursively_in_bulk_buffers_log_entries(self):
+        events_index = EventIndex.objects.get(url_path="/home/events/")
+
+        with (
+            CaptureQueriesContext(connection) as queries,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            page_copy = events_index.copy(
+                recursive=True,
+                update_attrs={"title": "Bulk copy", "slug": "bulk-copy"},
+            )
+
+        # The log entries of the copied descendants are inserted together when the
+        # copy is committed, rather than one at a time
+        log_entry_inserts = [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith(f'INSERT INTO "{PageLogEntry._meta.db_table}"')
+        ]
+        descendant_ids = list(page_copy.get_descendants().values_list("pk", flat=True))
+        self.assertLess(len(log_entry_inserts), len(descendant_ids))
+        self.assertEqual(
+            set(
+                PageLogEntry.objects.filter(
+                    page_id__in=descendant_ids, action="wagtail.copy"
+                ).values_list("page_id", flat=True)
+            ),
+            set(descendant_ids),
+        )
+
     def test_copy_page_updates_user(self):
         event_moderator = get_user_model().objects.get(
             email="eventmoderator@example.com"
@@ -3101,6 +3331,141 @@ class TestUpdateAliases(TestCase):
             ).exists()
         )
 
+    def test_update_aliases_replaces_child_objects_and_relations(self):
+        event_page = EventPage.objects.get(url_path="/home/events/christmas/")
+        alias = event_page.create_alias(update_slug="new-event-page")
+        alias_alias = alias.create_alias(update_slug="new-event-page-2")
+        fr_locale = Locale.objects.create(language_code="fr")
+        fr_alias = event_page.copy_for_translation(
+            fr_locale, copy_parents=True, alias=True
+        )
+        first_published_at = alias.first_published_at
+
+        category = EventCategory.objects.create(name="Parties")
+        event_page.title = "Updated title"
+        event_page.categories = [category]
+        event_page.speakers.add(EventPageSpeaker(first_name="Ted", last_name="Crilly"))
+        event_page.save()
+
+        published_aliases = []
+
+        def page_published_handler(sender, instance, alias=False, **kwargs):
+            if alias:
+                published_aliases.append(instance.pk)
+
+        page_published.connect(page_published_handler)
+        try:
+            event_page.update_aliases()
+        finally:
+            page_published.disconnect(page_published_handler)
+
+        self.assertCountEqual(
+            published_aliases, [alias.pk, alias_alias.pk, fr_alias.pk]
+        )
+
+        speakers = list(event_page.speakers.order_by("pk"))
+        for page in [alias, alias_alias, fr_alias]:
+            page.refresh_from_db()
+            self.assertEqual(page.title, "Updated title")
+            self.assertEqual(page.draft_title, "Updated title")
+            self.assertEqual(list(page.categories.all()), [category])
+
+            page_speakers = list(page.speakers.order_by("pk"))
+            self.assertEqual(
+                [speaker.first_name for speaker in page_speakers],
+                [speaker.first_name for speaker in speakers],
+            )
+            for speaker in page_speakers:
+                self.assertEqual(speaker.locale_id, page.locale_id)
+
+        self.assertEqual(alias.slug, "new-event-page")
+        self.assertEqual(alias.first_published_at, first_published_at)
+
+        # Child objects of aliases that aren't translations get new translation keys
+        original_keys = {speaker.translation_key for speaker in speakers}
+        alias_keys = {speaker.translation_key for speaker in alias.speakers.all()}
+        self.assertFalse(alias_keys & original_keys)
+        self.assertFalse(
+            {speaker.translation_key for speaker in alias_alias.speakers.all()}
+            & alias_keys
+        )
+
+        # Child objects of translations keep the translation keys of the original
+        self.assertEqual(
+            {speaker.translation_key for speaker in fr_alias.speakers.all()},
+            original_keys,
+        )
+
+    @override_settings(WAGTAIL_BACKGROUND_ALIAS_UPDATE_LIMIT=2)
+    def test_update_aliases_in_background(self):
+        event_page = EventPage.objects.get(url_path="/home/events/christmas/")
+        alias = event_page.create_alias(update_slug="new-event-page")
+        alias_alias = alias.create_alias(update_slug="new-event-page-2")
+        other_alias = event_page.create_alias(update_slug="new-event-page-3")
+
+        event_page.title = "Updated title"
+        revision = event_page.save_revision()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            revision.publish()
+
+            # The aliases are updated once the transaction is committed
+            pending_update = PendingAliasUpdate.objects.get(page=event_page)
+            self.assertEqual(pending_update.revision, revision)
+            self.assertEqual(pending_update.total_aliases, 3)
+            self.assertEqual(pending_update.updated_aliases, 0)
+            alias.refresh_from_db()
+            self.assertEqual(alias.title, "Christmas")
+
+        for page in [alias, alias_alias, other_alias]:
+            page.refresh_from_db()
+            self.assertEqual(page.title, "Updated title")
+        self.assertFalse(PendingAliasUpdate.objects.exists())
+
+    @override_settings(WAGTAIL_BACKGROUND_ALIAS_UPDATE_LIMIT=3)
+    def test_update_aliases_in_background_counts_nested_aliases(self):
+        event_page = EventPage.objects.get(url_path="/home/events/christmas/")
+        alias = event_page.create_alias(update_slug="new-event-page")
+        alias_alias = alias.create_alias(update_slug="new-event-page-2")
+        alias_alias.create_alias(update_slug="new-event-page-3")
+
+        event_page.title = "Updated title"
+        revision = event_page.save_revision()
+
+        # The page has a single direct alias, but three aliases in total
+        with self.captureOnCommitCallbacks():
+            revision.publish()
+
+        pending_update = PendingAliasUpdate.objects.get(page=event_page)
+        self.assertEqual(pending_update.total_aliases, 3)
+        alias.refresh_from_db()
+        self.assertEqual(alias.title, "Christmas")
+
+    def test_count_aliases(self):
+        event_page = EventPage.objects.get(url_path="/home/events/christmas/")
+        alias = event_page.create_alias(update_slug="new-event-page")
+        alias.create_alias(update_slug="new-event-page-2")
+        event_page.create_alias(update_slug="new-event-page-3")
+
+        action = UpdateAliasesAction(event_page)
+        self.assertEqual(action.count_aliases(), 3)
+
+        # Counting stops at the level where the limit is reached
+        with self.assertNumQueries(1):
+            self.assertEqual(action.count_aliases(limit=2), 2)
+
+    @override_settings(WAGTAIL_BACKGROUND_ALIAS_UPDATE_LIMIT=2)
+    def test_update_aliases_in_request_below_background_limit(self):
+        event_page = EventPage.objects.get(url_path="/home/events/christmas/")
+        alias = event_page.create_alias(update_slug="new-event-page")
+
+        event_page.title = "Updated title"
+        event_page.save_revision().publish()
+
+        alias.refresh_from_db()
+        self.assertEqual(alias.title, "Updated title")
+        self.assertFalse(PendingAliasUpdate.objects.exists())
+
 
 class TestCopyForTranslation(TestCase):
     fixtures = ["test.json"]
@@ -990,6 +990,77 @@ class TestPagePermission(TestCase):
         self.assertIsInstance(page.permissions_for_user(user), CustomPermissionTester)
 
 
+class TestAnnotatePermissionsForUser(TestCase):
+    fixtures = ["test.json"]
+
+    actions = [
+        "can_add_subpage",
+        "can_edit",
+        "can_delete",
+        "can_move",
+        "can_publish",
+        "can_unpublish",
+        "can_reorder_children",
+    ]
+
+    def get_results(self, pages, user):
+        return {
+            page.pk: {
+                action: getattr(page.permissions_for_user(user), action)()
+                for action in self.actions
+            }
+            for page in pages
+        }
+
+    def test_results_match_unannotated_testers(self):
+        User = get_user_model()
+        users = [
+            User.objects.get(email="superuser@example.com"),
+            User.objects.get(email="eventeditor@example.com"),
+            User.objects.get(email="eventmoderator@example.com"),
+            User.objects.get(email="inactiveuser@example.com"),
+        ]
+        # the event editor can edit their own, unpublished event
+        Page.objects.filter(
+            url_path="/home/events/tentative-unpublished-event/"
+        ).update(owner=users[1])
+
+        for user in users:
+            with self.subTest(user=user):
+                expected = self.get_results(Page.objects.all(), user)
+
+                pages = list(Page.objects.all())
+                Page.objects.annotate_permissions_for_user(pages, user)
+                self.assertEqual(self.get_results(pages, user), expected)
+
+    def test_descendants_checked_in_single_query(self):
+        user = get_user_model().objects.get(email="eventeditor@example.com")
+        pages = list(Page.objects.filter(depth__gt=1))
+
+        # one query for the user's permissions, and one for the descendants
+        with self.assertNumQueries(2):
+            Page.objects.annotate_permissions_for_user(pages, user)
+        with self.assertNumQueries(0):
+            for page in pages:
+                page.permissions_for_user(user).can_delete()
+
+    def test_annotation_is_per_user(self):
+        event_editor = get_user_model().objects.get(email="eventeditor@example.com")
+        superuser = get_user_model().objects.get(email="superuser@example.com")
+        [page] = Page.objects.filter(url_path="/home/events/christmas/")
+        Page.objects.annotate_permissions_for_user([page], event_editor)
+
+        self.assertIs(
+            page.permissions_for_user(event_editor),
+            page.permissions_for_user(event_editor),
+        )
+        self.assertIsNot(
+            page.permissions_for_user(superuser),
+            page.permissions_for_user(event_editor),
+        )
+        self.assertTrue(page.permissions_for_user(superuser).can_publish())
+
+
 class TestPagePermissionTesterCanCopyTo(TestCase):
     """Tests PagePermissionTester.can_copy_to()"""
 
@@ -1,7 +1,12 @@
 from django.contrib.auth.models import Group
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 
 from wagtail.models import Page, PageViewRestriction
+from wagtail.models.pages import (
+    VIEW_RESTRICTION_PATHS_CACHE_KEY,
+    VIEW_RESTRICTION_PATHS_CACHE_VERSION,
+)
 from wagtail.test.utils import WagtailTestUtils
 
 
@@ -246,3 +251,138 @@ class TestPagePrivacy(WagtailTestUtils, TestCase):
         self.assertIn("no-store", response["Cache-Control"])
         self.assertIn("must-revalidate", response["Cache-Control"])
         self.assertIn("max-age=0", response["Cache-Control"])
+
+
+class TestGetViewRestrictions(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        cache.clear()
+        self.secret_plans_page = Page.objects.get(url_path="/home/secret-plans/")
+        self.view_restriction = PageViewRestriction.objects.get(
+            page=self.secret_plans_page
+        )
+        self.about_us_page = Page.objects.get(url_path="/home/about-us/")
+
+    def test_restricted_paths(self):
+        restricted_paths = PageViewRestriction.get_restricted_paths()
+        self.assertEqual(
+            restricted_paths[self.secret_plans_page.path],
+            {self.secret_plans_page.id},
+        )
+        self.assertNotIn(self.about_us_page.path, restricted_paths)
+
+    def test_restrictions_apply_to_subpages(self):
+        underpants_page = Page.objects.get(
+            url_path="/home/secret-plans/steal-underpants/"
+        )
+        self.assertEqual(
+            list(underpants_page.get_view_restrictions()), [self.view_restriction]
+        )
+
+    def test_restrictions_apply_to_aliases(self):
+        alias_page = self.secret_plans_page.create_alias(
+            update_slug="alias-secret-plans"
+        )
+        self.assertEqual(
+            list(alias_page.get_view_restrictions()), [self.view_restriction]
+        )
+
+        # once converted to a regular page, the restriction copied to the alias
+        # applies instead
+        alias_page.alias_of_id = None
+        alias_page.save(update_fields=["alias_of_id"], clean=False)
+        self.assertEqual(
+            [restriction.page_id for restriction in alias_page.get_view_restrictions()],
+            [alias_page.id],
+        )
+
+    def test_restriction_change(self):
+        self.assertEqual(list(self.about_us_page.get_view_restrictions()), [])
+
+        restriction = PageViewRestriction.objects.create(
+            page=self.about_us_page, restriction_type=PageViewRestriction.LOGIN
+        )
+        self.assertEqual(
+            list(self.about_us_page.get_view_restrictions()), [restriction]
+        )
+
+        restriction.delete()
+        self.assertEqual(list(self.about_us_page.get_view_restrictions()), [])
+
+    def test_move(self):
+        self.assertEqual(list(self.about_us_page.get_view_restrictions()), [])
+
+        self.about_us_page.move(self.secret_plans_page, pos="last-child")
+
+        self.about_us_page.refresh_from_db()
+        self.assertEqual(
+            list(self.about_us_page.get_view_restrictions()), [self.view_restriction]
+        )
+
+    def test_private_pages_with_aliases(self):
+        alias_page = self.secret_plans_page.create_alias(
+            update_slug="alias-secret-plans"
+        )
+        PageViewRestriction.objects.filter(page=alias_page).delete()
+
+        # Querysets only consider the restrictions set on each page, so an alias of
+        # a restricted page is not included in private pages
+        self.assertTrue(
+            Page.objects.private().filter(pk=self.secret_plans_page.pk).exists()
+        )
+        self.assertFalse(Page.objects.private().filter(pk=alias_page.pk).exists())
+        self.assertTrue(Page.objects.public().filter(pk=alias_page.pk).exists())
+
+        # ...and restrictions set on an alias itself are
+        PageViewRestriction.objects.create(
+            page=alias_page, restriction_type=PageViewRestriction.LOGIN
+        )
+        self.assertTrue(Page.objects.private().filter(pk=alias_page.pk).exists())
+        self.assertFalse(Page.objects.public().filter(pk=alias_page.pk).exists())
+
+    @override_settings(WAGTAIL_CACHE_VIEW_RESTRICTIONS=False)
+    def test_cache_not_used_when_disabled(self):
+        # A stale cached value, such as one left in another process's cache, is
+        # ignored unless the cache is enabled
+        cache.set(
+            VIEW_RESTRICTION_PATHS_CACHE_KEY,
+            (set(), {}),
+            version=VIEW_RESTRICTION_PATHS_CACHE_VERSION,
+        )
+
+        self.assertEqual(
+            list(self.secret_plans_page.get_view_restrictions()),
+            [self.view_restriction],
+        )
+        self.assertTrue(
+            Page.objects.private().filter(pk=self.secret_plans_page.pk).exists()
+        )
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    WAGTAIL_CACHE_VIEW_RESTRICTIONS=True,
+)
+class TestGetViewRestrictionsCached(TestGetViewRestrictions):
+    def test_public_page_makes_no_queries(self):
+        PageViewRestriction.get_restricted_paths()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(list(self.about_us_page.get_view_restrictions()), [])
+
+    def test_cache_cleared_again_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            restriction = PageViewRestriction.objects.create(
+                page=self.about_us_page, restriction_type=PageViewRestriction.LOGIN
+            )
+            # A concurrent request caches the paths from before the change
+            cache.set(
+                VIEW_RESTRICTION_PATHS_CACHE_KEY,
+                (set(), {}),
+                version=VIEW_RESTRICTION_PATHS_CACHE_VERSION,
+            )
+
+        self.assertEqual(
+            list(self.about_us_page.get_view_restrictions()), [restriction]
+        )
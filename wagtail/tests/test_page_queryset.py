@@ -4,8 +4,9 @@ from unittest import mock
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.core import management
+from django.db import models
 from django.db.models import Count, Q
-from django.test import TestCase, TransactionTestCase, tag
+from django.test import TestCase, TransactionTestCase, override_settings, tag
 
 from wagtail.models import Locale, Page, PageViewRestriction, Site, Workflow
 from wagtail.search.query import MATCH_ALL
@@ -504,6 +505,17 @@ class TestPageQuerySet(TestCase):
             # Check that the event is in the results
             self.assertTrue(pages.filter(id=event.id).exists())
 
+    @override_settings(WAGTAIL_CACHE_VIEW_RESTRICTIONS=True)
+    def test_public_with_cached_restricted_paths(self):
+        events_index = Page.objects.get(url_path="/home/events/")
+        PageViewRestriction.objects.create(page=events_index, password="hello")
+        Page.objects.public()
+
+        # The restricted paths are looked up from the cache
+        with self.assertNumQueries(2):
+            pages = Page.objects.public()
+            self.assertFalse(pages.filter(id=events_index.id).exists())
+
     def test_private_with_no_private_page(self):
         PageViewRestriction.objects.all().delete()
 
@@ -921,7 +933,7 @@ class TestSpecificQuery(WagtailTestUtils, TestCase):
         self.assertEqual(results.last().subscribers_count, 1)
 
     def test_specific_subquery_select_related(self):
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(1):
             pages = list(
                 Page.objects.type(EventPage)
                 .specific()
@@ -932,6 +944,104 @@ class TestSpecificQuery(WagtailTestUtils, TestCase):
             for page in pages:
                 self.assertTrue(page.feed_image)
 
+    def add_single_event_page(self):
+        return Page.objects.get(url_path="/home/events/").add_child(
+            instance=SingleEventPage(
+                title="Single event",
+                slug="single-event",
+                date_from="2026-01-01",
+                audience="public",
+                location="Reykjavik",
+                cost="Free",
+                excerpt="Just the one",
+            )
+        )
+
+    def test_specific_query_with_known_type_uses_single_query(self):
+        self.add_single_event_page()
+
+        with self.assertNumQueries(1):
+            pages = list(
+                Page.objects.type(EventPage)
+                .annotate(subscribers_count=Count("subscribers"))
+                .order_by("-path")
+                .specific()
+            )
+
+        self.assertEqual(
+            pages,
+            [page.specific for page in Page.objects.type(EventPage).order_by("-path")],
+        )
+        self.assertIn(SingleEventPage, {type(page) for page in pages})
+        with self.assertNumQueries(0):
+            for page in pages:
+                self.assertIsInstance(page, page.specific_class)
+                self.assertEqual(page.subscribers_count, 0)
+                self.assertTrue(page.location)
+
+    def test_specific_query_with_exact_type_uses_single_query(self):
+        self.add_single_event_page()
+
+        with self.assertNumQueries(1):
+            pages = list(Page.objects.exact_type(SingleEventPage).specific())
+
+        self.assertEqual(len(pages), 1)
+        self.assertIsInstance(pages[0], SingleEventPage)
+        with self.assertNumQueries(0):
+            self.assertEqual(pages[0].excerpt, "Just the one")
+            self.assertEqual(pages[0].location, "Reykjavik")
+
+    def test_specific_query_with_known_type_sliced_and_chunked(self):
+        self.add_single_event_page()
+        expected = [
+            page.specific for page in Page.objects.type(EventPage).order_by("path")
+        ]
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                list(Page.objects.type(EventPage).order_by("path").specific()[1:3]),
+                expected[1:3],
+            )
+        self.assertEqual(
+            list(
+                Page.objects.type(EventPage)
+                .order_by("path")
+                .specific()
+                .iterator(chunk_size=2)
+            ),
+            expected,
+        )
+
+    def test_specific_query_with_known_type_falls_back_for_many_models(self):
+        self.add_single_event_page()
+
+        with mock.patch("wagtail.query.SpecificIterable.max_joined_models", 1):
+            with self.assertNumQueries(3):
+                # a values query, followed by one query each for EventPage
+                # and SingleEventPage
+                pages = list(Page.objects.type(EventPage).specific())
+        self.assertEqual(len(pages), 5)
+
+    def test_specific_query_with_combined_type_filters(self):
+        qs = Page.objects.type(EventPage) | Page.objects.type(SimplePage)
+        self.assertIsNone(qs._specific_models)
+        qs = Page.objects.type(EventPage).exact_type(SingleEventPage, SimplePage)
+        self.assertEqual(qs._specific_models, {SingleEventPage})
+
+    def test_specific_query_with_known_type_handles_missing_rows(self):
+        christmas = Page.objects.get(url_path="/home/events/christmas/")
+        models.Model.delete(christmas.specific, keep_parents=True)
+
+        with self.assertWarnsRegex(
+            RuntimeWarning,
+            "Specific versions of the following items could not be found",
+        ):
+            pages = list(Page.objects.type(EventPage).order_by("path").specific())
+
+        self.assertEqual(len(pages), 4)
+        self.assertEqual(pages[0], christmas)
+        self.assertIs(type(pages[0]), Page)
+        self.assertIsInstance(pages[1], EventPage)
+
     def test_specific_subquery_select_related_without_fields(
         self,
     ):
@@ -939,7 +1049,7 @@ class TestSpecificQuery(WagtailTestUtils, TestCase):
             Page.objects.all().select_related(for_specific_subqueries=True)
 
     def test_specific_subquery_select_related_negation(self):
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(1):
             pages = list(
                 Page.objects.type(EventPage)
                 .specific()
@@ -953,7 +1063,7 @@ class TestSpecificQuery(WagtailTestUtils, TestCase):
                 self.assertTrue(page.feed_image)
 
     def test_specific_subquery_prefetch_related(self):
-        with self.assertNumQueries(3):
+        with self.assertNumQueries(2):
             pages = list(
                 Page.objects.type(EventPage)
                 .specific()
@@ -969,7 +1079,7 @@ class TestSpecificQuery(WagtailTestUtils, TestCase):
             Page.objects.all().prefetch_related(for_specific_subqueries=True)
 
     def test_specific_subquery_prefetch_related_negation(self):
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(1):
             pages = list(
                 Page.objects.type(EventPage)
                 .specific()
@@ -984,7 +1094,7 @@ class TestSpecificQuery(WagtailTestUtils, TestCase):
                 self.assertFalse(page.categories.all())
 
     def test_specific_subquery_select_related_and_prefetch_related(self):
-        with self.assertNumQueries(3):
+        with self.assertNumQueries(2):
             pages = list(
                 Page.objects.type(EventPage)
                 .specific()
@@ -0,0 +1,220 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from wagtail.models import Page, PageNode, get_cached_page_tree
+from wagtail.models.page_tree import _get_version_keys
+from wagtail.test.testapp.models import EventIndex, EventPage, SingleEventPage
+
+
+class TestPageQuerySetAsTree(TestCase):
+    fixtures = ["test.json"]
+
+    def test_as_tree(self):
+        events_index = Page.objects.get(url_path="/home/events/")
+
+        with self.assertNumQueries(1):
+            [root] = Page.objects.descendant_of(events_index, inclusive=True).as_tree()
+
+        self.assertIsInstance(root, PageNode)
+        self.assertEqual(root.id, events_index.id)
+        self.assertEqual(root.title, "Events")
+        self.assertEqual(root.depth, 3)
+        self.assertEqual(root.url_path, "/home/events/")
+        self.assertEqual(root.language_code, "en")
+        self.assertIsNone(root.parent)
+        self.assertIs(root.specific_class, EventIndex)
+
+        self.assertEqual(
+            [child.url_path for child in root.children],
+            [
+                "/home/events/christmas/",
+                "/home/events/tentative-unpublished-event/",
+                "/home/events/someone-elses-event/",
+                "/home/events/final-event/",
+                "/home/events/saint-patrick/",
+                "/home/events/businessy-events/",
+            ],
+        )
+        for child in root.children:
+            self.assertIs(child.parent, root)
+
+        self.assertEqual(
+            [node.id for node in root.get_descendants()],
+            list(
+                events_index.get_descendants()
+                .order_by("path")
+                .values_list("id", flat=True)
+            ),
+        )
+
+    def test_as_tree_with_filters(self):
+        events_index = Page.objects.get(url_path="/home/events/")
+
+        # nodes whose parent is filtered out are returned at the top level
+        nodes = events_index.get_descendants().live().as_tree()
+        self.assertEqual(
+            [node.url_path for node in nodes],
+            [
+                "/home/events/christmas/",
+                "/home/events/final-event/",
+                "/home/events/saint-patrick/",
+            ],
+        )
+        self.assertEqual(nodes[0].children, [])
+
+    def test_nodes_are_read_only(self):
+        [node] = Page.objects.filter(url_path="/home/").as_tree()
+        with self.assertRaises(AttributeError):
+            node.title = "Changed"
+        with self.assertRaises(AttributeError):
+            node.foo = "bar"
+
+    def test_urls(self):
+        [root] = (
+            Page.objects.get(url_path="/home/")
+            .get_descendants(inclusive=True)
+            .as_tree()
+        )
+        events = root.children[0]
+        # site root paths are looked up once, and shared by all nodes in the tree
+        self.assertEqual(root.url, "/")
+        with self.assertNumQueries(0):
+            self.assertEqual(events.url, "/events/")
+            self.assertEqual(events.full_url, "http://localhost/events/")
+            self.assertEqual(events.get_url(), "/events/")
+        self.assertEqual(
+            events.url, Page.objects.get(url_path="/home/events/").specific.url
+        )
+
+    def test_url_with_custom_url_parts(self):
+        # SingleEventPage overrides get_url_parts, so the URL comes from the specific page
+        [node] = Page.objects.type(SingleEventPage).as_tree()
+        with self.assertNumQueries(1):
+            node.specific
+        self.assertEqual(node.url, "/events/saint-patrick/pointless-suffix/")
+
+    def test_specific(self):
+        [node] = Page.objects.filter(url_path="/home/events/christmas/").as_tree()
+        with self.assertNumQueries(1):
+            page = node.specific
+        self.assertIsInstance(page, EventPage)
+        self.assertEqual(page.id, node.id)
+        with self.assertNumQueries(0):
+            self.assertIs(node.specific, page)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class TestGetCachedPageTree(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        cache.clear()
+        self.home = Page.objects.get(url_path="/home/")
+
+    def test_get_cached_page_tree(self):
+        root = get_cached_page_tree(self.home, max_depth=1, in_menu=True)
+        self.assertEqual(root.id, self.home.id)
+        # /home/events/ and its children are shown in menus and live
+        self.assertIn("/home/events/", [child.url_path for child in root.children])
+        for child in root.children:
+            self.assertEqual(child.children, [])
+        self.assertNotIn(
+            "/home/events/christmas/",
+            [node.url_path for node in root.get_descendants()],
+        )
+
+        with self.assertNumQueries(0):
+            cached_root = get_cached_page_tree(self.home, max_depth=1, in_menu=True)
+        self.assertEqual(
+            [child.id for child in cached_root.children],
+            [child.id for child in root.children],
+        )
+
+    def test_excludes_unpublished_pages(self):
+        events_index = Page.objects.get(url_path="/home/events/")
+        root = get_cached_page_tree(events_index)
+        url_paths = [node.url_path for node in root.get_descendants()]
+        self.assertIn("/home/events/christmas/", url_paths)
+        self.assertNotIn("/home/events/tentative-unpublished-event/", url_paths)
+
+    def test_invalidated_on_unpublish(self):
+        christmas = Page.objects.get(url_path="/home/events/christmas/")
+        root = get_cached_page_tree(self.home)
+        self.assertIn(christmas.id, [node.id for node in root.get_descendants()])
+
+        christmas.unpublish()
+
+        root = get_cached_page_tree(self.home)
+        self.assertNotIn(christmas.id, [node.id for node in root.get_descendants()])
+
+    def test_invalidated_on_publish(self):
+        christmas = Page.objects.get(url_path="/home/events/christmas/").specific
+        events_index = Page.objects.get(url_path="/home/events/")
+        get_cached_page_tree(events_index)
+
+        christmas.title = "Christmas party"
+        christmas.save_revision().publish()
+
+        root = get_cached_page_tree(events_index)
+        self.assertEqual(root.children[0].title, "Christmas party")
+
+    def test_invalidated_on_ancestor_change(self):
+        # trees rooted below a changed page are invalidated too, as their URL
+        # paths may have changed
+        events_index = Page.objects.get(url_path="/home/events/").specific
+        get_cached_page_tree(events_index)
+
+        events_index.slug = "whats-on"
+        events_index.save_revision().publish()
+
+        events_index.refresh_from_db()
+        root = get_cached_page_tree(events_index)
+        self.assertEqual(root.url_path, "/home/whats-on/")
+        self.assertEqual(root.children[0].url_path, "/home/whats-on/christmas/")
+
+    def test_invalidated_on_move(self):
+        christmas = Page.objects.get(url_path="/home/events/christmas/")
+        about_us = Page.objects.get(url_path="/home/about-us/")
+        events_index = Page.objects.get(url_path="/home/events/")
+        get_cached_page_tree(events_index)
+        get_cached_page_tree(about_us)
+
+        christmas.move(about_us, pos="last-child")
+
+        self.assertNotIn(
+            christmas.id,
+            [node.id for node in get_cached_page_tree(events_index).children],
+        )
+        self.assertIn(
+            christmas.id,
+            [node.id for node in get_cached_page_tree(about_us).children],
+        )
+
+    def test_invalidated_on_delete(self):
+        christmas = Page.objects.get(url_path="/home/events/christmas/")
+        events_index = Page.objects.get(url_path="/home/events/")
+        get_cached_page_tree(events_index)
+
+        christmas.delete()
+
+        self.assertNotIn(
+            christmas.id,
+            [node.id for node in get_cached_page_tree(events_index).children],
+        )
+
+    def test_invalidated_again_on_commit(self):
+        christmas = Page.objects.get(url_path="/home/events/christmas/")
+        version_keys = _get_version_keys(christmas.path)
+        get_cached_page_tree(self.home)
+        old_versions = cache.get_many(version_keys)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            christmas.unpublish()
+            # A concurrent request caches the tree from before the change under the
+            # new versions, which is equivalent to restoring the old versions
+            cache.set_many(old_versions)
+
+        root = get_cached_page_tree(self.home)
+        self.assertNotIn(christmas.id, [node.id for node in root.get_descendants()])
@@ -1,11 +1,14 @@
 import datetime
+import json
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
 from freezegun import freeze_time
 
 from wagtail.models import ModelLogEntry, Page, Revision, get_default_page_content_type
+from wagtail.models.revisions import COMPRESSED_CONTENT_KEY
 from wagtail.test.testapp.models import (
     FullFeaturedSnippet,
     RevisableChildModel,
@@ -382,3 +385,46 @@ class TestRevisableModel(WagtailTestUtils, TestCase):
         self.assertEqual(self.instance.revisions.count(), 1)
         latest_revision = self.instance.get_latest_revision()
         self.assertEqual(latest_revision.content["text"], "Existing revision")
+
+
+@override_settings(WAGTAIL_COMPRESS_REVISIONS=True)
+class TestCompressedRevisionContent(TestCase):
+    def setUp(self):
+        self.instance = FullFeaturedSnippet.objects.create(text="foo")
+
+    def get_stored_content(self, revision):
+        # bypass RevisionContentField.from_db_value to read the stored JSON
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT content FROM wagtailcore_revision WHERE id = %s",
+                [revision.id],
+            )
+            content = cursor.fetchone()[0]
+        return json.loads(content) if isinstance(content, str) else content
+
+    def test_content_is_compressed(self):
+        self.instance.text = "updated"
+        revision = self.instance.save_revision()
+
+        stored_content = self.get_stored_content(revision)
+        self.assertEqual(stored_content[COMPRESSED_CONTENT_KEY], "zlib")
+        self.assertNotIn("text", stored_content)
+
+        revision = Revision.objects.get(id=revision.id)
+        self.assertEqual(revision.content["text"], "updated")
+        self.assertEqual(revision.as_object().text, "updated")
+        self.assertEqual(
+            Revision.objects.filter(id=revision.id).values_list("content", flat=True)[
+                0
+            ]["text"],
+            "updated",
+        )
+
+    def test_uncompressed_content_can_be_read(self):
+        with override_settings(WAGTAIL_COMPRESS_REVISIONS=False):
+            self.instance.text = "uncompressed"
+            revision = self.instance.save_revision()
+        self.assertEqual(self.get_stored_content(revision)["text"], "uncompressed")
+
+        revision = Revision.objects.get(id=revision.id)
+        self.assertEqual(revision.content["text"], "uncompressed")
@@ -99,7 +99,8 @@ def sendfile(
             parts.append("filename*=UTF-8''%s" % quoted_filename)
 
     response["Content-Disposition"] = "; ".join(parts)
-    response["Content-length"] = os.path.getsize(filename)
+    if not response.has_header("Content-Length"):
+        response["Content-length"] = os.path.getsize(filename)
     response["Content-Type"] = mimetype
     response["Content-Encoding"] = encoding or guessed_encoding
 
@@ -2,14 +2,20 @@
 # This is based on sendfiles builtin "simple" backend but uses a StreamingHttpResponse
 
 import os
+import re
 import stat
 from email.utils import mktime_tz, parsedate_tz
 
-from django.http import FileResponse, HttpResponseNotModified
-from django.utils.http import http_date
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified
+from django.utils.http import http_date, parse_http_date_safe
 
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
 
-def sendfile(request, filename, **kwargs):
+# The block size used when streaming part of a file
+RANGE_BLOCK_SIZE = 64 * 1024
+
+
+def sendfile(request, filename, mimetype=None, etag=None, **kwargs):
     # Respect the If-Modified-Since header.
     statobj = os.stat(filename)
 
@@ -19,12 +25,138 @@ def sendfile(request, filename, **kwargs):
     ):
         return HttpResponseNotModified()
 
-    response = FileResponse(open(filename, "rb"))
+    response = file_response(
+        request,
+        open(filename, "rb"),
+        statobj[stat.ST_SIZE],
+        content_type=mimetype,
+        etag=etag,
+        last_modified=statobj[stat.ST_MTIME],
+    )
 
     response["Last-Modified"] = http_date(statobj[stat.ST_MTIME])
     return response
 
 
+def file_response(
+    request, file, size, content_type=None, etag=None, last_modified=None
+):
+    """
+    Return a response streaming the open file ``file`` of ``size`` bytes.
+
+    If the request has a ``Range`` header for a single range of bytes, only that
+    part of the file is sent in a 206 Partial Content response. Requests for
+    multiple ranges are answered with the whole file. If the request also has an
+    ``If-Range`` header, the range is only sent if the header matches ``etag``
+    (which should already be quoted) or the ``last_modified`` timestamp; otherwise
+    the whole file is sent.
+
+    Whole files are sent with a ``FileResponse``, so they can be served with
+    ``wsgi.file_wrapper`` where the server provides it.
+    """
+    try:
+        byte_range = None
+        if if_range_matches(request, etag, last_modified):
+            byte_range = parse_range_header(request.headers.get("range"), size)
+    except ValueError:
+        file.close()
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        response["Content-Length"] = 0
+        return response
+
+    if byte_range is None:
+        response = FileResponse(file, content_type=content_type)
+    else:
+        start, end = byte_range
+        file.seek(start)
+        response = FileResponse(
+            FileRange(file, end - start + 1), content_type=content_type, status=206
+        )
+        response.block_size = RANGE_BLOCK_SIZE
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Length"] = end - start + 1
+
+    response["Accept-Ranges"] = "bytes"
+    return response
+
+
+def parse_range_header(header, size):
+    """
+    Parse a ``Range`` header for a file of ``size`` bytes.
+
+    Returns a ``(start, end)`` tuple of the first and last byte positions requested,
+    or ``None`` if the header is missing, invalid, or requests more than one range,
+    in which case it should be ignored. Raises ``ValueError`` if the range can't be
+    satisfied.
+    """
+    if not header:
+        return None
+
+    match = RANGE_RE.match(header.strip())
+    if match is None:
+        return None
+
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        if last and int(last) < start:
+            return None
+        if start >= size:
+            raise ValueError("Range start is beyond the end of the file")
+        end = int(last) if last else size - 1
+        return start, min(end, size - 1)
+    elif last:
+        # A suffix range, requesting the last bytes of the file
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError("Range is empty")
+        return max(size - length, 0), size - 1
+
+    return None
+
+
+def if_range_matches(request, etag=None, last_modified=None):
+    """
+    Return whether the ``If-Range`` header of the request, if any, matches the
+    given strong ``etag`` or ``last_modified`` timestamp, so a range can be sent.
+    """
+    if_range = request.headers.get("if-range")
+    if if_range is None:
+        return True
+
+    if if_range.startswith('"'):
+        return etag is not None and if_range == etag
+
+    if_range_date = parse_http_date_safe(if_range)
+    return (
+        if_range_date is not None
+        and last_modified is not None
+        and if_range_date == int(last_modified)
+    )
+
+
+class FileRange:
+    """
+    A file-like object that reads at most ``length`` bytes from the current position
+    of ``file``.
+    """
+
+    def __init__(self, file, length):
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
 def was_modified_since(header=None, mtime=0):
     """
     Was something modified since the user last downloaded it?